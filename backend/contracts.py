@@ -0,0 +1,104 @@
+"""
+📝 Job Hunter OS — Normalisation des types de contrat
+=====================================================
+contract_type garde ce que chaque parseur a trouvé :
+
+    - Safran   : le span repéré par mot-clé ("Stage conventionné", "Cadre"…)
+    - Airbus   : "CDI / Autre" en dur (le listing Workday ne l'affiche pas)
+    - Engie    : première valeur du pied de carte ("Contrat de professionnalisation Temps plein")
+    - Indeed, LinkedIn : rien
+
+contract_kind() ramène ces textes à un petit entier (ContractKind), en
+s'aidant du titre quand le contrat est vide ou muet ("Stage - Data Analyst",
+"Alternant(e) maintenance"). La valeur alimente la colonne indexée
+contract_kind : le filtre de contrat de GET /api/jobs est une égalité.
+"""
+
+import re
+import unicodedata
+from enum import IntEnum
+
+
+class ContractKind(IntEnum):
+    UNKNOWN = 0
+    CDI = 1
+    CDD = 2
+    STAGE = 3
+    ALTERNANCE = 4
+    VIE = 5
+    INTERIM = 6
+
+    @property
+    def label(self) -> str:
+        return LABELS[self]
+
+
+LABELS = {
+    ContractKind.UNKNOWN: "Non précisé",
+    ContractKind.CDI: "CDI",
+    ContractKind.CDD: "CDD",
+    ContractKind.STAGE: "Stage",
+    ContractKind.ALTERNANCE: "Alternance",
+    ContractKind.VIE: "VIE",
+    ContractKind.INTERIM: "Intérim",
+}
+
+# Du plus spécifique au plus général : "CDD d'alternance" est une alternance,
+# "Stage / CDI" un stage
+_CONTRACT_PATTERNS = [
+    (ContractKind.ALTERNANCE, re.compile(
+        r"alternan|apprenti|professionnalisation|work[- ]study|apprenticeship|dual study")),
+    (ContractKind.STAGE, re.compile(r"\bstag(?:e|es|iaire)\b|internship|\bintern\b|\bpfe\b")),
+    (ContractKind.VIE, re.compile(r"\bv\.?\s?i\.?\s?e\b|volontariat international")),
+    (ContractKind.INTERIM, re.compile(r"interim|travail temporaire|\btemporary\b|\btemp\b")),
+    (ContractKind.CDD, re.compile(r"\bcdd\b|duree determinee|fixed[- ]term")),
+    (ContractKind.CDI, re.compile(r"\bcdi\b|duree indeterminee|\bpermanent\b")),
+]
+
+# Dans un titre, "stage" seul est ambigu ("compressor stage") : on exige une forme explicite
+_TITLE_PATTERNS = [
+    (ContractKind.ALTERNANCE, re.compile(r"alternan|apprenti|apprenticeship|\bcontrat pro\b|professionnalisation")),
+    (ContractKind.STAGE, re.compile(
+        r"^\s*stage\b|\bstagiaire\b|internship|\bintern\b|\(stage\)|\bstage\s*(?:[-–:]|de fin|pfe|\d)")),
+    (ContractKind.VIE, re.compile(r"\bv\.i\.e\b|\bvie\s*[-–:]|^\s*vie\b|\(vie\)|volontariat international")),
+    (ContractKind.INTERIM, re.compile(r"\binterim\b|\binterimaire\b")),
+    (ContractKind.CDD, re.compile(r"\bcdd\b")),
+    (ContractKind.CDI, re.compile(r"\bcdi\b")),
+]
+
+
+def _fold(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text or "")
+    return "".join(c for c in text if not unicodedata.combining(c)).lower()
+
+
+def _match(patterns, text: str) -> ContractKind:
+    text = _fold(text)
+    for kind, pattern in patterns:
+        if pattern.search(text):
+            return kind
+    return ContractKind.UNKNOWN
+
+
+def contract_kind(contract: str | None, title: str | None = "") -> ContractKind:
+    """
+    Type de contrat normalisé, d'après le texte du contrat puis, à défaut,
+    les indices du titre.
+    """
+    kind = _match(_CONTRACT_PATTERNS, contract or "")
+    if kind is ContractKind.UNKNOWN:
+        kind = _match(_TITLE_PATTERNS, title or "")
+    return kind
+
+
+def parse_contract_filter(value: str) -> ContractKind | None:
+    """Valeur du filtre de l'API ("CDI", "stage", "4", "Intérim"…) → ContractKind, ou None si inconnue."""
+    value = (value or "").strip()
+    if value.isdigit():
+        return ContractKind(int(value)) if int(value) in ContractKind._value2member_map_ else None
+    folded = _fold(value).replace(".", "")
+    for kind in ContractKind:
+        if folded in (kind.name.lower(), _fold(kind.label)):
+            return kind
+    kind = contract_kind(value)
+    return kind if kind is not ContractKind.UNKNOWN else None
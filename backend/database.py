@@ -1,4 +1,6 @@
-from sqlalchemy import create_engine
+from dataclasses import dataclass, fields
+
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -8,9 +10,91 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 os.makedirs(DATA_DIR, exist_ok=True)
 
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{os.path.join(DATA_DIR, 'job_hunter.db')}"
+SQLALCHEMY_DATABASE_URL = os.getenv(
+    "JOB_HUNTER_DB_URL", f"sqlite:///{os.path.join(DATA_DIR, 'job_hunter.db')}"
+)
+
+
+# ─── Profil de connexion SQLite ───────────────────────────────────────────────
+
+@dataclass
+class SQLiteProfile:
+    """
+    PRAGMAs appliqués à chaque nouvelle connexion.
+
+    Le profil "production" (par défaut) passe en WAL : les lectures de l'API
+    ne bloquent plus les écritures du scraping (et inversement), et
+    synchronous=NORMAL n'attend plus un fsync à chaque commit. busy_timeout
+    fait patienter un écrivain concurrent au lieu de lever « database is locked ».
+
+    WAL repose sur une mémoire partagée entre processus d'une même machine :
+    des workers sur d'autres hôtes partageant le fichier par un système de
+    fichiers réseau (NFS, SMB) doivent tous utiliser le profil "shared"
+    (journal DELETE, sans mmap). Sinon, les workers tournent sur l'hôte de la base.
+    """
+    journal_mode: str | None = "WAL"
+    synchronous: str | None = "NORMAL"
+    mmap_size: int | None = 256 * 1024 * 1024   # 256 Mo lus via mmap
+    cache_size: int | None = -64000             # négatif = en Kio (≈ 64 Mo)
+    temp_store: str | None = "MEMORY"
+    busy_timeout: int | None = 5000             # ms
+
+    @classmethod
+    def from_env(cls) -> "SQLiteProfile":
+        """
+        JOB_HUNTER_SQLITE_PROFILE=production|shared|default, puis surcharge PRAGMA
+        par PRAGMA via JOB_HUNTER_SQLITE_<NOM> (ex. JOB_HUNTER_SQLITE_MMAP_SIZE=0).
+        """
+        name = os.getenv("JOB_HUNTER_SQLITE_PROFILE", "production")
+        if name == "production":
+            profile = cls()
+        elif name == "shared":
+            profile = cls.shared()
+        else:
+            profile = cls(**{f.name: None for f in fields(cls)})
+        for f in fields(cls):
+            value = os.getenv(f"JOB_HUNTER_SQLITE_{f.name.upper()}")
+            if value:
+                setattr(profile, f.name, int(value) if value.lstrip("-").isdigit() else value)
+        return profile
+
+    @classmethod
+    def shared(cls) -> "SQLiteProfile":
+        """Fichier partagé entre plusieurs hôtes : journal classique, ni mmap ni WAL."""
+        return cls(journal_mode="DELETE", synchronous="FULL", mmap_size=0)
+
+    def pragmas(self) -> dict:
+        return {f.name: getattr(self, f.name) for f in fields(self) if getattr(self, f.name) is not None}
+
+
+def apply_profile(engine, profile: SQLiteProfile, read_only: bool = False):
+    """Applique `profile` (et query_only pour le moteur de lecture) à chaque connexion."""
+    in_memory = engine.url.database in (None, "", ":memory:")
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_conn, _record):
+        cursor = dbapi_conn.cursor()
+        for name, value in profile.pragmas().items():
+            if name == "journal_mode" and in_memory:
+                continue
+            cursor.execute(f"PRAGMA {name}={value}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+
+PROFILE = SQLiteProfile.from_env()
+
+# Écrivain : les commits du scraping, de la file et du cache
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+apply_profile(engine, PROFILE)
+
+# Lecteur : les GET de l'API, sur leur propre pool et en lecture seule
+read_engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+apply_profile(read_engine, PROFILE, read_only=True)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 Base = declarative_base()
 
 def get_db():
@@ -19,3 +103,131 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    """Session en lecture seule (PRAGMA query_only) pour les endpoints de consultation."""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# ─── Vérification au démarrage ────────────────────────────────────────────────
+
+def check_sqlite_settings(bind=None) -> dict:
+    """Lit les PRAGMAs effectivement en vigueur sur une connexion de `bind`."""
+    bind = bind or engine
+    names = [f.name for f in fields(SQLiteProfile)] + ["query_only"]
+    with bind.connect() as conn:
+        return {name: conn.exec_driver_sql(f"PRAGMA {name}").scalar() for name in names}
+
+
+def report_sqlite_settings() -> dict:
+    """Affiche les réglages effectifs des deux moteurs et signale ceux qui diffèrent du profil."""
+    effective = {"writer": check_sqlite_settings(engine), "reader": check_sqlite_settings(read_engine)}
+    print(f"🗄️  SQLite {engine.url.database or ':memory:'}")
+    for role, settings in effective.items():
+        print(f"  {role:6s} " + ", ".join(f"{k}={v}" for k, v in settings.items()))
+
+    writer = effective["writer"]
+    if PROFILE.journal_mode and str(writer["journal_mode"]).upper() != PROFILE.journal_mode.upper():
+        print(f"  ⚠️  journal_mode={writer['journal_mode']} au lieu de {PROFILE.journal_mode}")
+    if effective["reader"]["query_only"] != 1:
+        print("  ⚠️  Le moteur de lecture n'est pas en query_only")
+    return effective
+
+
+def ensure_autoincrement(conn, table, reserved_max_id=None) -> bool:
+    """
+    Reconstruit `table` avec AUTOINCREMENT si elle a été créée sans : SQLite
+    ne sait pas l'ajouter par ALTER TABLE. Les lignes gardent leur id et le
+    compteur repart au-delà de `reserved_max_id` (ids encore référencés hors
+    de la table, ex. par l'archive).
+
+    Returns:
+        True si la table a été reconstruite
+    """
+    sql = conn.execute(text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                       {"name": table.name}).scalar()
+    if sql is None or "AUTOINCREMENT" in sql.upper():
+        return False
+
+    # Les noms d'index sont globaux : ceux de l'ancienne table doivent disparaître avant create()
+    indexes = conn.execute(text(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :name AND sql IS NOT NULL"
+    ), {"name": table.name}).scalars().all()
+    for index in indexes:
+        conn.execute(text(f'DROP INDEX "{index}"'))
+    legacy = f"{table.name}_legacy"
+    conn.execute(text(f'ALTER TABLE {table.name} RENAME TO {legacy}'))
+    table.create(conn)
+    columns = ", ".join(f'"{c.name}"' for c in table.columns)
+    conn.execute(text(f"INSERT INTO {table.name} ({columns}) SELECT {columns} FROM {legacy}"))
+    conn.execute(text(f"DROP TABLE {legacy}"))
+
+    top = max(conn.execute(text(f"SELECT MAX(id) FROM {table.name}")).scalar() or 0, reserved_max_id or 0)
+    conn.execute(text("DELETE FROM sqlite_sequence WHERE name = :name"), {"name": table.name})
+    if top:
+        conn.execute(text("INSERT INTO sqlite_sequence (name, seq) VALUES (:name, :seq)"),
+                     {"name": table.name, "seq": top})
+    return True
+
+
+def init_db():
+    """
+    Crée les tables manquantes puis ajoute les colonnes manquantes aux tables
+    existantes (SQLite ne sait pas le faire via create_all).
+    """
+    # Importer les modèles pour les enregistrer dans Base.metadata
+    import backend.models  # noqa: F401
+
+    Base.metadata.create_all(bind=engine)
+
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                col_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {col_type}'))
+                if column.index or column.unique:
+                    unique = "UNIQUE " if column.unique else ""
+                    conn.execute(text(
+                        f'CREATE {unique}INDEX IF NOT EXISTS ix_{table.name}_{column.name} '
+                        f'ON {table.name} ("{column.name}")'
+                    ))
+            # Index composites déclarés après la création de la table
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+
+        # Bases créées avant AUTOINCREMENT : SQLite réattribuait les id des offres archivées
+        offers = Base.metadata.tables["job_offers"]
+        archived_max = conn.execute(text("SELECT MAX(id) FROM job_offers_archive")).scalar()
+        if ensure_autoincrement(conn, offers, reserved_max_id=archived_max):
+            print("🔢 job_offers reconstruite avec AUTOINCREMENT (id jamais réattribués)")
+
+    # Migrations de données : colonnes calculées à remplir pour les lignes existantes.
+    # Seules celles qui marquent chaque ligne traitée tournent ici ; celles qui
+    # relisent à chaque passage les lignes non résolues (lieux inconnus du
+    # gazetteer, dates illisibles) passent par python -m backend.migrate.
+    from backend.dedup import index_missing
+    from backend.persistence import backfill_contract_kinds, backfill_url_hashes
+    from backend.workflow import backfill_statuses
+    db = SessionLocal()
+    try:
+        migrated = backfill_url_hashes(db)
+        if migrated:
+            print(f"🔗 {migrated} URLs canonicalisées (url_hash)")
+        classified = backfill_contract_kinds(db)
+        if classified:
+            print(f"📝 {classified} types de contrat normalisés (contract_kind)")
+        backfill_statuses(db)
+        indexed, linked = index_missing(db)
+        if indexed:
+            print(f"👯 {indexed} offres indexées pour les quasi-doublons ({linked} rattachées)")
+    finally:
+        db.close()
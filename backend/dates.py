@@ -0,0 +1,126 @@
+"""
+📅 Job Hunter OS — Normalisation des dates de publication
+=========================================================
+Chaque source écrit published_date à sa façon :
+
+    - EDF        : "28 Février 2026"
+    - Engie      : "12/02/2026"  (regex "Publié le …")
+    - Safran     : "05.02.2026"
+    - LinkedIn   : "2026-02-27"  (attribut datetime)
+    - Workday    : "Offre publiée il y a 3 jours", "hier", "Posted 30+ Days Ago"
+
+parse_published_date() ramène tout cela à un datetime, en ancrant les dates
+relatives sur le moment du scraping (date_scraping, ou created_at pour les
+lignes déjà en base). Le résultat alimente la colonne indexée published_at.
+"""
+
+import datetime
+import re
+import unicodedata
+
+MONTHS = {
+    "janvier": 1, "janv": 1, "jan": 1, "january": 1,
+    "fevrier": 2, "fevr": 2, "fev": 2, "february": 2, "feb": 2,
+    "mars": 3, "march": 3, "mar": 3,
+    "avril": 4, "avr": 4, "april": 4, "apr": 4,
+    "mai": 5, "may": 5,
+    "juin": 6, "june": 6, "jun": 6,
+    "juillet": 7, "juil": 7, "july": 7, "jul": 7,
+    "aout": 8, "august": 8, "aug": 8,
+    "septembre": 9, "sept": 9, "sep": 9, "september": 9,
+    "octobre": 10, "oct": 10, "october": 10,
+    "novembre": 11, "nov": 11, "november": 11,
+    "decembre": 12, "dec": 12, "december": 12,
+}
+
+UNITS = {
+    "minute": datetime.timedelta(minutes=1), "min": datetime.timedelta(minutes=1),
+    "heure": datetime.timedelta(hours=1), "hour": datetime.timedelta(hours=1), "h": datetime.timedelta(hours=1),
+    "jour": datetime.timedelta(days=1), "day": datetime.timedelta(days=1), "j": datetime.timedelta(days=1),
+    "semaine": datetime.timedelta(weeks=1), "week": datetime.timedelta(weeks=1),
+    "mois": datetime.timedelta(days=30), "month": datetime.timedelta(days=30),
+    "an": datetime.timedelta(days=365), "annee": datetime.timedelta(days=365), "year": datetime.timedelta(days=365),
+}
+
+_ISO = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})(?:[t ](\d{2}):(\d{2})(?::(\d{2}))?)?")
+_NUMERIC = re.compile(r"\b(\d{1,2})[/.\-](\d{1,2})[/.\-](\d{4}|\d{2})\b")
+_DAY_MONTH_YEAR = re.compile(r"\b(\d{1,2})(?:er)?\s+([a-z]+)\.?,?\s+(\d{4})\b")
+_MONTH_DAY_YEAR = re.compile(r"\b([a-z]+)\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})\b")
+_RELATIVE = re.compile(
+    r"(\d+)\s*\+?\s*(minutes?|mins?|heures?|hours?|h|jours?|days?|j|semaines?|weeks?|mois|months?|ans?|annees?|years?)\b"
+)
+_TODAY = re.compile(r"aujourd'hui|today|just posted|a l'instant|just now")
+_YESTERDAY = re.compile(r"\bhier\b|yesterday")
+
+
+def _fold(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text or "")
+    return "".join(c for c in text if not unicodedata.combining(c)).lower().replace("’", "'")
+
+
+def _date(year: int, month: int, day: int) -> datetime.datetime | None:
+    if year < 100:
+        year += 2000
+    try:
+        return datetime.datetime(year, month, day)
+    except ValueError:
+        return None
+
+
+def parse_anchor(value) -> datetime.datetime:
+    """date_scraping (ISO), datetime ou None → datetime d'ancrage."""
+    if isinstance(value, datetime.datetime):
+        return value
+    if value:
+        try:
+            return datetime.datetime.fromisoformat(str(value))
+        except ValueError:
+            pass
+    return datetime.datetime.utcnow()
+
+
+def parse_published_date(text: str, anchor=None) -> datetime.datetime | None:
+    """
+    Convertit une date de publication libre (français ou anglais, absolue ou
+    relative) en datetime. Les dates relatives sont calculées depuis `anchor`.
+
+    Returns:
+        Le datetime (minuit pour une date au jour près), ou None si illisible
+    """
+    text = _fold(text).strip()
+    if not text:
+        return None
+    anchor = parse_anchor(anchor)
+    midnight = anchor.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    # ── Dates absolues ──
+    if m := _ISO.search(text):
+        year, month, day = int(m[1]), int(m[2]), int(m[3])
+        parsed = _date(year, month, day)
+        if parsed and m[4]:
+            parsed = parsed.replace(hour=int(m[4]), minute=int(m[5]), second=int(m[6] or 0))
+        return parsed
+    if m := _NUMERIC.search(text):
+        day, month, year = int(m[1]), int(m[2]), int(m[3])
+        if month > 12 >= day:   # Format américain MM/DD/YYYY
+            day, month = month, day
+        return _date(year, month, day)
+    if (m := _DAY_MONTH_YEAR.search(text)) and m[2] in MONTHS:
+        return _date(int(m[3]), MONTHS[m[2]], int(m[1]))
+    if (m := _MONTH_DAY_YEAR.search(text)) and m[1] in MONTHS:
+        return _date(int(m[3]), MONTHS[m[1]], int(m[2]))
+
+    # ── Dates relatives ──
+    if _TODAY.search(text):
+        return midnight
+    if _YESTERDAY.search(text):
+        return midnight - datetime.timedelta(days=1)
+    if m := _RELATIVE.search(text):
+        amount, unit = int(m[1]), m[2]
+        step = UNITS.get(unit) or UNITS.get(unit.rstrip("s"))
+        if step is None:
+            return None
+        if step >= datetime.timedelta(days=1):
+            return midnight - amount * step
+        return anchor - amount * step
+    return None
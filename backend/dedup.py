@@ -0,0 +1,285 @@
+"""
+👯 Job Hunter OS — Détection des quasi-doublons entre sources
+=============================================================
+La même offre apparaît sur LinkedIn, Indeed et le site de l'entreprise,
+sous des URLs différentes et des titres légèrement différents
+("Data Engineer H/F" / "DATA ENGINEER (F/H)"). url_hash ne peut pas les
+rapprocher : on compare donc le contenu.
+
+    1. Empreinte : titre, entreprise et ville normalisés, découpés en
+       4-grammes de caractères
+    2. MinHash   : signature de NUM_PERM minima, dont la proportion de
+       valeurs communes estime la similarité de Jaccard des empreintes
+    3. LSH       : la signature est coupée en BANDS bandes de ROWS valeurs ;
+       deux offres qui partagent une bande tombent dans le même bucket.
+       Seuls ces candidats sont comparés, pas toute la table.
+
+Les signatures (offer_signatures) et les buckets (offer_lsh_bands) sont
+stockés à côté de job_offers. Chaque nouvelle offre rejoint le cluster
+(duplicate_cluster_id) de son plus proche candidat de la même entreprise
+au-dessus de SIMILARITY_THRESHOLD, ou fonde le sien.
+
+Usage:
+    python -m backend.dedup              # indexer les offres sans signature
+    python -m backend.dedup --rebuild    # tout recalculer
+"""
+
+import argparse
+import functools
+import hashlib
+import random
+import re
+import unicodedata
+import zlib
+from array import array
+
+from sqlalchemy import bindparam, delete, func, or_, select, union_all, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from backend.models import JobOffer, OfferLshBand, OfferSignature
+
+NUM_PERM = 64
+BANDS, ROWS = 16, 4          # Seuil LSH ≈ (1/16)^(1/4) ≈ 0,5
+SIMILARITY_THRESHOLD = 0.8   # Jaccard estimé minimal pour lier deux offres
+SHINGLE_SIZE = 4
+MAX_CANDIDATES = 20          # Signatures comparées au plus par nouvelle offre
+BUCKET_SCAN = 50             # Offres lues au plus par bucket
+CHUNK = 500                  # Taille des IN (...) (limite de paramètres SQLite)
+
+_MERSENNE = (1 << 61) - 1
+_rng = random.Random(20260301)  # Permutations fixes : les signatures stockées restent comparables
+PERMUTATIONS = [(_rng.randrange(1, _MERSENNE), _rng.randrange(0, _MERSENNE)) for _ in range(NUM_PERM)]
+
+
+# ─── Normalisation ────────────────────────────────────────────────────────────
+
+# (H/F), F-H, (m/f/d), H/F/X… en fin ou en milieu de titre
+_GENDER = re.compile(r"\(?\b[hfmdwx]\s*[/\-]\s*[hfmdwx](?:\s*[/\-]\s*[hfmdwx])?\b\)?")
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+# Mots qui n'identifient pas l'employeur : articles, "Groupe", formes juridiques
+_COMPANY_NOISE = {
+    "groupe", "group", "the", "le", "la", "les",
+    "sa", "sas", "sasu", "sarl", "se", "sca", "snc", "gie",
+    "gmbh", "ag", "inc", "ltd", "llc", "plc", "corp", "nv", "bv", "spa",
+}
+
+
+def _fold(text: str) -> str:
+    """Minuscules, sans accents."""
+    text = unicodedata.normalize("NFKD", text or "")
+    return "".join(c for c in text if not unicodedata.combining(c)).lower()
+
+
+def normalize_title(title: str) -> str:
+    title = _GENDER.sub(" ", _fold(title))
+    return " ".join(_NON_WORD.sub(" ", title).split())
+
+
+def normalize_company(company: str) -> str:
+    """Nom complet sans "Groupe" ni forme juridique : "Groupe EDF SA" → "edf"."""
+    company = re.sub(r"\(.*?\)", " ", _fold(company))
+    return " ".join(w for w in _NON_WORD.sub(" ", company).split() if w not in _COMPANY_NOISE)
+
+
+def normalize_city(location: str) -> str:
+    """Ville seule : "Paris, Île-de-France, France", "Paris (75)", "75008 PARIS" → "paris"."""
+    city = re.split(r"[,(]", _fold(location))[0]
+    city = re.sub(r"\d+|\barea\b", " ", city)
+    return " ".join(_NON_WORD.sub(" ", city).split())
+
+
+def shingles(title: str, company: str, location: str) -> set[str]:
+    text = f"{normalize_title(title)} | {normalize_company(company)} | {normalize_city(location)}"
+    if len(text) <= SHINGLE_SIZE:
+        return {text}
+    return {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+# ─── MinHash / LSH ────────────────────────────────────────────────────────────
+
+def minhash(tokens: set[str]) -> array:
+    hashed = [zlib.crc32(t.encode("utf-8")) for t in tokens]
+    return array("I", (
+        min(((a * x + b) % _MERSENNE) & 0xFFFFFFFF for x in hashed)
+        for a, b in PERMUTATIONS
+    ))
+
+
+def signature_for(title: str, company: str, location: str) -> array:
+    return minhash(shingles(title, company, location))
+
+
+def similarity(sig_a: array, sig_b: array) -> float:
+    """Jaccard estimé : proportion de minima identiques."""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERM
+
+
+def band_buckets(signature: array) -> list[tuple[int, int]]:
+    """(bande, bucket signé 64 bits) pour chacune des BANDS bandes."""
+    buckets = []
+    for band in range(BANDS):
+        chunk = signature[band * ROWS:(band + 1) * ROWS].tobytes()
+        digest = hashlib.blake2b(chunk, digest_size=8, person=band.to_bytes(2, "big")).digest()
+        buckets.append((band, int.from_bytes(digest, "big", signed=True)))
+    return buckets
+
+
+def _unpack(blob: bytes) -> array:
+    sig = array("I")
+    sig.frombytes(blob)
+    return sig
+
+
+# ─── Rattachement aux clusters ────────────────────────────────────────────────
+
+@functools.cache
+def _statements() -> dict:
+    """Requêtes de assign_cluster, construites une seule fois (bindparams)."""
+    bands = OfferLshBand.__table__
+    signatures = OfferSignature.__table__
+    offers = JobOffer.__table__
+
+    # Candidats : les offres partageant le plus de bandes (bornées à MAX_CANDIDATES).
+    # Chaque bucket n'est lu que sur ses BUCKET_SCAN offres les plus récentes :
+    # un bucket très peuplé (titres génériques) ne rend pas l'ingestion quadratique.
+    # Les buckets sont salés par numéro de bande : la valeur seule suffit.
+    postings = []
+    for band in range(BANDS):
+        recent = (
+            select(bands.c.offer_id)
+            .where(bands.c.bucket == bindparam(f"b{band}"), bands.c.offer_id != bindparam("offer_id"))
+            .order_by(bands.c.offer_id.desc())
+            .limit(BUCKET_SCAN)
+            .subquery()
+        )
+        postings.append(select(recent.c.offer_id))
+    hits = union_all(*postings).subquery()
+    shared = (
+        select(hits.c.offer_id)
+        .group_by(hits.c.offer_id)
+        .order_by(func.count().desc(), hits.c.offer_id.desc())
+        .limit(MAX_CANDIDATES)
+        .subquery()
+    )
+    upsert_signature = sqlite_insert(signatures)
+    return {
+        "candidates": (
+            select(signatures.c.offer_id, signatures.c.signature,
+                   offers.c.duplicate_cluster_id, offers.c.company)
+            .join(shared, shared.c.offer_id == signatures.c.offer_id)
+            .join(offers, offers.c.id == signatures.c.offer_id)
+        ),
+        "signature": upsert_signature.on_conflict_do_update(
+            index_elements=[signatures.c.offer_id],
+            set_={"signature": upsert_signature.excluded.signature},
+        ),
+        "forget_bands": delete(bands).where(bands.c.offer_id == bindparam("offer_id")),
+        "bands": bands.insert(),
+        "cluster": (
+            update(offers).where(offers.c.id == bindparam("offer_id"))
+            .values(duplicate_cluster_id=bindparam("cluster_id"))
+        ),
+    }
+
+
+def assign_cluster(db: Session, offer_id: int, title: str, company: str, location: str) -> int:
+    """
+    Indexe une offre et la rattache au cluster de son plus proche quasi-doublon.
+    Ne commit pas.
+
+    Returns:
+        L'identifiant de cluster retenu
+    """
+    statements = _statements()
+    signature = signature_for(title, company, location)
+    buckets = band_buckets(signature)
+    conn = db.connection()
+
+    candidates = conn.execute(
+        statements["candidates"],
+        {"offer_id": offer_id, **{f"b{band}": bucket for band, bucket in buckets}},
+    ).all()
+
+    company_key = normalize_company(company)
+    cluster_id, best = offer_id, SIMILARITY_THRESHOLD
+    for other_id, blob, other_cluster, other_company in candidates:
+        # Même titre chez deux employeurs différents : pas la même offre
+        other_key = normalize_company(other_company)
+        if company_key and other_key and company_key != other_key:
+            continue
+        score = similarity(signature, _unpack(blob))
+        if score >= best:
+            cluster_id, best = other_cluster or other_id, score
+
+    conn.execute(statements["signature"], {"offer_id": offer_id, "signature": signature.tobytes()})
+    conn.execute(statements["forget_bands"], {"offer_id": offer_id})
+    conn.execute(statements["bands"], [
+        {"band": band, "bucket": bucket, "offer_id": offer_id} for band, bucket in buckets
+    ])
+    conn.execute(statements["cluster"], {"offer_id": offer_id, "cluster_id": cluster_id})
+    return cluster_id
+
+
+def assign_clusters(db: Session, offer_ids: list[int]) -> int:
+    """Indexe une liste d'offres déjà en base, dans l'ordre. Retourne le nombre de rattachements."""
+    linked = 0
+    for i in range(0, len(offer_ids), CHUNK):
+        for offer_id, title, company, location in db.execute(
+            select(JobOffer.id, JobOffer.title, JobOffer.company, JobOffer.location)
+            .where(JobOffer.id.in_(offer_ids[i:i + CHUNK])).order_by(JobOffer.id)
+        ).all():
+            if assign_cluster(db, offer_id, title, company, location) != offer_id:
+                linked += 1
+    return linked
+
+
+def forget_offers(db: Session, offer_ids: list[int]):
+    """Retire des offres de l'index (archivage). Ne commit pas."""
+    db.execute(delete(OfferLshBand).where(OfferLshBand.offer_id.in_(offer_ids)))
+    db.execute(delete(OfferSignature).where(OfferSignature.offer_id.in_(offer_ids)))
+
+
+def index_missing(db: Session, rebuild: bool = False) -> tuple[int, int]:
+    """
+    Indexe les offres sans signature (toutes si `rebuild`) et commit.
+
+    Returns:
+        (offres indexées, offres rattachées à un cluster existant)
+    """
+    if rebuild:
+        db.execute(delete(OfferLshBand))
+        db.execute(delete(OfferSignature))
+        db.execute(update(JobOffer).values(duplicate_cluster_id=None)
+                   .execution_options(synchronize_session=False))
+    ids = db.scalars(
+        select(JobOffer.id)
+        .where(or_(JobOffer.duplicate_cluster_id.is_(None),
+                   ~JobOffer.id.in_(select(OfferSignature.offer_id))))
+        .order_by(JobOffer.id)
+    ).all()
+    linked = assign_clusters(db, ids) if ids else 0
+    db.commit()
+    return len(ids), linked
+
+
+# ─── Point d'entrée ──────────────────────────────────────────────────────────
+
+def main():
+    from backend.database import SessionLocal, init_db
+
+    parser = argparse.ArgumentParser(description="👯 Index des quasi-doublons")
+    parser.add_argument("--rebuild", action="store_true", help="Recalculer toutes les signatures")
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        indexed, linked = index_missing(db, rebuild=args.rebuild)
+        print(f"👯 {indexed} offres indexées, {linked} rattachées à un cluster existant")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""
+📊 Job Hunter OS — Export Parquet pour l'analyse
+================================================
+Instantanés colonnaires de la base et des lancements de scraping, lisibles
+par pandas, DuckDB, Polars… sans passer par l'API ni par les CSV/JSON de
+data/results/ qu'on ne peut pas interroger d'un lancement à l'autre.
+
+Arborescence (partitions "hive", une par source et par jour) :
+
+    data/exports/
+        offers/source=edf-recrute/date=2026-03-02/part-0.parquet     ← job_offers
+        archive/source=safran/date=2026-03-02/part-0.parquet         ← job_offers_archive
+        runs/source=edf/date=2026-03-02/run-20260302T101500.parquet  ← résultats d'un lancement
+
+L'écriture part d'un curseur (yield_per) par lots de `batch_size` lignes,
+triées par source : un seul fichier ouvert à la fois et la mémoire bornée
+à un lot. Les colonnes répétitives (entreprise, lieu, contrat, statut…)
+sont encodées en dictionnaire, le tout compressé en zstd. Un instantané du
+jour remplace celui du matin ; les jours précédents restent.
+
+Un lancement s'écrit pendant le scraping (RunExporter) : un fichier ouvert
+par source, les offres de plusieurs entreprises pouvant arriver entrelacées.
+
+pyarrow est optionnel (pip install pyarrow) : il n'est importé qu'à l'export.
+
+Usage:
+    python -m backend.export                            # instantané de job_offers
+    python -m backend.export --archive                  # + job_offers_archive
+    python -m backend.export --read offers --columns source,contract_kind
+"""
+
+import argparse
+import datetime
+import os
+from urllib.parse import quote
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.database import DATA_DIR
+from backend.models import JobOffer, JobOfferArchive
+
+EXPORT_DIR = os.getenv("JOB_HUNTER_EXPORT_DIR", os.path.join(DATA_DIR, "exports"))
+BATCH_SIZE = 5000
+
+# Colonnes de job_offers exportées (source et date sont les clés de partition)
+OFFER_COLUMNS = (
+    "id", "title", "company", "location", "latitude", "longitude", "url", "url_hash",
+    "contract_type", "contract_kind", "published_date", "published_at", "status",
+    "original_search", "created_at", "last_seen_at", "duplicate_cluster_id",
+)
+# Colonnes d'un lancement (champs du JobOffer des scrapers + mot-clé)
+RUN_COLUMNS = (
+    "keyword", "titre", "entreprise", "lieu", "url", "contrat", "date_publication",
+    "description_courte", "date_scraping",
+)
+# Faible cardinalité : encodage dictionnaire
+DICTIONARY_COLUMNS = [
+    "company", "location", "contract_type", "status", "original_search",
+    "keyword", "entreprise", "lieu", "contrat", "date_publication", "date_scraping",
+]
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as e:
+        raise RuntimeError("L'export Parquet nécessite pyarrow : pip install pyarrow") from e
+    return pyarrow
+
+
+def offer_schema(pa):
+    return pa.schema([
+        ("id", pa.int64()), ("title", pa.string()), ("company", pa.string()),
+        ("location", pa.string()), ("latitude", pa.float64()), ("longitude", pa.float64()),
+        ("url", pa.string()), ("url_hash", pa.int64()), ("contract_type", pa.string()),
+        ("contract_kind", pa.int8()), ("published_date", pa.string()),
+        ("published_at", pa.timestamp("us")), ("status", pa.string()),
+        ("original_search", pa.string()), ("created_at", pa.timestamp("us")),
+        ("last_seen_at", pa.timestamp("us")), ("duplicate_cluster_id", pa.int64()),
+    ])
+
+
+def run_schema(pa):
+    return pa.schema([(name, pa.string()) for name in RUN_COLUMNS])
+
+
+def partition_path(root: str, source: str, day: datetime.date) -> str:
+    """Dossier hive d'une partition (valeurs encodées comme le fait pyarrow)."""
+    return os.path.join(root, f"source={quote(source or 'inconnue', safe='')}", f"date={day.isoformat()}")
+
+
+class _PartitionWriter:
+    """Un ParquetWriter à la fois : on passe au fichier suivant quand la source change."""
+
+    def __init__(self, pa, root: str, schema, day: datetime.date, filename: str):
+        self.pa, self.root, self.schema, self.day, self.filename = pa, root, schema, day, filename
+        self.source = None
+        self.writer = None
+        self.files: list[str] = []
+        self.rows = 0
+
+    def write(self, source: str, columns: dict[str, list]):
+        if self.writer is None or source != self.source:
+            self.close()
+            directory = partition_path(self.root, source, self.day)
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, self.filename)
+            dictionary = [c for c in DICTIONARY_COLUMNS if c in self.schema.names]
+            self.writer = self.pa.parquet.ParquetWriter(
+                path, self.schema, compression="zstd", use_dictionary=dictionary)
+            self.source = source
+            self.files.append(path)
+        batch = self.pa.record_batch(
+            [self.pa.array(columns[name], type=field.type) for name, field in zip(self.schema.names, self.schema)],
+            schema=self.schema,
+        )
+        self.writer.write_batch(batch)
+        self.rows += batch.num_rows
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+# ─── Instantané de la base ────────────────────────────────────────────────────
+
+def export_table(db: Session, model=JobOffer, out_dir: str | None = None, day: datetime.date | None = None,
+                 batch_size: int = BATCH_SIZE) -> list[str]:
+    """
+    Écrit `model` (JobOffer ou JobOfferArchive) en Parquet partitionné par
+    source, sous `out_dir` (data/exports/offers ou archive par défaut).
+
+    Returns:
+        Les fichiers écrits
+    """
+    pa = _pyarrow()
+    if out_dir is None:
+        out_dir = os.path.join(EXPORT_DIR, "archive" if model is JobOfferArchive else "offers")
+    day = day or datetime.date.today()
+    schema = offer_schema(pa)
+    writer = _PartitionWriter(pa, out_dir, schema, day, "part-0.parquet")
+
+    columns = [getattr(model, name) for name in OFFER_COLUMNS]
+    query = (
+        select(model.source, *columns)
+        .order_by(model.source, model.id)
+        .execution_options(yield_per=batch_size)
+    )
+    try:
+        for partition in db.execute(query).partitions():
+            # Une partition du curseur peut chevaucher deux sources
+            start = 0
+            for i in range(1, len(partition) + 1):
+                if i == len(partition) or partition[i][0] != partition[start][0]:
+                    rows = partition[start:i]
+                    writer.write(rows[0][0], {name: [r[j + 1] for r in rows]
+                                              for j, name in enumerate(OFFER_COLUMNS)})
+                    start = i
+    finally:
+        writer.close()
+    print(f"📊 {writer.rows} offres → {out_dir} ({len(writer.files)} partitions)")
+    return writer.files
+
+
+# ─── Résultats d'un lancement ─────────────────────────────────────────────────
+
+class RunExporter:
+    """
+    Écrit les résultats d'un lancement au fil de l'eau, une partition par
+    source. Chaque source garde son fichier ouvert et ses `batch_size`
+    dernières offres en mémoire, quel que soit l'ordre d'arrivée.
+
+    Usage:
+        with RunExporter() as exporter:
+            for key, kw, offer in scrape_companies(...):
+                exporter.write(key, kw, offer)
+        exporter.files   # {source: fichier écrit}
+    """
+
+    def __init__(self, out_dir: str | None = None, run_at: datetime.datetime | None = None,
+                 batch_size: int = BATCH_SIZE):
+        self.pa = _pyarrow()   # pyarrow manquant : erreur avant le scraping, pas après
+        self.out_dir = out_dir or os.path.join(EXPORT_DIR, "runs")
+        self.run_at = run_at or datetime.datetime.now()
+        self.batch_size = batch_size
+        self.files: dict[str, str] = {}
+        self._writers: dict[str, _PartitionWriter] = {}
+        self._pending: dict[str, list[tuple]] = {}
+
+    def write(self, source: str, keyword: str, o):
+        pending = self._pending.setdefault(source, [])
+        pending.append((keyword, o.titre, o.entreprise, o.lieu, o.url, o.contrat,
+                        o.date_publication, o.description_courte, o.date_scraping))
+        if len(pending) >= self.batch_size:
+            self._flush(source)
+
+    def _flush(self, source: str):
+        pending = self._pending.pop(source, None)
+        if not pending:
+            return
+        writer = self._writers.get(source)
+        if writer is None:
+            writer = self._writers[source] = _PartitionWriter(
+                self.pa, self.out_dir, run_schema(self.pa), self.run_at.date(),
+                f"run-{self.run_at.strftime('%Y%m%dT%H%M%S')}.parquet")
+        writer.write(source, {name: [row[j] for row in pending] for j, name in enumerate(RUN_COLUMNS)})
+
+    def close(self) -> dict[str, str]:
+        for source in list(self._pending):
+            self._flush(source)
+        for source, writer in self._writers.items():
+            writer.close()
+            if source not in self.files:
+                self.files[source] = writer.files[0]
+                print(f"📊 {writer.rows} offres → '{writer.files[0]}'")
+        return self.files
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def export_run(offers, source: str, out_dir: str | None = None, run_at: datetime.datetime | None = None,
+               batch_size: int = BATCH_SIZE) -> str | None:
+    """
+    Écrit les résultats d'un lancement de scraping : `offers` est un itérable
+    de couples (mot-clé, JobOffer), par exemple scraper.iter_offers(...),
+    consommé par lots de `batch_size`.
+
+    Returns:
+        Le fichier écrit, ou None si aucune offre
+    """
+    with RunExporter(out_dir, run_at, batch_size) as exporter:
+        for keyword, o in offers:
+            exporter.write(source, keyword, o)
+    return exporter.files.get(source)
+
+
+# ─── Lecture ──────────────────────────────────────────────────────────────────
+
+def open_dataset(path: str):
+    """Jeu de données pyarrow sur un export (clés source et date lues depuis les dossiers)."""
+    pa = _pyarrow()
+    import pyarrow.dataset as ds
+
+    partitioning = ds.partitioning(pa.schema([("source", pa.string()), ("date", pa.string())]), flavor="hive")
+    return ds.dataset(path, format="parquet", partitioning=partitioning)
+
+
+def read_export(path: str, columns: list[str] | None = None, **equals):
+    """
+    Lit un export en ne décodant que `columns`. Les filtres d'égalité
+    (source="edf-recrute", date="2026-03-02") élaguent les partitions
+    avant toute lecture.
+
+    Returns:
+        pyarrow.Table
+    """
+    import pyarrow.dataset as ds
+
+    dataset = open_dataset(path)
+    condition = None
+    for name, value in equals.items():
+        term = ds.field(name) == value
+        condition = term if condition is None else condition & term
+    return dataset.to_table(columns=columns, filter=condition)
+
+
+# ─── Point d'entrée ──────────────────────────────────────────────────────────
+
+def main():
+    from backend.database import SessionLocal, init_db
+
+    parser = argparse.ArgumentParser(description="📊 Export Parquet des offres")
+    parser.add_argument("--out", default=EXPORT_DIR, help=f"Dossier des exports (défaut: {EXPORT_DIR})")
+    parser.add_argument("--archive", action="store_true", help="Exporter aussi job_offers_archive")
+    parser.add_argument("--read", choices=("offers", "archive", "runs"), default=None,
+                        help="Lire un export au lieu d'écrire")
+    parser.add_argument("--columns", default=None, help="Colonnes lues, séparées par des virgules")
+    parser.add_argument("--source", default=None, help="Filtrer sur une source (avec --read)")
+    args = parser.parse_args()
+
+    if args.read:
+        columns = [c.strip() for c in args.columns.split(",")] if args.columns else None
+        filters = {"source": args.source} if args.source else {}
+        table = read_export(os.path.join(args.out, args.read), columns, **filters)
+        print(f"📊 {table.num_rows} lignes, colonnes : {', '.join(table.column_names)}")
+        print(table.slice(0, 10))
+        return
+
+    init_db()
+    db = SessionLocal()
+    try:
+        export_table(db, JobOffer, os.path.join(args.out, "offers"))
+        if args.archive:
+            export_table(db, JobOfferArchive, os.path.join(args.out, "archive"))
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
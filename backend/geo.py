@@ -0,0 +1,329 @@
+"""
+📍 Job Hunter OS — Géocodage hors ligne et recherche par rayon
+=============================================================
+location est un texte libre, différent à chaque source :
+
+    "Etrez, France", "69006 LYON", "Rennes (35)", "Toulouse Area",
+    "Télétravail partiel à 92200 Neuilly-sur-Seine", "Multi-sites"
+
+Le gazetteer embarqué (data/gazetteer/) associe communes et départements
+français à leurs coordonnées, sans appel réseau. Chaque offre est géocodée
+à l'ingestion (latitude, longitude) et indexée dans la table R-tree
+offer_geo : "à moins de 50 km de Lyon" devient une requête sur une boîte
+englobante servie par l'index, affinée ensuite par la distance haversine.
+
+Fichiers du gazetteer (CSV UTF-8, même format pour un export INSEE/IGN complet) :
+    - communes.csv      : name, departement, lat, lon, population, aliases ("a|b")
+    - departements.csv  : code, name, lat, lon (coordonnées de la préfecture)
+
+Ordre de résolution : commune (nom ou alias, le plus long d'abord, départage
+par le département indiqué puis la population), puis département (nom,
+"(35)", code postal). Les lieux à l'étranger ou non localisables → None.
+
+Usage:
+    python -m backend.geo "69006 LYON"     # tester la résolution d'un lieu
+    python -m backend.geo --reindex        # regéocoder toutes les offres
+"""
+
+import argparse
+import csv
+import functools
+import math
+import os
+import re
+import unicodedata
+from dataclasses import dataclass, field
+
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.orm import Session
+
+from backend.database import DATA_DIR
+from backend.models import OFFER_GEO, JobOffer, JobOfferArchive
+
+GAZETTEER_DIR = os.getenv("JOB_HUNTER_GAZETTEER_DIR", os.path.join(DATA_DIR, "gazetteer"))
+EARTH_RADIUS_KM = 6371.0
+DEFAULT_RADIUS_KM = 50.0
+MAX_NAME_WORDS = 6     # "saint paul trois chateaux", "roissy charles de gaulle"…
+CHUNK = 500            # Taille des IN (...) (limite de paramètres SQLite)
+
+# Pays cités dans les lieux des offres à l'étranger ("Herstal, Belgique", "Karnataka, Inde")
+FOREIGN = {
+    "allemagne", "germany", "deutschland", "belgique", "belgium", "suisse", "switzerland",
+    "luxembourg", "espagne", "spain", "italie", "italy", "portugal", "pays bas", "netherlands",
+    "royaume uni", "united kingdom", "uk", "angleterre", "england", "irlande", "ireland",
+    "pologne", "poland", "suede", "sweden", "norvege", "norway", "danemark", "denmark",
+    "autriche", "austria", "republique tcheque", "czech republic", "roumanie", "romania",
+    "etats unis", "united states", "usa", "canada", "mexique", "mexico", "bresil", "brazil",
+    "inde", "india", "chine", "china", "japon", "japan", "singapour", "singapore",
+    "coree du sud", "south korea", "australie", "australia", "emirats arabes unis",
+    "united arab emirates", "arabie saoudite", "saudi arabia", "qatar", "maroc", "morocco",
+    "tunisie", "tunisia", "algerie", "algeria", "egypte", "egypt", "afrique du sud", "south africa",
+}
+
+_WORD = re.compile(r"[a-z0-9]+")
+_ABBREVIATIONS = {"st": "saint", "ste": "sainte"}
+_POSTAL_CODE = re.compile(r"\b(\d{5})\b")
+_DEPARTEMENT_HINT = re.compile(r"\((\d{2,3}|2a|2b)\)")
+
+
+def _fold(text: str) -> str:
+    """Minuscules, sans accents ni ligatures."""
+    text = (text or "").lower().replace("œ", "oe").replace("æ", "ae")
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def _words(text: str) -> list[str]:
+    """Mots alphabétiques normalisés : "St-Ouen-l'Aumône" → ["saint", "ouen", "l", "aumone"]."""
+    return [_ABBREVIATIONS.get(w, w) for w in _WORD.findall(_fold(text)) if not w.isdigit()]
+
+
+def name_key(name: str) -> str:
+    return " ".join(_words(name))
+
+
+def departement_for_postal_code(code: str) -> str:
+    """Code postal → code département (Corse : 20000-20199 → 2A, sinon 2B ; DOM sur 3 chiffres)."""
+    if code.startswith("97"):
+        return code[:3]
+    if code.startswith("20"):
+        return "2A" if int(code) < 20200 else "2B"
+    return code[:2]
+
+
+# ─── Gazetteer ────────────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class Place:
+    name: str
+    departement: str
+    lat: float
+    lon: float
+    population: int = 0
+    kind: str = "commune"   # "commune" ou "departement"
+
+
+@dataclass
+class Gazetteer:
+    communes: dict[str, list[Place]] = field(default_factory=dict)      # clé de nom → homonymes
+    departements: dict[str, Place] = field(default_factory=dict)        # code → préfecture
+    departement_names: dict[str, Place] = field(default_factory=dict)   # clé de nom → département
+
+    @classmethod
+    def load(cls, directory: str = GAZETTEER_DIR) -> "Gazetteer":
+        gazetteer = cls()
+        with open(os.path.join(directory, "departements.csv"), encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                place = Place(row["name"], row["code"].upper(), float(row["lat"]), float(row["lon"]),
+                              kind="departement")
+                gazetteer.departements[place.departement] = place
+                gazetteer.departement_names[name_key(place.name)] = place
+        with open(os.path.join(directory, "communes.csv"), encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                place = Place(row["name"], row["departement"].upper(), float(row["lat"]), float(row["lon"]),
+                              int(row.get("population") or 0))
+                for name in [row["name"], *filter(None, (row.get("aliases") or "").split("|"))]:
+                    gazetteer.communes.setdefault(name_key(name), []).append(place)
+        return gazetteer
+
+    def _pick(self, places: list[Place], hint: str | None) -> Place:
+        """Homonymes : le département indiqué, sinon la métropole puis la plus peuplée."""
+        if hint:
+            for place in places:
+                if place.departement == hint:
+                    return place
+        return min(places, key=lambda p: (len(p.departement) > 2, -p.population))
+
+    def resolve(self, location: str) -> Place | None:
+        folded = _fold(location)
+        segments = [name_key(s) for s in re.split(r"[,;/|]", folded)]
+        if any(s in FOREIGN for s in segments):
+            return None
+
+        hint = None
+        if m := _DEPARTEMENT_HINT.search(folded):
+            hint = m.group(1).upper()
+        elif m := _POSTAL_CODE.search(folded):
+            hint = departement_for_postal_code(m.group(1))
+
+        # Fenêtres de mots, les plus longues d'abord : "saint etienne du rouvray" avant "saint etienne"
+        words = _words(folded)
+        windows = [
+            " ".join(words[i:i + n])
+            for n in range(min(len(words), MAX_NAME_WORDS), 0, -1)
+            for i in range(len(words) - n + 1)
+        ]
+        matches = [self.communes[key] for key in windows if key in self.communes]
+        if hint:
+            # "rue de Paris, 69003 Lyon" : la commune du département indiqué l'emporte
+            for places in matches:
+                if any(p.departement == hint for p in places):
+                    return self._pick(places, hint)
+        if matches:
+            return self._pick(matches[0], hint)
+        if hint in self.departements:
+            return self.departements[hint]
+        for key in windows:
+            if key in self.departement_names:
+                return self.departement_names[key]
+        return None
+
+
+@functools.cache
+def default_gazetteer() -> Gazetteer:
+    return Gazetteer.load()
+
+
+@functools.lru_cache(maxsize=8192)
+def resolve_location(location: str | None) -> Place | None:
+    """Coordonnées d'un lieu libre via le gazetteer embarqué (None si inconnu ou à l'étranger)."""
+    if not location or not location.strip():
+        return None
+    return default_gazetteer().resolve(location)
+
+
+# ─── Distances ────────────────────────────────────────────────────────────────
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def bounding_box(lat: float, lon: float, radius_km: float) -> tuple[float, float, float, float]:
+    """(min_lat, max_lat, min_lon, max_lon) contenant le cercle de rayon `radius_km`."""
+    dlat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    dlon = math.degrees(radius_km / (EARTH_RADIUS_KM * max(math.cos(math.radians(lat)), 1e-6)))
+    return lat - dlat, lat + dlat, lon - dlon, lon + dlon
+
+
+def within_box(model, box: tuple[float, float, float, float]):
+    """
+    Clause WHERE des offres de `model` dans la boîte : via l'index R-tree pour
+    job_offers, sur les colonnes pour l'archive (lue seulement sur demande).
+    """
+    min_lat, max_lat, min_lon, max_lon = box
+    if model is JobOffer:
+        return JobOffer.id.in_(
+            select(OFFER_GEO.c.id).where(
+                OFFER_GEO.c.max_lat >= min_lat, OFFER_GEO.c.min_lat <= max_lat,
+                OFFER_GEO.c.max_lon >= min_lon, OFFER_GEO.c.min_lon <= max_lon,
+            )
+        )
+    return model.latitude.between(min_lat, max_lat) & model.longitude.between(min_lon, max_lon)
+
+
+def distance_km(offer, center: Place) -> float | None:
+    if offer.latitude is None or offer.longitude is None:
+        return None
+    return haversine_km(center.lat, center.lon, offer.latitude, offer.longitude)
+
+
+# ─── Index spatial ────────────────────────────────────────────────────────────
+
+def index_locations(db: Session, offer_ids: list[int]) -> int:
+    """
+    Géocode des offres de job_offers et les (ré)indexe dans offer_geo. Ne commit pas.
+
+    Returns:
+        Nombre d'offres localisées
+    """
+    located = 0
+    for i in range(0, len(offer_ids), CHUNK):
+        chunk = offer_ids[i:i + CHUNK]
+        coords = []
+        for offer_id, location in db.execute(
+            select(JobOffer.id, JobOffer.location).where(JobOffer.id.in_(chunk))
+        ):
+            place = resolve_location(location)
+            if place:
+                coords.append({"_id": offer_id, "lat": place.lat, "lon": place.lon})
+        db.execute(delete(OFFER_GEO).where(OFFER_GEO.c.id.in_(chunk)))
+        if not coords:
+            continue
+        db.execute(
+            update(JobOffer.__table__).where(JobOffer.__table__.c.id == bindparam("_id"))
+            .values(latitude=bindparam("lat"), longitude=bindparam("lon")),
+            coords,
+        )
+        db.execute(OFFER_GEO.insert(), [
+            {"id": c["_id"], "min_lat": c["lat"], "max_lat": c["lat"], "min_lon": c["lon"], "max_lon": c["lon"]}
+            for c in coords
+        ])
+        located += len(coords)
+    return located
+
+
+def forget_locations(db: Session, offer_ids: list[int]):
+    """Retire des offres de l'index spatial (archivage). Ne commit pas."""
+    for i in range(0, len(offer_ids), CHUNK):
+        db.execute(delete(OFFER_GEO).where(OFFER_GEO.c.id.in_(offer_ids[i:i + CHUNK])))
+
+
+def backfill_locations(db: Session, rebuild: bool = False) -> int:
+    """
+    Migration : géocode les offres absentes de offer_geo (toutes si `rebuild`)
+    et les lignes d'archive sans coordonnées, puis commit.
+
+    Returns:
+        Nombre d'offres localisées
+    """
+    if rebuild:
+        db.execute(delete(OFFER_GEO))
+        db.execute(update(JobOffer).values(latitude=None, longitude=None)
+                   .execution_options(synchronize_session=False))
+    ids = db.scalars(
+        select(JobOffer.id)
+        .where(JobOffer.location.is_not(None), JobOffer.location != "",
+               ~JobOffer.id.in_(select(OFFER_GEO.c.id)))
+        .order_by(JobOffer.id)
+    ).all()
+    located = index_locations(db, ids) if ids else 0
+
+    archive = JobOfferArchive.__table__
+    coords = []
+    for archive_id, location in db.execute(
+        select(archive.c.archive_id, archive.c.location).where(archive.c.latitude.is_(None))
+    ):
+        place = resolve_location(location)
+        if place:
+            coords.append({"_id": archive_id, "lat": place.lat, "lon": place.lon})
+    if coords:
+        db.execute(
+            update(archive).where(archive.c.archive_id == bindparam("_id"))
+            .values(latitude=bindparam("lat"), longitude=bindparam("lon")),
+            coords,
+        )
+    db.commit()
+    return located + len(coords)
+
+
+# ─── Point d'entrée ──────────────────────────────────────────────────────────
+
+def main():
+    from backend.database import SessionLocal, init_db
+
+    parser = argparse.ArgumentParser(description="📍 Géocodage des offres")
+    parser.add_argument("location", nargs="?", help="Lieu à résoudre (sans toucher à la base)")
+    parser.add_argument("--reindex", action="store_true", help="Regéocoder toutes les offres")
+    args = parser.parse_args()
+
+    if args.location:
+        place = resolve_location(args.location)
+        if place:
+            print(f"📍 {place.name} ({place.departement}) : {place.lat:.4f}, {place.lon:.4f} [{place.kind}]")
+        else:
+            print("📍 Lieu inconnu")
+        return
+
+    init_db()
+    db = SessionLocal()
+    try:
+        located = backfill_locations(db, rebuild=args.reindex)
+        print(f"📍 {located} offres géocodées")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
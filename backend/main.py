@@ -1,23 +1,51 @@
 import datetime
-import sys
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import func, or_
 from pydantic import BaseModel
 
-from backend.database import engine, Base, get_db
-from backend.models import JobOffer, ScrapeCache
-from backend.scrapers.core import EDFScraper, TotalEnergiesScraper, SafranScraper, AirbusScraper
-
-# Ajouter le répertoire scrapers/tests au path pour importer Indeed et LinkedIn
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scrapers", "tests"))
-
-Base.metadata.create_all(bind=engine)
-
-app = FastAPI(title="Job Hunter OS API")
+from backend.contracts import parse_contract_filter
+from backend.database import get_db, get_read_db, init_db, report_sqlite_settings
+from backend.geo import DEFAULT_RADIUS_KM, bounding_box, distance_km, resolve_location, within_box
+from backend.models import JobOffer, JobOfferArchive, ScrapeCache
+from backend.orchestrator import (
+    SOURCE_RUNNERS, is_keyword_fresh, record_demand, normalize_keywords, run_batch_scrape,
+)
+from backend import task_queue, workflow
+
+
+# ─── Rafraîchissement en arrière-plan (optionnel) ────────────────────────────
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Applique le schéma (sauf JOB_HUNTER_AUTO_MIGRATE=0, quand les migrations
+    passent par python -m backend.migrate), affiche les réglages SQLite
+    effectifs, puis active dans le process de l'API le planificateur
+    (JOB_HUNTER_SCHEDULER=1) et l'archivage (JOB_HUNTER_RETENTION=1).
+    """
+    if os.getenv("JOB_HUNTER_AUTO_MIGRATE", "1") == "1":
+        init_db()
+    report_sqlite_settings()
+    jobs = []
+    if os.getenv("JOB_HUNTER_SCHEDULER") == "1":
+        from backend.scheduler import RefreshScheduler
+        jobs.append(RefreshScheduler())
+    if os.getenv("JOB_HUNTER_RETENTION") == "1":
+        from backend.retention import RetentionJob
+        jobs.append(RetentionJob())
+    for job in jobs:
+        job.start()
+    yield
+    for job in jobs:
+        job.stop()
+
+
+app = FastAPI(title="Job Hunter OS API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -27,126 +55,139 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# ─── Durée du cache (en heures) ──────────────────────────────────────────────
-CACHE_DURATION_HOURS = 24
-
 
 class ScrapeRequest(BaseModel):
-    keyword: str
+    keyword: str = ""
+    keywords: list[str] = []   # Lot de mots-clés scrapés dans les mêmes sessions navigateur
 
 
-# ─── GET /api/jobs — Filtrage local instantané ────────────────────────────────
+class StatusRequest(BaseModel):
+    ids: list[int]
+    status: str   # Voir backend/workflow.py (NEW, SELECTED, PREPARED, APPLIED, REJECTED, CLOSED)
 
-@app.get("/api/jobs")
-def get_jobs(
-    keyword: str = "",
-    location: str = "",
-    contract_type: str = "",
-    db: Session = Depends(get_db)
-):
-    query = db.query(JobOffer)
 
+# ─── GET /api/jobs — Filtrage local instantané ────────────────────────────────
+
+def filter_offers(query, model, keyword: str = "", location: str = "", contract_type: str = "",
+                  since: datetime.datetime | None = None, box: tuple | None = None):
+    """Applique les filtres de recherche à une requête sur `model` (table chaude ou archive)."""
     if keyword:
         query = query.filter(
             or_(
-                JobOffer.title.ilike(f"%{keyword}%"),
-                JobOffer.company.ilike(f"%{keyword}%"),
-                JobOffer.original_search.ilike(f"%{keyword}%")
+                model.title.ilike(f"%{keyword}%"),
+                model.company.ilike(f"%{keyword}%"),
+                model.original_search.ilike(f"%{keyword}%")
             )
         )
     if location:
-        query = query.filter(JobOffer.location.ilike(f"%{location}%"))
+        query = query.filter(model.location.ilike(f"%{location}%"))
     if contract_type:
-        query = query.filter(JobOffer.contract_type.ilike(f"%{contract_type}%"))
+        # Type connu : égalité sur l'index contract_kind ; sinon ("Freelance"…) recherche texte
+        kind = parse_contract_filter(contract_type)
+        if kind is not None:
+            query = query.filter(model.contract_kind == kind)
+        else:
+            query = query.filter(model.contract_type.ilike(f"%{contract_type}%"))
+    if since:
+        query = query.filter(model.published_at >= since)
+    if box:
+        query = query.filter(within_box(model, box))
+    return query
 
-    return query.order_by(JobOffer.id.desc()).all()
 
+def order_offers(query, model, sort: str):
+    """
+    sort=recent : date de publication décroissante (index published_at), sinon
+    ordre d'arrivée. sort=distance (avec near) est appliqué après le filtre de rayon.
+    """
+    if sort == "recent":
+        # SQLite classe les NULL en dernier en ordre décroissant : les offres non datées finissent la liste
+        return query.order_by(model.published_at.desc(), model.id.desc())
+    return query.order_by(model.id.desc())
 
-# ─── Helpers : Cache intelligent ──────────────────────────────────────────────
 
-def is_keyword_fresh(db: Session, keyword: str) -> bool:
-    """Vérifie si le mot-clé a déjà été scrapé dans les dernières CACHE_DURATION_HOURS heures."""
-    cutoff = datetime.datetime.utcnow() - datetime.timedelta(hours=CACHE_DURATION_HOURS)
-    cache_entry = (
-        db.query(ScrapeCache)
-        .filter(ScrapeCache.keyword == keyword.lower())
-        .filter(ScrapeCache.last_scraped_at >= cutoff)
-        .first()
-    )
-    return cache_entry is not None
+@app.get("/api/jobs")
+def get_jobs(
+    keyword: str = "",
+    location: str = "",
+    contract_type: str = "",
+    since: datetime.datetime | None = None,
+    sort: str = "",
+    include_archived: bool = False,
+    collapse_duplicates: bool = False,
+    near: str = "",
+    radius_km: float = DEFAULT_RADIUS_KM,
+    db: Session = Depends(get_read_db)
+):
+    # ── Recherche par rayon : boîte englobante via l'index R-tree, puis distance exacte ──
+    center = resolve_location(near) if near else None
+    if near and center is None:
+        location = location or near   # Lieu inconnu du gazetteer : filtre texte
+    box = bounding_box(center.lat, center.lon, radius_km) if center else None
+
+    filters = dict(keyword=keyword, location=location, contract_type=contract_type, since=since, box=box)
+    query = filter_offers(db.query(JobOffer), JobOffer, **filters)
+
+    # ── Quasi-doublons inter-sources : une seule offre (la plus ancienne) par cluster ──
+    if collapse_duplicates:
+        representatives = (
+            query.with_entities(func.min(JobOffer.id))
+            .group_by(func.coalesce(JobOffer.duplicate_cluster_id, JobOffer.id))
+        )
+        query = db.query(JobOffer).filter(JobOffer.id.in_(representatives.scalar_subquery()))
+
+    offers = order_offers(query, JobOffer, sort).all()
+
+    # ── Archive (offres expirées) : seulement sur demande, après les offres actives ──
+    if include_archived:
+        archived = filter_offers(db.query(JobOfferArchive), JobOfferArchive, **filters)
+        if sort == "recent":
+            archived = archived.order_by(JobOfferArchive.published_at.desc())
+        offers += archived.order_by(JobOfferArchive.archived_at.desc(), JobOfferArchive.archive_id.desc()).all()
+
+    if center:
+        # Les coins de la boîte sont hors du cercle
+        offers = [o for o in offers if distance_km(o, center) <= radius_km]
+        if sort == "distance":
+            # Tri stable : les offres archivées restent après les actives
+            offers.sort(key=lambda o: (isinstance(o, JobOfferArchive), distance_km(o, center)))
+    return offers
+
+
+# ─── POST /api/scrape — Scraping intelligent avec cache ──────────────────────
 
+def cached_summary(db: Session, search_query: str) -> tuple[int, object]:
+    """Nombre d'offres en base et date du dernier scraping pour un mot-clé en cache."""
+    existing_count = db.query(JobOffer).filter(
+        JobOffer.original_search.ilike(f"%{search_query}%")
+    ).count()
 
-def update_cache(db: Session, keyword: str, source: str, count: int):
-    """Met à jour le timestamp de cache pour un mot-clé donné."""
-    existing = (
+    cache_entry = (
         db.query(ScrapeCache)
-        .filter(ScrapeCache.keyword == keyword.lower(), ScrapeCache.source == source)
+        .filter(ScrapeCache.keyword == search_query.lower())
         .first()
     )
-    if existing:
-        existing.last_scraped_at = datetime.datetime.utcnow()
-        existing.offers_found = count
-    else:
-        db.add(ScrapeCache(
-            keyword=keyword.lower(),
-            source=source,
-            offers_found=count
-        ))
-
-
-def save_offer(db: Session, r, source: str, search_query: str) -> bool:
-    """Sauvegarde une offre dans la base. Retourne True si c'est une nouvelle offre."""
-    # Construire l'URL de dédup
-    url = getattr(r, "url", "") or ""
-    if not url:
-        return False
-
-    existing = db.query(JobOffer).filter(JobOffer.url == url).first()
-    if not existing:
-        new_job = JobOffer(
-            title=getattr(r, "titre", ""),
-            company=getattr(r, "entreprise", ""),
-            location=getattr(r, "lieu", ""),
-            url=url,
-            contract_type=getattr(r, "contrat", "") or getattr(r, "contract_type", ""),
-            published_date=getattr(r, "date_publication", ""),
-            source=source,
-            status="NEW",
-            original_search=search_query
-        )
-        db.add(new_job)
-        return True
-    else:
-        # Mettre à jour les mots-clés de recherche
-        if existing.original_search:
-            if search_query.lower() not in existing.original_search.lower():
-                existing.original_search += f" | {search_query}"
-        else:
-            existing.original_search = search_query
-        return False
+    return existing_count, cache_entry.last_scraped_at if cache_entry else None
 
 
-# ─── POST /api/scrape — Scraping intelligent avec cache ──────────────────────
-
 @app.post("/api/scrape")
 def trigger_scrape(request: ScrapeRequest, db: Session = Depends(get_db)):
-    search_query = request.keyword.strip()
-    if not search_query:
+    queries = normalize_keywords([request.keyword, *request.keywords])
+    if not queries:
         return {"status": "error", "message": "Keyword required"}
 
-    # ── Vérifier le cache : si déjà scrapé récemment, on ne re-scrape pas ──
-    if is_keyword_fresh(db, search_query):
-        # Compter les offres existantes pour ce mot-clé
-        existing_count = db.query(JobOffer).filter(
-            JobOffer.original_search.ilike(f"%{search_query}%")
-        ).count()
-
-        cache_entry = (
-            db.query(ScrapeCache)
-            .filter(ScrapeCache.keyword == search_query.lower())
-            .first()
-        )
-        last_time = cache_entry.last_scraped_at if cache_entry else None
+    # ── Vérifier le cache : les mots-clés scrapés récemment ne sont pas re-scrapés ──
+    fresh = [q for q in queries if is_keyword_fresh(db, q)]
+    stale = [q for q in queries if q not in fresh]
+
+    if not stale:
+        summaries = [cached_summary(db, q) for q in fresh]
+        existing_count = sum(count for count, _ in summaries)
+        times = [t for _, t in summaries if t]
+        last_time = min(times) if times else None
+        for search_query in queries:
+            record_demand(db, search_query)
+        db.commit()
 
         return {
             "status": "cached",
@@ -156,70 +197,75 @@ def trigger_scrape(request: ScrapeRequest, db: Session = Depends(get_db)):
             "last_scraped_at": last_time.isoformat() if last_time else None
         }
 
-    # ── Lancer le scraping sur TOUTES les sources ──
-    new_offers_count = 0
-    sources_scraped = []
-
-    # 1. Scrapers corporate (EDF, Total, Safran, Airbus)
-    corporate_scrapers = [
-        EDFScraper(),
-        TotalEnergiesScraper(),
-        SafranScraper(),
-        AirbusScraper()
-    ]
-    for scraper in corporate_scrapers:
-        try:
-            print(f"\n🏭 Lancement scraper: {scraper.company_name}")
-            results = scraper.scrape(keyword=search_query, max_pages=2)
-            count = 0
-            for r in results:
-                if save_offer(db, r, r.source, search_query):
-                    count += 1
-            new_offers_count += count
-            sources_scraped.append(f"{scraper.company_name}: {count}")
-            print(f"  ✅ {scraper.company_name}: {count} nouvelles offres")
-        except Exception as e:
-            print(f"  ❌ Erreur {scraper.company_name}: {e}")
-            sources_scraped.append(f"{scraper.company_name}: erreur")
-
-    # 2. Indeed
-    try:
-        print("\n🔍 Lancement scraper: Indeed")
-        from test_scraper_indeed import scrape_indeed
-        indeed_results = scrape_indeed(query=search_query, location="France", max_pages=2)
-        count = 0
-        for r in indeed_results:
-            if save_offer(db, r, "indeed", search_query):
-                count += 1
-        new_offers_count += count
-        sources_scraped.append(f"Indeed: {count}")
-        print(f"  ✅ Indeed: {count} nouvelles offres")
-    except Exception as e:
-        print(f"  ❌ Erreur Indeed: {e}")
-        sources_scraped.append(f"Indeed: erreur")
-
-    # 3. LinkedIn
-    try:
-        print("\n🔍 Lancement scraper: LinkedIn")
-        from test_scraper_linkedin import scrape_linkedin
-        linkedin_results = scrape_linkedin(query=search_query, location="France", max_pages=2)
-        count = 0
-        for r in linkedin_results:
-            if save_offer(db, r, "linkedin", search_query):
-                count += 1
-        new_offers_count += count
-        sources_scraped.append(f"LinkedIn: {count}")
-        print(f"  ✅ LinkedIn: {count} nouvelles offres")
-    except Exception as e:
-        print(f"  ❌ Erreur LinkedIn: {e}")
-        sources_scraped.append(f"LinkedIn: erreur")
-
-    # ── Mettre à jour le cache ──
-    update_cache(db, search_query, "all", new_offers_count)
+    # ── Mode file : déléguer aux workers (python -m backend.worker) ──
+    if os.getenv("JOB_HUNTER_SCRAPE_MODE") == "queue":
+        created = sum(task_queue.enqueue(db, q, list(SOURCE_RUNNERS)) for q in stale)
+        for search_query in queries:
+            record_demand(db, search_query)
+        db.commit()
+        return {
+            "status": "queued",
+            "message": f"{created} tâches ajoutées à la file de scraping.",
+            "new_offers_count": 0,
+            "tasks_created": created,
+            "cached_keywords": fresh
+        }
+
+    # ── Lancer le scraping du lot sur TOUTES les sources ──
+    new_offers_count, new_by_keyword, sources_scraped = run_batch_scrape(db, stale)
+    for search_query in queries:
+        record_demand(db, search_query)
     db.commit()
 
     return {
         "status": "success",
         "new_offers_count": new_offers_count,
-        "sources": sources_scraped
+        "sources": sources_scraped,
+        "keywords": new_by_keyword,
+        "cached_keywords": fresh
     }
+
+
+# ─── GET /api/tasks — État de la file de scraping ────────────────────────────
+
+@app.get("/api/tasks")
+def get_task_stats(db: Session = Depends(get_read_db)):
+    return task_queue.queue_stats(db)
+
+
+# ─── Kanban — Statuts des candidatures ───────────────────────────────────────
+
+@app.post("/api/offers/status")
+def change_status(request: StatusRequest, db: Session = Depends(get_db)):
+    """Transition en lot : toutes les offres `ids` passent à `status` en une seule requête."""
+    try:
+        moved = workflow.transition(db, request.ids, request.status.upper())
+    except workflow.InvalidStatus as e:
+        return {"status": "error", "message": str(e)}
+    return {
+        "status": "success",
+        "moved": moved,
+        "skipped": sorted(set(request.ids) - set(moved)),
+    }
+
+
+@app.get("/api/offers/{offer_id}/history")
+def get_status_history(offer_id: int, db: Session = Depends(get_read_db)):
+    return workflow.history(db, offer_id)
+
+
+@app.get("/api/board")
+def get_board(limit: int = workflow.BOARD_PAGE_SIZE, db: Session = Depends(get_read_db)):
+    """Colonnes du Kanban : total et première page de chaque statut."""
+    return workflow.board(db, limit)
+
+
+@app.get("/api/board/{status}")
+def get_board_column(status: str, before_id: int | None = None, limit: int = workflow.BOARD_PAGE_SIZE,
+                     db: Session = Depends(get_read_db)):
+    """Page suivante d'une colonne (before_id = next_before_id de la page précédente)."""
+    try:
+        offers = workflow.column_page(db, status.upper(), limit, before_id)
+    except workflow.InvalidStatus as e:
+        return {"status": "error", "message": str(e)}
+    return {"offers": offers, "next_before_id": offers[-1].id if len(offers) == limit else None}
@@ -0,0 +1,50 @@
+"""
+🛠️ Job Hunter OS — Migrations
+=============================
+Crée les tables et colonnes manquantes puis rejoue les migrations de données
+(backend/database.py:init_db). L'API le fait à son démarrage ; en production
+avec plusieurs workers uvicorn, lancer ce script une fois avant et démarrer
+l'API avec JOB_HUNTER_AUTO_MIGRATE=0.
+
+Le script rejoue aussi les migrations de rattrapage qui ne marquent pas les
+lignes qu'elles ne savent pas traiter et les reliraient à chaque démarrage :
+dates de publication (published_at) et géocodage des offres antérieures à
+ces colonnes. Les nouvelles offres sont traitées à l'ingestion.
+
+Usage:
+    python -m backend.migrate
+"""
+
+import time
+
+from backend.database import SQLALCHEMY_DATABASE_URL, SessionLocal, init_db
+from backend.geo import backfill_locations
+from backend.persistence import backfill_published_at
+
+
+def run_backfills():
+    """Migrations de rattrapage coûteuses, hors démarrage de l'API."""
+    db = SessionLocal()
+    try:
+        dated = backfill_published_at(db)
+        if dated:
+            print(f"📅 {dated} dates de publication normalisées (published_at)")
+        located = backfill_locations(db)
+        if located:
+            print(f"📍 {located} offres géocodées (offer_geo)")
+    finally:
+        db.close()
+
+
+# ─── Point d'entrée ──────────────────────────────────────────────────────────
+
+def main():
+    start = time.perf_counter()
+    print(f"🛠️  Migration de {SQLALCHEMY_DATABASE_URL}")
+    init_db()
+    run_backfills()
+    print(f"✅ Schéma à jour ({time.perf_counter() - start:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
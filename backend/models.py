@@ -1,21 +1,108 @@
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import (
+    DDL, BigInteger, Column, DateTime, Float, Index, Integer, LargeBinary, MetaData, SmallInteger, String, Table,
+    event,
+)
 from backend.database import Base
+from backend.scrapers.urls import url_hash
 import datetime
 
-class JobOffer(Base):
-    __tablename__ = "job_offers"
 
+def _default_url_hash(context):
+    url = context.get_current_parameters().get("url")
+    return url_hash(url) if url else None
+
+
+class OfferColumns:
+    """Colonnes communes à la table chaude (job_offers) et à son archive."""
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
     company = Column(String, index=True)
     location = Column(String)
-    url = Column(String, unique=True, index=True)
+    latitude = Column(Float)   # Coordonnées de location via le gazetteer (backend/geo.py)
+    longitude = Column(Float)
+    url = Column(String)  # URL canonique (backend/scrapers/urls.py)
+    url_hash = Column(BigInteger, unique=True, index=True, default=_default_url_hash)  # Clé de dédoublonnage : hash 64 bits de l'URL canonique
     contract_type = Column(String)
-    published_date = Column(String)
+    contract_kind = Column(SmallInteger, index=True)  # ContractKind normalisé (backend/contracts.py)
+    published_date = Column(String)  # Texte brut de la source
+    published_at = Column(DateTime, index=True)  # published_date normalisée (backend/dates.py)
     source = Column(String, index=True)
-    status = Column(String, default="NEW") # NEW, SELECTED, APPLIED
+    status = Column(String, default="NEW")  # Cycle de vie de la candidature (backend/workflow.py)
     original_search = Column(String, index=True) # Mémorise les mots-clés utilisés pour le scraping
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    last_seen_at = Column(DateTime, default=datetime.datetime.utcnow, index=True)  # Dernier scraping où l'offre est apparue
+    duplicate_cluster_id = Column(Integer, index=True)  # Quasi-doublons inter-sources (backend/dedup.py)
+
+
+class JobOffer(OfferColumns, Base):
+    __tablename__ = "job_offers"
+
+    __table_args__ = (
+        # Colonnes du Kanban : count par statut et pages "WHERE status = ? AND id < ? ORDER BY id DESC"
+        Index("ix_job_offers_status_id", "status", "id"),
+        # Un id n'est jamais réattribué après archivage : l'historique des statuts,
+        # l'index spatial et l'archive y font référence (voir database.ensure_autoincrement)
+        {"sqlite_autoincrement": True},
+    )
+
+
+class JobOfferArchive(OfferColumns, Base):
+    """
+    Offres disparues des sites ou classées : déplacées hors de job_offers par
+    backend/retention.py pour que la table chaude reste petite.
+    """
+    __tablename__ = "job_offers_archive"
+
+    # Clé propre à l'archive : avant AUTOINCREMENT, SQLite réattribuait les id de job_offers
+    archive_id = Column(Integer, primary_key=True)
+    id = Column(Integer, index=True)
+    archived_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+
+class OfferSignature(Base):
+    """Signature MinHash d'une offre de job_offers (voir backend/dedup.py)."""
+    __tablename__ = "offer_signatures"
+
+    offer_id = Column(Integer, primary_key=True)
+    signature = Column(LargeBinary, nullable=False)  # NUM_PERM entiers 32 bits
+
+
+class OfferLshBand(Base):
+    """Bucket LSH d'une bande de signature : index des candidats quasi-doublons."""
+    __tablename__ = "offer_lsh_bands"
+
+    bucket = Column(BigInteger, primary_key=True)
+    offer_id = Column(Integer, primary_key=True, index=True)
+    band = Column(Integer, nullable=False)
+
+
+class OfferStatusHistory(Base):
+    """Journal des changements de statut (ajout seul, jamais modifié) : voir backend/workflow.py."""
+    __tablename__ = "offer_status_history"
+
+    id = Column(Integer, primary_key=True)
+    offer_id = Column(Integer, nullable=False)
+    from_status = Column(String)
+    to_status = Column(String, nullable=False)
+    changed_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_offer_status_history_offer", "offer_id", "changed_at"),
+    )
+
+
+# Index spatial des offres de job_offers (backend/geo.py) : table virtuelle R-tree,
+# hors de Base.metadata car create_all ne sait pas créer de VIRTUAL TABLE.
+# Une offre y est une boîte réduite à un point (min = max).
+OFFER_GEO = Table(
+    "offer_geo", MetaData(),
+    Column("id", Integer, primary_key=True),  # = job_offers.id
+    Column("min_lat", Float), Column("max_lat", Float),
+    Column("min_lon", Float), Column("max_lon", Float),
+)
+event.listen(Base.metadata, "after_create", DDL(
+    "CREATE VIRTUAL TABLE IF NOT EXISTS offer_geo USING rtree(id, min_lat, max_lat, min_lon, max_lon)"
+))
 
 
 class ScrapeCache(Base):
@@ -27,4 +114,33 @@ class ScrapeCache(Base):
     source = Column(String)  # "indeed", "linkedin", "corporate"
     last_scraped_at = Column(DateTime, default=datetime.datetime.utcnow)
     offers_found = Column(Integer, default=0)
+    requests_count = Column(Integer, default=0)  # Demandes utilisateur (priorité du rafraîchissement)
+
+
+
+class ScrapeTask(Base):
+    """
+    Tâche de la file de scraping durable : une page d'une source pour un mot-clé.
+    Voir backend/task_queue.py pour le cycle de vie (bail, heartbeat, retry, dead-letter).
+    """
+    __tablename__ = "scrape_tasks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    keyword = Column(String, nullable=False)
+    source = Column(String, nullable=False)
+    page = Column(Integer, default=0)
+    status = Column(String, default="PENDING")  # PENDING, LEASED, DONE, DEAD
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=3)
+    available_at = Column(DateTime, default=datetime.datetime.utcnow)  # Pas avant (backoff des retries)
+    lease_owner = Column(String)
+    lease_expires_at = Column(DateTime)
+    offers_found = Column(Integer, default=0)
+    last_error = Column(String)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_scrape_tasks_claim", "status", "available_at"),
+        Index("ix_scrape_tasks_identity", "keyword", "source", "page"),
+    )
@@ -0,0 +1,265 @@
+"""
+Orchestration du scraping : lance les sources, persiste les offres et
+tient le cache des mots-clés à jour.
+
+Partagé entre l'endpoint /api/scrape et le planificateur de rafraîchissement
+(backend/scheduler.py), pour que les deux chemins scrapent exactement de la
+même façon.
+"""
+
+import datetime
+import os
+import queue
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from backend.contracts import contract_kind
+from backend.models import JobOffer, ScrapeCache
+from backend.persistence import OfferWriter, merge_search
+from backend.scrapers.urls import canonical_url, url_hash
+from backend.sources import SOURCES, LazyRegistry, LazyRunner, iter_results
+
+# ─── Durée du cache (en heures) ──────────────────────────────────────────────
+CACHE_DURATION_HOURS = 24
+
+
+# ─── Sources ──────────────────────────────────────────────────────────────────
+
+# clé → (libellé, runner(queries, max_pages, start_page=0) → {mot-clé: offres}),
+# dans l'ordre de scraping. Chaque runner traite tout un lot de mots-clés dans
+# une seule session navigateur (runner.iter() en flux, page par page) ; le
+# scraper (et Playwright) n'est importé qu'au premier appel (backend/sources.py),
+# et le registre lui-même au premier accès.
+SOURCE_RUNNERS: Mapping[str, tuple] = LazyRegistry(
+    lambda: {key: (spec.label, LazyRunner(spec)) for key, spec in SOURCES.items()})
+
+# Hôte contacté par chaque source (pour les budgets de requêtes par hôte)
+SOURCE_HOSTS: Mapping[str, str] = LazyRegistry(lambda: {key: spec.host for key, spec in SOURCES.items()})
+
+# Sources scrapées en parallèle (une session navigateur par thread)
+SCRAPE_WORKERS = int(os.getenv("JOB_HUNTER_SCRAPE_WORKERS", "1"))
+
+# Offres en transit entre les threads de scraping et l'écriture (≈ quelques pages)
+STREAM_QUEUE_SIZE = 500
+
+_SOURCE_DONE = object()
+
+
+@dataclass
+class SourceRun:
+    """Métrique d'une source pour un lot : durée du scraping et offres remontées."""
+    key: str
+    label: str
+    duration_s: float = 0.0
+    offers: int = 0
+    inserted: int = 0
+    error: str = ""
+
+
+# ─── Helpers : Cache intelligent ──────────────────────────────────────────────
+
+def is_keyword_fresh(db: Session, keyword: str) -> bool:
+    """Vérifie si le mot-clé a déjà été scrapé dans les dernières CACHE_DURATION_HOURS heures."""
+    cutoff = datetime.datetime.utcnow() - datetime.timedelta(hours=CACHE_DURATION_HOURS)
+    cache_entry = (
+        db.query(ScrapeCache)
+        .filter(ScrapeCache.keyword == keyword.lower())
+        .filter(ScrapeCache.last_scraped_at >= cutoff)
+        .first()
+    )
+    return cache_entry is not None
+
+
+def update_cache(db: Session, keyword: str, source: str, count: int,
+                 scraped_at: datetime.datetime | None = None):
+    """Met à jour le timestamp de cache pour un mot-clé donné (par défaut : maintenant)."""
+    scraped_at = scraped_at or datetime.datetime.utcnow()
+    existing = (
+        db.query(ScrapeCache)
+        .filter(ScrapeCache.keyword == keyword.lower(), ScrapeCache.source == source)
+        .first()
+    )
+    if existing:
+        existing.last_scraped_at = scraped_at
+        existing.offers_found = count
+    else:
+        db.add(ScrapeCache(
+            keyword=keyword.lower(),
+            source=source,
+            offers_found=count,
+            last_scraped_at=scraped_at,
+        ))
+
+
+def record_demand(db: Session, keyword: str):
+    """Compte une demande utilisateur pour ce mot-clé (priorité du rafraîchissement)."""
+    entries = db.query(ScrapeCache).filter(ScrapeCache.keyword == keyword.lower()).all()
+    for entry in entries:
+        entry.requests_count = (entry.requests_count or 0) + 1
+
+
+def save_offer(db: Session, r, source: str, search_query: str) -> bool:
+    """
+    Sauvegarde une offre dans la base. Retourne True si c'est une nouvelle offre.
+    Pour plusieurs offres, préférer persistence.bulk_upsert_offers (une seule passe).
+    """
+    # Construire l'URL de dédup
+    url = canonical_url(getattr(r, "url", "") or "")
+    if not url:
+        return False
+
+    existing = db.query(JobOffer).filter(JobOffer.url_hash == url_hash(url)).first()
+    if not existing:
+        contract = getattr(r, "contrat", "") or getattr(r, "contract_type", "")
+        new_job = JobOffer(
+            title=getattr(r, "titre", ""),
+            company=getattr(r, "entreprise", ""),
+            location=getattr(r, "lieu", ""),
+            url=url,
+            url_hash=url_hash(url),
+            contract_type=contract,
+            contract_kind=int(contract_kind(contract, getattr(r, "titre", ""))),
+            published_date=getattr(r, "date_publication", ""),
+            source=source,
+            status="NEW",
+            original_search=search_query
+        )
+        db.add(new_job)
+        return True
+    else:
+        # Mettre à jour les mots-clés de recherche
+        existing.original_search = merge_search(existing.original_search, search_query)
+        existing.last_seen_at = datetime.datetime.utcnow()
+        return False
+
+
+# ─── Scraping de toutes les sources ───────────────────────────────────────────
+
+def normalize_keywords(keywords: list[str]) -> list[str]:
+    """Nettoie un lot de mots-clés et retire les doublons (sans tenir compte de la casse)."""
+    seen: set[str] = set()
+    unique = []
+    for kw in keywords:
+        kw = (kw or "").strip()
+        if kw and kw.lower() not in seen:
+            seen.add(kw.lower())
+            unique.append(kw)
+    return unique
+
+
+def _stream_source(key: str, runner, keywords: list[str], max_pages: int,
+                   out: queue.Queue, run: SourceRun):
+    """Thread de scraping : pousse les offres d'une source dans `out` au fil des pages."""
+    started = time.perf_counter()
+    try:
+        if hasattr(runner, "iter"):
+            items = runner.iter(keywords, max_pages)
+        else:
+            items = iter_results(runner(keywords, max_pages), keywords)
+        for kw, offer in items:
+            out.put((key, kw, offer))
+    except Exception as e:
+        run.error = str(e) or type(e).__name__
+    finally:
+        run.duration_s = time.perf_counter() - started
+        out.put((key, None, _SOURCE_DONE))
+
+
+def run_batch_scrape(db: Session, keywords: list[str], sources: list[str] | None = None,
+                     max_pages: int = 2, max_workers: int | None = None,
+                     runs: list[SourceRun] | None = None) -> tuple[int, dict[str, int], list[str]]:
+    """
+    Scrape un lot de mots-clés sur les sources demandées (toutes par défaut).
+
+    Chaque source traite tout le lot dans une seule session navigateur, dans
+    un thread de scraping ; jusqu'à `max_workers` sources (SCRAPE_WORKERS par
+    défaut) tournent en parallèle. Les offres arrivent page par page
+    (iter_offers) dans une file bornée et partent vers la base depuis le
+    thread appelant, par lots commités (persistence.OfferWriter), pendant
+    que le scraping continue ; les doublons du lot (toutes sources et tous
+    mots-clés confondus) sont fusionnés par l'upsert sur l'URL.
+
+    Args:
+        runs: si fournie, reçoit un SourceRun par source (durée, offres)
+
+    Returns:
+        (nouvelles offres uniques, {mot-clé: nouvelles offres}, résumé par source)
+    """
+    keywords = normalize_keywords(keywords)
+    sources_scraped = []
+    source_keys = sources or list(SOURCE_RUNNERS)
+    source_runs = {key: SourceRun(key, SOURCE_RUNNERS[key][0]) for key in source_keys}
+
+    writer = OfferWriter(sessionmaker(bind=db.get_bind()))
+    stream: queue.Queue = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+    workers = max(1, min(max_workers or SCRAPE_WORKERS, len(source_keys) or 1))
+    with writer, ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scrape") as pool:
+        for key in source_keys:
+            label, runner = SOURCE_RUNNERS[key]
+            print(f"\n🔍 Lancement scraper: {label}")
+            pool.submit(_stream_source, key, runner, keywords, max_pages, stream, source_runs[key])
+
+        remaining = len(source_keys)
+        while remaining:
+            try:
+                key, kw, offer = stream.get(timeout=writer.time_until_flush())
+            except queue.Empty:
+                # Sources au ralenti : le lot en attente part sans attendre la prochaine offre
+                try:
+                    writer.flush_if_due()
+                except Exception as e:
+                    print(f"  ⚠️  Lot non enregistré, nouvel essai après backoff : {e}")
+                continue
+            run = source_runs[key]
+            try:
+                if offer is not _SOURCE_DONE:
+                    run.offers += 1
+                    writer.add(offer, kw, tag=key)
+                    continue
+                remaining -= 1
+                writer.flush()   # Toutes les offres de la source sont comptées
+            except Exception as e:
+                # Le lot refusé reste dans le writer : il repart au prochain flush
+                print(f"  ⚠️  Lot non enregistré, nouvel essai après backoff : {e}")
+                if offer is not _SOURCE_DONE:
+                    continue
+            if run.error:
+                print(f"  ❌ Erreur {run.label}: {run.error}")
+            else:
+                run.inserted = writer.inserted_by_tag.get(key, 0)
+                print(f"  ✅ {run.label}: {run.inserted} nouvelles offres "
+                      f"({run.offers} remontées en {run.duration_s:.1f}s)")
+
+    for key in source_keys:
+        run = source_runs[key]
+        if not run.error:
+            run.inserted = writer.inserted_by_tag.get(key, 0)   # Lots retentés à la sortie du writer compris
+        sources_scraped.append(f"{run.label}: erreur" if run.error else f"{run.label}: {run.inserted}")
+    if runs is not None:
+        runs.extend(source_runs.values())
+
+    new_by_keyword = {kw: writer.inserted_by_keyword.get(kw, 0) for kw in keywords}
+
+    # ── Mettre à jour le cache ──
+    for kw in keywords:
+        update_cache(db, kw, "all", new_by_keyword[kw])
+    db.commit()
+
+    return writer.inserted, new_by_keyword, sources_scraped
+
+
+def run_scrape(db: Session, search_query: str, sources: list[str] | None = None,
+               max_pages: int = 2) -> tuple[int, list[str]]:
+    """
+    Scrape `search_query` sur les sources demandées (toutes par défaut),
+    sauvegarde les offres et met à jour le cache.
+
+    Returns:
+        (nombre de nouvelles offres, résumé par source)
+    """
+    new_offers_count, _, sources_scraped = run_batch_scrape(db, [search_query], sources, max_pages)
+    return new_offers_count, sources_scraped
@@ -0,0 +1,446 @@
+"""
+Persistance en lot des offres scrapées.
+
+Remplace le save_offer() offre par offre (un SELECT + un objet ORM par
+offre) par un seul SELECT des offres déjà connues et un seul
+INSERT … ON CONFLICT(url_hash) DO UPDATE exécuté en executemany.
+La clé de dédoublonnage est le hash 64 bits de l'URL canonique
+(backend/scrapers/urls.py), pas la chaîne de l'URL.
+
+OfferWriter enchaîne ces upserts en flux : les offres sont commitées par
+lots pendant le scraping au lieu d'un seul commit en fin de run.
+"""
+
+import datetime
+import time
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from sqlalchemy import bindparam, delete, func, select, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from backend.contracts import contract_kind
+from backend.dates import parse_published_date
+from backend.dedup import assign_clusters
+from backend.geo import index_locations
+from backend.models import JobOffer, JobOfferArchive
+from backend.retention import restore_archived
+from backend.scrapers.urls import canonical_url, url_hash
+
+# SQLite limite le nombre de paramètres par requête : on découpe les IN (...)
+SELECT_CHUNK = 500
+
+
+@dataclass
+class UpsertResult:
+    inserted: int = 0
+    updated: int = 0
+    restored: int = 0   # Revenues de l'archive (comptées aussi dans updated)
+    skipped: int = 0    # Archivées dans un statut terminal : laissées dans l'archive
+    inserted_urls: set[str] = field(default_factory=set)
+
+
+def merge_search(existing: str | None, search_query: str) -> str:
+    """Ajoute les mots-clés de `search_query` ("a | b") à `existing` s'ils n'y sont pas."""
+    merged = existing or ""
+    for term in search_query.split(" | "):
+        if not term:
+            continue
+        if not merged:
+            merged = term
+        elif term.lower() not in merged.lower():
+            merged += f" | {term}"
+    return merged
+
+
+def offer_to_row(r, source: str, search_query: str) -> dict | None:
+    """Convertit une offre de scraper en ligne job_offers (None si pas d'URL)."""
+    url = canonical_url(getattr(r, "url", "") or "")
+    if not url:
+        return None
+    contract = getattr(r, "contrat", "") or getattr(r, "contract_type", "")
+    return {
+        "title": getattr(r, "titre", ""),
+        "company": getattr(r, "entreprise", ""),
+        "location": getattr(r, "lieu", ""),
+        "url": url,
+        "url_hash": url_hash(url),
+        "contract_type": contract,
+        "contract_kind": int(contract_kind(contract, getattr(r, "titre", ""))),
+        "published_date": getattr(r, "date_publication", ""),
+        "published_at": parse_published_date(getattr(r, "date_publication", ""),
+                                             anchor=getattr(r, "date_scraping", None)),
+        "source": source,
+        "status": "NEW",
+        "original_search": search_query,
+    }
+
+
+def upsert_rows(db: Session, rows: Iterable[dict]) -> UpsertResult:
+    """
+    Insère ou met à jour des lignes job_offers (clé : url_hash) en une passe.
+    Les nouvelles lignes sont insérées telles quelles, géocodées dans l'index
+    spatial (backend/geo.py) et rattachées à leur cluster de quasi-doublons
+    (backend/dedup.py) ; pour les URLs déjà en base, seuls les mots-clés de
+    recherche et last_seen_at sont mis à jour. Les URLs archivées passent par
+    backend/retention.py:restore_archived : une offre rejetée ou close n'est
+    pas réinsérée, une offre archivée pour ancienneté est restaurée.
+    Ne commit pas : c'est à l'appelant de le faire.
+    """
+    # Dédoublonner le lot lui-même en fusionnant les mots-clés
+    by_hash: dict[int, dict] = {}
+    for row in rows:
+        if row is None:
+            continue
+        key = row.get("url_hash") or url_hash(row["url"])
+        if key in by_hash:
+            kept = by_hash[key]
+            kept["original_search"] = merge_search(kept["original_search"], row["original_search"])
+        else:
+            by_hash[key] = {**row, "url_hash": key}
+
+    result = UpsertResult()
+    if not by_hash:
+        return result
+
+    now = datetime.datetime.utcnow()
+    for row in by_hash.values():
+        row.setdefault("last_seen_at", now)
+
+    def known(keys: list[int]) -> dict[int, str | None]:
+        searches = {}
+        for i in range(0, len(keys), SELECT_CHUNK):
+            searches.update(db.execute(
+                select(JobOffer.url_hash, JobOffer.original_search)
+                .where(JobOffer.url_hash.in_(keys[i:i + SELECT_CHUNK]))
+            ).all())
+        return searches
+
+    existing = known(list(by_hash))
+    restored, archived = restore_archived(db, [key for key in by_hash if key not in existing])
+    existing.update(known(list(restored)))
+    for key in archived:
+        del by_hash[key]
+    result.restored, result.skipped = len(restored), len(archived)
+    if not by_hash:
+        return result
+    hashes = list(by_hash)
+
+    for key, row in by_hash.items():
+        if key in existing:
+            row["original_search"] = merge_search(existing[key], row["original_search"])
+            result.updated += 1
+        else:
+            result.inserted += 1
+            result.inserted_urls.add(row["url"])
+
+    table = JobOffer.__table__
+    stmt = sqlite_insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.url_hash],
+        set_={"original_search": stmt.excluded.original_search,
+              "last_seen_at": stmt.excluded.last_seen_at,
+              # Une date relative ré-ancrée à chaque scraping dériverait : on garde la première
+              "published_at": func.coalesce(table.c.published_at, stmt.excluded.published_at)},
+    )
+    db.execute(stmt, list(by_hash.values()))
+
+    new_hashes = [key for key in hashes if key not in existing]
+    new_ids = []
+    for i in range(0, len(new_hashes), SELECT_CHUNK):
+        new_ids += db.scalars(
+            select(JobOffer.id).where(JobOffer.url_hash.in_(new_hashes[i:i + SELECT_CHUNK]))
+        ).all()
+    # Les offres restaurées ont quitté les index à l'archivage
+    new_ids = sorted(new_ids + list(restored.values()))
+    if new_ids:
+        index_locations(db, new_ids)
+        assign_clusters(db, new_ids)
+    return result
+
+
+def bulk_upsert_offers(db: Session, offers: Iterable, search_query: str,
+                       source: str | None = None) -> UpsertResult:
+    """
+    Persiste tous les résultats d'une source en une seule passe.
+
+    Args:
+        offers: Offres du scraper (JobOffer des scrapers)
+        search_query: Mot(s)-clé(s) ayant produit ces offres
+        source: Source à enregistrer (par défaut, l'attribut `source` de chaque offre)
+    """
+    return upsert_rows(db, (offer_to_row(r, source or r.source, search_query) for r in offers))
+
+
+def backfill_url_hashes(db: Session) -> int:
+    """
+    Migration : canonicalise les URLs et calcule url_hash des lignes qui n'en
+    ont pas encore (bases antérieures à la colonne). Les lignes devenues
+    doublons d'une autre sont fusionnées dans la première (mots-clés) puis supprimées.
+
+    Returns:
+        Nombre de lignes migrées
+    """
+    # L'ancien index unique sur la chaîne de l'URL est remplacé par celui sur url_hash
+    db.execute(text("DROP INDEX IF EXISTS ix_job_offers_url"))
+    db.execute(text("DROP INDEX IF EXISTS ix_job_offers_archive_url"))
+
+    migrated = 0
+    for model, key in ((JobOffer, JobOffer.id), (JobOfferArchive, JobOfferArchive.archive_id)):
+        pending = db.execute(
+            select(key, model.url, model.original_search).where(model.url_hash.is_(None)).order_by(key)
+        ).all()
+        if not pending:
+            continue
+        known: dict[int, int] = {}
+        searches: dict[int, str | None] = {}
+        for h, row_id, search in db.execute(
+            select(model.url_hash, key, model.original_search).where(model.url_hash.is_not(None))
+        ):
+            known[h], searches[row_id] = row_id, search
+
+        hashed: dict[int, dict] = {}
+        deletes, merged = [], set()
+        for row_id, url, search in pending:
+            canonical = canonical_url(url or "") or f"offer:{row_id}"
+            h = url_hash(canonical)
+            if h in known:
+                kept = known[h]
+                searches[kept] = merge_search(searches[kept], search or "")
+                merged.add(kept)
+                deletes.append(row_id)
+                continue
+            known[h], searches[row_id] = row_id, search
+            hashed[row_id] = {"_id": row_id, "url": canonical, "url_hash": h}
+
+        table = model.__table__
+        if deletes:
+            db.execute(delete(table).where(key.in_(deletes)))
+        if hashed:
+            db.execute(
+                update(table).where(table.c[key.name] == bindparam("_id"))
+                .values(url=bindparam("url"), url_hash=bindparam("url_hash")),
+                list(hashed.values()),
+            )
+        if merged:
+            db.execute(
+                update(table).where(table.c[key.name] == bindparam("_id"))
+                .values(original_search=bindparam("search")),
+                [{"_id": row_id, "search": searches[row_id]} for row_id in merged],
+            )
+        migrated += len(pending)
+    db.commit()
+    return migrated
+
+
+def backfill_published_at(db: Session) -> int:
+    """
+    Migration : remplit published_at des lignes qui ont un published_date
+    lisible, en ancrant les dates relatives sur created_at.
+
+    Returns:
+        Nombre de lignes datées
+    """
+    dated = 0
+    for model in (JobOffer, JobOfferArchive):
+        table = model.__table__
+        key = table.primary_key.columns.values()[0]
+        updates = []
+        for row_id, text_date, created_at in db.execute(
+            select(key, table.c.published_date, table.c.created_at)
+            .where(table.c.published_at.is_(None), table.c.published_date.is_not(None),
+                   table.c.published_date != "")
+        ):
+            parsed = parse_published_date(text_date, anchor=created_at)
+            if parsed:
+                updates.append({"_id": row_id, "published_at": parsed})
+        if updates:
+            db.execute(
+                update(table).where(key == bindparam("_id")).values(published_at=bindparam("published_at")),
+                updates,
+            )
+        dated += len(updates)
+    db.commit()
+    return dated
+
+
+def backfill_contract_kinds(db: Session) -> int:
+    """
+    Migration : calcule contract_kind des lignes qui n'en ont pas encore.
+
+    Returns:
+        Nombre de lignes classées
+    """
+    classified = 0
+    for model in (JobOffer, JobOfferArchive):
+        table = model.__table__
+        key = table.primary_key.columns.values()[0]
+        updates = [
+            {"_id": row_id, "contract_kind": int(contract_kind(contract, title))}
+            for row_id, contract, title in db.execute(
+                select(key, table.c.contract_type, table.c.title).where(table.c.contract_kind.is_(None))
+            )
+        ]
+        if updates:
+            db.execute(
+                update(table).where(key == bindparam("_id")).values(contract_kind=bindparam("contract_kind")),
+                updates,
+            )
+        classified += len(updates)
+    db.commit()
+    return classified
+
+
+# ─── Étape de persistance en flux ─────────────────────────────────────────────
+
+@dataclass
+class BatchReport:
+    """Résultat d'un commit de lot."""
+    index: int
+    size: int
+    inserted: int
+    updated: int
+    duration_ms: float
+
+
+def print_batch(report: BatchReport):
+    print(f"  💾 Lot {report.index} : {report.inserted} nouvelles, {report.updated} mises à jour "
+          f"({report.size} offres, {report.duration_ms:.0f} ms)")
+
+
+class OfferWriter:
+    """
+    Consomme les offres au fil de l'eau et les commit par lots.
+
+    Un lot part dès qu'il atteint `batch_size` offres ou que `max_interval_s`
+    s'est écoulé depuis le dernier commit. add() ne voit passer le temps
+    qu'à l'arrivée d'une offre : quand le flux s'arrête (backoff, page lente,
+    source en pause), l'appelant appelle flush_if_due() pendant l'attente,
+    au plus tard après time_until_flush(). Chaque lot utilise sa propre
+    session, ouverte juste le temps de l'upsert : le verrou d'écriture SQLite
+    n'est tenu que quelques millisecondes et, tant que la base accepte les
+    commits, la mémoire reste bornée à un lot.
+
+    Un lot refusé par la base (« database is locked »…) reste en attente :
+    l'erreur remonte, puis le lot repart après un backoff exponentiel
+    (retry_delay_s, doublé à chaque échec, borné à max_retry_delay_s), au
+    plus tard à la sortie du bloc with, qui retente max_attempts fois.
+
+    Usage:
+        with OfferWriter(SessionLocal) as writer:
+            for offer in offers:
+                writer.add(offer, "data", tag="edf")
+        writer.inserted_by_tag   # nouvelles offres par source
+    """
+
+    def __init__(self, session_factory, batch_size: int = 200, max_interval_s: float = 5.0,
+                 on_batch=print_batch, retry_delay_s: float = 0.5, max_retry_delay_s: float = 30.0,
+                 max_attempts: int = 5):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.max_interval_s = max_interval_s
+        self.on_batch = on_batch
+        self.retry_delay_s = retry_delay_s
+        self.max_retry_delay_s = max_retry_delay_s
+        self.max_attempts = max_attempts
+        self.pending: list[tuple[dict, str | None]] = []
+        self.batches = 0    # Lots commités (compteurs agrégés : pas d'historique des lots)
+        self.failures = 0   # Échecs consécutifs du lot en attente
+        self.inserted = 0
+        self.updated = 0
+        self.inserted_by_tag: dict[str, int] = {}
+        self.inserted_by_keyword: dict[str, int] = {}
+        self._last_flush = time.monotonic()
+        self._retry_at = 0.0
+
+    def add(self, offer, search_query: str, source: str | None = None, tag: str | None = None):
+        """Ajoute une offre ; déclenche un commit si le lot est plein ou trop ancien."""
+        row = offer_to_row(offer, source or offer.source, search_query)
+        if row is None:
+            return
+        self.pending.append((row, tag))
+        if self.failures:
+            if time.monotonic() >= self._retry_at:
+                self.flush()
+        elif (len(self.pending) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.max_interval_s):
+            self.flush()
+
+    def time_until_flush(self) -> float | None:
+        """Secondes avant que le lot en attente ne soit dû (None : rien en attente)."""
+        if not self.pending:
+            return None
+        due = self._retry_at if self.failures else self._last_flush + self.max_interval_s
+        return max(0.0, due - time.monotonic())
+
+    def flush_if_due(self) -> BatchReport | None:
+        """Commit le lot en attente s'il attend depuis plus de max_interval_s (ou si son backoff est écoulé)."""
+        if self.time_until_flush() == 0.0:
+            return self.flush()
+        return None
+
+    def flush(self) -> BatchReport | None:
+        """Commit le lot en attente. En cas d'échec, le lot est gardé pour un nouvel essai."""
+        self._last_flush = time.monotonic()
+        if not self.pending:
+            return None
+
+        pending = self.pending
+        start = time.perf_counter()
+        db = self.session_factory()
+        try:
+            result = upsert_rows(db, (row for row, _ in pending))
+            db.commit()
+        except Exception:
+            db.rollback()
+            self.failures += 1
+            delay = min(self.retry_delay_s * 2 ** (self.failures - 1), self.max_retry_delay_s)
+            self._retry_at = time.monotonic() + delay
+            raise
+        finally:
+            db.close()
+        self.pending, self.failures = [], 0
+
+        # Attribuer chaque nouvelle offre à sa première source et à chacun de ses mots-clés
+        credited: set[tuple[str, str | None]] = set()
+        for row, tag in pending:
+            url = row["url"]
+            if url not in result.inserted_urls:
+                continue
+            if (url, None) not in credited:
+                credited.add((url, None))
+                if tag is not None:
+                    self.inserted_by_tag[tag] = self.inserted_by_tag.get(tag, 0) + 1
+            for kw in row["original_search"].split(" | "):
+                if (url, kw) not in credited:
+                    credited.add((url, kw))
+                    self.inserted_by_keyword[kw] = self.inserted_by_keyword.get(kw, 0) + 1
+
+        self.inserted += result.inserted
+        self.updated += result.updated
+        self.batches += 1
+        report = BatchReport(
+            index=self.batches,
+            size=len(pending),
+            inserted=result.inserted,
+            updated=result.updated,
+            duration_ms=(time.perf_counter() - start) * 1000,
+        )
+        if self.on_batch:
+            self.on_batch(report)
+        return report
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        # Même en cas d'erreur du scraper, ce qui a été collecté est sauvegardé
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                self.flush()
+                return
+            except Exception:
+                if attempt == self.max_attempts:
+                    raise
+                time.sleep(self.time_until_flush() or 0)
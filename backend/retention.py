@@ -0,0 +1,250 @@
+"""
+🗄️ Job Hunter OS — Rétention des offres
+=======================================
+job_offers ne fait que grossir : les offres retirées des sites restent en
+base et ralentissent chaque liste, chaque count et chaque ilike. Ce module
+déplace vers job_offers_archive (même schéma) :
+
+    - les offres non revues depuis `max_age_days` jours (last_seen_at, mis à
+      jour à chaque upsert), sauf celles que l'utilisateur suit (SELECTED,
+      PREPARED, APPLIED)
+    - les offres dans un statut terminal (REJECTED, CLOSED)
+
+Une offre archivée que le scraping revoit (backend/persistence.py:upsert_rows)
+ne revient pas comme NEW : un rejet reste dans l'archive, une offre archivée
+pour ancienneté retrouve job_offers avec son id et son statut.
+
+Le déplacement se fait par lots de `chunk_size`, chacun dans sa propre
+transaction courte : l'API et le scraping continuent d'écrire entre deux lots.
+La table chaude reste assez petite pour tenir dans le cache de pages.
+L'API relit l'archive sur demande (GET /api/jobs?include_archived=true).
+
+Deux modes de fonctionnement :
+    - dans le process de l'API (JOB_HUNTER_RETENTION=1 au démarrage d'uvicorn)
+    - en ligne de commande (cron)
+
+Usage:
+    python -m backend.retention                  # un passage
+    python -m backend.retention --days 60        # seuil d'ancienneté
+    python -m backend.retention --dry-run        # compter sans déplacer
+"""
+
+import argparse
+import datetime
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import and_, case, delete, func, insert, literal, null, or_, select
+from sqlalchemy.orm import Session
+
+from backend.database import SessionLocal, init_db
+from backend.dedup import forget_offers
+from backend.geo import forget_locations
+from backend.models import JobOffer, JobOfferArchive
+from backend.workflow import TERMINAL_STATUSES, TRACKED_STATUSES
+
+
+CHUNK = 500   # Taille des IN (...) (limite de paramètres SQLite)
+
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+@dataclass
+class RetentionConfig:
+    max_age_days: float = 30
+    chunk_size: int = 500
+    pause_s: float = 0.05        # Pause entre deux lots pour laisser passer les écrivains
+    interval_s: float = 6 * 3600
+
+    @classmethod
+    def from_env(cls) -> "RetentionConfig":
+        config = cls()
+        if os.getenv("JOB_HUNTER_RETENTION_DAYS"):
+            config.max_age_days = float(os.environ["JOB_HUNTER_RETENTION_DAYS"])
+        if os.getenv("JOB_HUNTER_RETENTION_INTERVAL"):
+            config.interval_s = float(os.environ["JOB_HUNTER_RETENTION_INTERVAL"])
+        return config
+
+
+def expired_condition(config: RetentionConfig, now: datetime.datetime):
+    """Clause WHERE des offres à archiver."""
+    cutoff = now - datetime.timedelta(days=config.max_age_days)
+    # Les lignes antérieures à last_seen_at n'ont que created_at
+    last_seen = func.coalesce(JobOffer.last_seen_at, JobOffer.created_at)
+    return or_(
+        JobOffer.status.in_(TERMINAL_STATUSES),
+        and_(
+            last_seen < cutoff,
+            or_(JobOffer.status.is_(None), JobOffer.status.not_in(TRACKED_STATUSES)),
+        ),
+    )
+
+
+def count_expired(db: Session, config: RetentionConfig, now: datetime.datetime | None = None) -> int:
+    now = now or datetime.datetime.utcnow()
+    return db.scalar(select(func.count()).select_from(JobOffer).where(expired_condition(config, now)))
+
+
+# ─── Déplacement par lots ─────────────────────────────────────────────────────
+
+def archive_chunk(db: Session, config: RetentionConfig, now: datetime.datetime | None = None) -> int:
+    """
+    Déplace au plus `chunk_size` offres expirées dans l'archive et commit.
+    Une URL déjà archivée (offre réapparue puis ré-expirée) est remplacée.
+
+    Returns:
+        Nombre d'offres déplacées (0 quand il n'y a plus rien à archiver)
+    """
+    now = now or datetime.datetime.utcnow()
+    ids = db.scalars(
+        select(JobOffer.id).where(expired_condition(config, now))
+        .order_by(JobOffer.id).limit(config.chunk_size)
+    ).all()
+    if not ids:
+        return 0
+
+    hot = JobOffer.__table__
+    names = [c.name for c in hot.columns]
+    try:
+        db.execute(
+            insert(JobOfferArchive.__table__).prefix_with("OR REPLACE").from_select(
+                names + ["archived_at"],
+                select(*hot.columns, literal(now)).where(hot.c.id.in_(ids)),
+            )
+        )
+        db.execute(delete(hot).where(hot.c.id.in_(ids)))
+        forget_offers(db, ids)
+        forget_locations(db, ids)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(ids)
+
+
+def archive_expired(session_factory=SessionLocal, config: RetentionConfig | None = None,
+                    now: datetime.datetime | None = None, stop: threading.Event | None = None) -> int:
+    """Archive toutes les offres expirées, lot par lot. Retourne le nombre déplacé."""
+    config = config or RetentionConfig.from_env()
+    now = now or datetime.datetime.utcnow()
+    moved = 0
+    db = session_factory()
+    try:
+        while not (stop and stop.is_set()):
+            count = archive_chunk(db, config, now)
+            if not count:
+                break
+            moved += count
+            time.sleep(config.pause_s)
+    finally:
+        db.close()
+    return moved
+
+
+# ─── Retour des offres revues ─────────────────────────────────────────────────
+
+def restore_archived(db: Session, hashes: list[int]) -> tuple[dict[int, int], set[int]]:
+    """
+    Traite les offres archivées que le scraping revoit (clé : url_hash, absentes
+    de job_offers). Celles dans un statut terminal restent dans l'archive ; les
+    autres reviennent dans job_offers avec leur id, leur statut et leurs
+    mots-clés. Ne commit pas.
+
+    Returns:
+        ({url_hash: id} des offres restaurées, url_hash des offres à ne pas réinsérer)
+    """
+    archive, hot = JobOfferArchive.__table__, JobOffer.__table__
+    restorable, terminal = [], set()
+    for i in range(0, len(hashes), CHUNK):
+        for key, status in db.execute(
+            select(archive.c.url_hash, archive.c.status).where(archive.c.url_hash.in_(hashes[i:i + CHUNK]))
+        ):
+            if status in TERMINAL_STATUSES:
+                terminal.add(key)
+            else:
+                restorable.append(key)
+
+    restored: dict[int, int] = {}
+    # Un id réattribué avant AUTOINCREMENT (database.ensure_autoincrement) est remplacé
+    free_id = case((archive.c.id.in_(select(hot.c.id)), null()), else_=archive.c.id)
+    columns = [
+        free_id if c.name == "id" else null() if c.name == "duplicate_cluster_id" else archive.c[c.name]
+        for c in hot.columns
+    ]
+    for i in range(0, len(restorable), CHUNK):
+        chunk = restorable[i:i + CHUNK]
+        db.execute(insert(hot).from_select([c.name for c in hot.columns],
+                                           select(*columns).where(archive.c.url_hash.in_(chunk))))
+        db.execute(delete(archive).where(archive.c.url_hash.in_(chunk)))
+        restored.update(db.execute(select(hot.c.url_hash, hot.c.id).where(hot.c.url_hash.in_(chunk))).all())
+    return restored, terminal
+
+
+# ─── Tâche de fond ────────────────────────────────────────────────────────────
+
+class RetentionJob:
+    """Archive périodiquement les offres expirées dans un thread démon."""
+
+    def __init__(self, config: RetentionConfig | None = None, session_factory=SessionLocal):
+        self.config = config or RetentionConfig.from_env()
+        self.session_factory = session_factory
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> int:
+        moved = archive_expired(self.session_factory, self.config, stop=self._stop)
+        if moved:
+            print(f"🗄️  {moved} offres archivées")
+        return moved
+
+    def run_forever(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"  ❌ Erreur de rétention : {e}")
+            self._stop.wait(self.config.interval_s)
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="retention", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+
+# ─── Point d'entrée ──────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="🗄️ Archivage des offres expirées")
+    parser.add_argument("--days", type=float, default=None, help="Ancienneté maximale (jours sans être revue)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="Offres déplacées par transaction")
+    parser.add_argument("--dry-run", action="store_true", help="Compter les offres sans les déplacer")
+    args = parser.parse_args()
+
+    init_db()
+    config = RetentionConfig.from_env()
+    if args.days is not None:
+        config.max_age_days = args.days
+    if args.chunk_size is not None:
+        config.chunk_size = args.chunk_size
+
+    if args.dry_run:
+        db = SessionLocal()
+        try:
+            print(f"🗄️  {count_expired(db, config)} offres seraient archivées")
+        finally:
+            db.close()
+        return
+
+    moved = archive_expired(SessionLocal, config)
+    print(f"\n✅ {moved} offres archivées")
+
+
+if __name__ == "__main__":
+    main()
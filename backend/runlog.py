@@ -0,0 +1,234 @@
+"""
+🧾 Job Hunter OS — Journal des lancements de scraping (JSONL gzip)
+==================================================================
+Historique de tout ce que les scrapers en ligne de commande ont remonté,
+en remplacement des resultats_<source>.csv / .json réécrits à chaque
+lancement. Le journal est en ajout seul :
+
+    data/runs/
+        runs.jsonl.gz                        ← journal courant
+        runs-20260302T101500.123456.jsonl.gz ← journaux tournés (taille > max_bytes)
+
+Chaque lancement ajoute un membre gzip au fichier courant (un fichier gzip
+multi-membres se relit d'un bloc) contenant une ligne JSON par enregistrement :
+
+    {"type": "run", "run_id": …, "source": "edf", "keywords": […], "started_at": …, …}
+    {"type": "offer", "run_id": …, "keyword": "data", "titre": …, "url": …, …}
+    {"type": "end", "run_id": …, "offers": 42, "duration_s": 81.3}
+
+Les offres sont écrites une à une (jamais toute la liste en mémoire) et
+relues en flux par read_records() / read_offers(). Un lancement interrompu
+n'a pas de ligne "end" ; un membre tronqué par un arrêt brutal est ignoré
+à la lecture, et le lancement suivant repart d'un nouveau fichier (rien
+n'est ajouté derrière un membre tronqué). Un seul processus écrit dans un
+dossier à la fois.
+
+Usage:
+    python -m backend.runlog                    # derniers lancements
+    python -m backend.runlog --source edf       # lancements d'une source
+    python -m backend.runlog --run <run_id>     # offres d'un lancement (JSON Lines)
+"""
+
+import argparse
+import datetime
+import glob
+import gzip
+import json
+import os
+import sys
+import time
+import uuid
+import zlib
+from dataclasses import asdict, is_dataclass
+
+from backend.database import DATA_DIR
+
+RUNLOG_DIR = os.getenv("JOB_HUNTER_RUNLOG_DIR", os.path.join(DATA_DIR, "runs"))
+CURRENT_NAME = "runs.jsonl.gz"
+MAX_BYTES = 16 * 1024 * 1024   # Taille compressée avant rotation
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now()
+
+
+def _offer_fields(offer) -> dict:
+    if is_dataclass(offer):
+        return asdict(offer)
+    return dict(vars(offer))
+
+
+class RunWriter:
+    """Un lancement ouvert dans le journal (voir RunLog.run)."""
+
+    def __init__(self, stream, run_id: str, marker: str):
+        self._stream = stream
+        self._marker = marker
+        self.run_id = run_id
+        self.offers = 0
+        self._started = time.perf_counter()
+
+    def _write(self, record: dict):
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+        self._stream.write(line.encode("utf-8") + b"\n")
+
+    def write(self, keyword: str, offer, **extra):
+        """Ajoute une offre (JobOffer des scrapers ou objet équivalent), avec des champs en plus."""
+        self._write({"type": "offer", "run_id": self.run_id, "keyword": keyword, **_offer_fields(offer), **extra})
+        self.offers += 1
+
+    def close(self, error: str | None = None):
+        end = {"type": "end", "run_id": self.run_id, "offers": self.offers,
+               "duration_s": round(time.perf_counter() - self._started, 3)}
+        if error:
+            end["error"] = error
+        self._write(end)
+        self._stream.close()
+        os.remove(self._marker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(f"{exc_type.__name__}: {exc}" if exc_type else None)
+
+
+class RunLog:
+    """
+    Journal en ajout seul d'un dossier.
+
+    Usage:
+        with RunLog().run("edf", ["data"], pages=2) as log:
+            for keyword, offer in scraper.iter_offers(["data"], 2):
+                log.write(keyword, offer)
+    """
+
+    def __init__(self, directory: str = RUNLOG_DIR, max_bytes: int = MAX_BYTES, compresslevel: int = 6):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.compresslevel = compresslevel
+
+    @property
+    def current_path(self) -> str:
+        return os.path.join(self.directory, CURRENT_NAME)
+
+    @property
+    def marker_path(self) -> str:
+        """Présent pendant un lancement : s'il reste, le lancement a été coupé net."""
+        return self.current_path + ".open"
+
+    def rotate_if_needed(self) -> str | None:
+        """
+        Tourne le journal courant s'il dépasse max_bytes ou si le dernier
+        lancement ne s'est pas terminé (membre gzip tronqué). Retourne le nouveau nom.
+        """
+        path = self.current_path
+        interrupted = os.path.exists(self.marker_path)
+        if not os.path.exists(path) or (os.path.getsize(path) < self.max_bytes and not interrupted):
+            if interrupted:
+                os.remove(self.marker_path)
+            return None
+        # Horodatage de largeur fixe : l'ordre alphabétique est l'ordre chronologique
+        rotated = os.path.join(self.directory, f"runs-{_now().strftime('%Y%m%dT%H%M%S.%f')}.jsonl.gz")
+        os.replace(path, rotated)
+        if interrupted:
+            os.remove(self.marker_path)
+        return rotated
+
+    def run(self, source: str, keywords: list[str], **meta) -> RunWriter:
+        """Ouvre un lancement : un nouveau membre gzip en fin de journal."""
+        os.makedirs(self.directory, exist_ok=True)
+        self.rotate_if_needed()
+        open(self.marker_path, "w").close()
+        stream = gzip.open(self.current_path, "ab", compresslevel=self.compresslevel)
+        writer = RunWriter(stream, uuid.uuid4().hex[:12], self.marker_path)
+        writer._write({"type": "run", "run_id": writer.run_id, "source": source, "keywords": list(keywords),
+                       "started_at": _now().isoformat(timespec="seconds"), **meta})
+        return writer
+
+
+# ─── Lecture ──────────────────────────────────────────────────────────────────
+
+def log_files(directory: str = RUNLOG_DIR) -> list[str]:
+    """Journaux du plus ancien au plus récent (le courant en dernier)."""
+    rotated = sorted(glob.glob(os.path.join(directory, "runs-*.jsonl.gz")))
+    current = os.path.join(directory, CURRENT_NAME)
+    return rotated + ([current] if os.path.exists(current) else [])
+
+
+def _iter_lines(path: str):
+    try:
+        with gzip.open(path, "rb") as f:
+            for line in f:
+                if line.endswith(b"\n"):
+                    yield line
+    except (EOFError, zlib.error, gzip.BadGzipFile):
+        # Dernier membre tronqué (lancement coupé net) : les lignes complètes ont été lues
+        return
+
+
+def read_records(directory: str = RUNLOG_DIR, source: str | None = None,
+                 run_id: str | None = None, types: tuple[str, ...] | None = None):
+    """Enregistrements du journal, en flux, dans l'ordre d'écriture."""
+    sources: dict[str, str] = {}   # run_id → source, pour filtrer offres et fins de lancement
+    for path in log_files(directory):
+        for line in _iter_lines(path):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            rid = record.get("run_id")
+            if record.get("type") == "run":
+                sources[rid] = record.get("source")
+            if source is not None and sources.get(rid) != source:
+                continue
+            if run_id is not None and rid != run_id:
+                continue
+            if types is not None and record.get("type") not in types:
+                continue
+            yield record
+
+
+def read_offers(directory: str = RUNLOG_DIR, source: str | None = None, run_id: str | None = None):
+    """Offres du journal (dict), en flux."""
+    return read_records(directory, source, run_id, types=("offer",))
+
+
+def list_runs(directory: str = RUNLOG_DIR, source: str | None = None) -> list[dict]:
+    """Un résumé par lancement : métadonnées de début, plus la ligne "end" si elle existe."""
+    runs: dict[str, dict] = {}
+    for record in read_records(directory, source, types=("run", "end")):
+        if record["type"] == "run":
+            runs[record["run_id"]] = {**record, "offers": None}
+        elif record["run_id"] in runs:
+            runs[record["run_id"]].update(offers=record["offers"], duration_s=record["duration_s"],
+                                          error=record.get("error"))
+    return list(runs.values())
+
+
+# ─── Point d'entrée ──────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="🧾 Journal des lancements de scraping")
+    parser.add_argument("--dir", default=RUNLOG_DIR, help=f"Dossier du journal (défaut: {RUNLOG_DIR})")
+    parser.add_argument("--source", default=None, help="Filtrer sur une source")
+    parser.add_argument("--run", default=None, help="Afficher les offres d'un lancement (JSON Lines)")
+    parser.add_argument("--last", type=int, default=20, help="Nombre de lancements listés (défaut: 20)")
+    args = parser.parse_args()
+
+    if args.run:
+        for offer in read_offers(args.dir, args.source, args.run):
+            sys.stdout.write(json.dumps(offer, ensure_ascii=False) + "\n")
+        return
+
+    runs = list_runs(args.dir, args.source)
+    print(f"🧾 {len(runs)} lancements dans {args.dir}\n")
+    for run in runs[-args.last:]:
+        offers = "interrompu" if run["offers"] is None else f"{run['offers']} offres"
+        status = f" ❌ {run['error']}" if run.get("error") else ""
+        print(f"  {run['started_at']}  {run['run_id']}  {run['source']:15s} {offers:>12s}  "
+              f"{', '.join(k or '(toutes)' for k in run['keywords'])}{status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+⏰ Job Hunter OS — Rafraîchissement planifié des mots-clés surveillés
+=====================================================================
+Chaque mot-clé déjà recherché est enregistré dans ScrapeCache. Ce
+planificateur les re-scrape en arrière-plan, hors du chemin des requêtes,
+pour que l'utilisateur tombe sur un cache frais au lieu d'attendre.
+
+    - Priorité : ancienneté du dernier scraping × (rendement historique + demande)
+    - Fenêtres creuses : on ne scrape que dans les plages horaires configurées
+    - Budget par hôte : nombre maximal de pages par site et par jour
+
+Deux modes de fonctionnement :
+    - dans le process de l'API (JOB_HUNTER_SCHEDULER=1 au démarrage d'uvicorn)
+    - en worker séparé (voir ci-dessous)
+
+Usage:
+    python -m backend.scheduler                # boucle continue
+    python -m backend.scheduler --once         # un seul cycle (cron)
+    python -m backend.scheduler --once --force # ignorer la fenêtre creuse
+"""
+
+import argparse
+import datetime
+import math
+import os
+import threading
+from dataclasses import dataclass, field
+
+from sqlalchemy import func
+
+from backend.database import SessionLocal, init_db
+from backend.models import ScrapeCache
+from backend.orchestrator import SOURCE_HOSTS, SOURCE_RUNNERS, run_scrape
+
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+def parse_windows(spec: str) -> list[tuple[int, int]]:
+    """Parse "22-7,12-14" en [(22, 7), (12, 14)] (heures locales, fin exclue)."""
+    windows = []
+    for part in spec.split(","):
+        if part.strip():
+            start, end = part.split("-")
+            windows.append((int(start), int(end)))
+    return windows
+
+
+@dataclass
+class SchedulerConfig:
+    interval_s: float = 900               # Délai entre deux cycles
+    refresh_after_hours: float = 18       # Re-scraper avant l'expiration du cache (24 h)
+    windows: list[tuple[int, int]] = field(default_factory=lambda: [(22, 7)])
+    max_keywords_per_cycle: int = 5
+    max_pages: int = 2
+    host_daily_budget: int = 40           # Pages par hôte et par jour
+    yield_weight: float = 0.5
+    demand_weight: float = 1.0
+
+    @classmethod
+    def from_env(cls) -> "SchedulerConfig":
+        config = cls()
+        if os.getenv("JOB_HUNTER_REFRESH_WINDOWS"):
+            config.windows = parse_windows(os.environ["JOB_HUNTER_REFRESH_WINDOWS"])
+        if os.getenv("JOB_HUNTER_REFRESH_INTERVAL"):
+            config.interval_s = float(os.environ["JOB_HUNTER_REFRESH_INTERVAL"])
+        if os.getenv("JOB_HUNTER_HOST_BUDGET"):
+            config.host_daily_budget = int(os.environ["JOB_HUNTER_HOST_BUDGET"])
+        return config
+
+
+def in_window(now: datetime.datetime, windows: list[tuple[int, int]]) -> bool:
+    """True si l'heure courante tombe dans l'une des fenêtres (gère le passage de minuit)."""
+    hour = now.hour
+    for start, end in windows:
+        if start <= end and start <= hour < end:
+            return True
+        if start > end and (hour >= start or hour < end):
+            return True
+    return False
+
+
+def keyword_priority(last_scraped_at: datetime.datetime, offers_found: int,
+                     requests_count: int, now: datetime.datetime,
+                     config: SchedulerConfig) -> float:
+    """Score de rafraîchissement : plus c'est vieux, productif et demandé, plus c'est haut."""
+    age_hours = (now - last_scraped_at).total_seconds() / 3600
+    staleness = age_hours / config.refresh_after_hours
+    return staleness * (
+        1
+        + config.yield_weight * math.log1p(offers_found or 0)
+        + config.demand_weight * math.log1p(requests_count or 0)
+    )
+
+
+# ─── Budget par hôte ──────────────────────────────────────────────────────────
+
+class HostBudget:
+    """Compte les pages demandées à chaque hôte ; remis à zéro chaque jour."""
+
+    def __init__(self, daily_pages: int):
+        self.daily_pages = daily_pages
+        self.day: datetime.date | None = None
+        self.used: dict[str, int] = {}
+
+    def _roll(self, today: datetime.date):
+        if today != self.day:
+            self.day = today
+            self.used = {}
+
+    def remaining(self, host: str, today: datetime.date) -> int:
+        self._roll(today)
+        return self.daily_pages - self.used.get(host, 0)
+
+    def consume(self, host: str, pages: int, today: datetime.date):
+        self._roll(today)
+        self.used[host] = self.used.get(host, 0) + pages
+
+
+# ─── Planificateur ────────────────────────────────────────────────────────────
+
+class RefreshScheduler:
+    """Rafraîchit en tâche de fond les mots-clés de ScrapeCache les plus prioritaires."""
+
+    def __init__(self, config: SchedulerConfig | None = None,
+                 session_factory=SessionLocal, scrape=run_scrape):
+        self.config = config or SchedulerConfig.from_env()
+        self.session_factory = session_factory
+        self.scrape = scrape
+        self.budget = HostBudget(self.config.host_daily_budget)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def due_keywords(self, db, now: datetime.datetime) -> list[tuple[str, float]]:
+        """Mots-clés à rafraîchir, du plus prioritaire au moins prioritaire."""
+        cutoff = now - datetime.timedelta(hours=self.config.refresh_after_hours)
+        rows = (
+            db.query(
+                ScrapeCache.keyword,
+                func.max(ScrapeCache.last_scraped_at),
+                func.sum(ScrapeCache.offers_found),
+                func.sum(ScrapeCache.requests_count),
+            )
+            .group_by(ScrapeCache.keyword)
+            .having(func.max(ScrapeCache.last_scraped_at) < cutoff)
+            .all()
+        )
+        ranked = [
+            (keyword, keyword_priority(last, found, requests, now, self.config))
+            for keyword, last, found, requests in rows
+        ]
+        ranked.sort(key=lambda item: item[1], reverse=True)
+        return ranked
+
+    def sources_within_budget(self, today: datetime.date) -> list[str]:
+        return [
+            key for key in SOURCE_RUNNERS
+            if self.budget.remaining(SOURCE_HOSTS[key], today) >= self.config.max_pages
+        ]
+
+    def run_once(self, now: datetime.datetime | None = None, force: bool = False) -> list[str]:
+        """Exécute un cycle. Retourne les mots-clés rafraîchis."""
+        local_now = now or datetime.datetime.now()
+        now = now or datetime.datetime.utcnow()
+        if not force and not in_window(local_now, self.config.windows):
+            return []
+
+        refreshed = []
+        db = self.session_factory()
+        try:
+            for keyword, priority in self.due_keywords(db, now)[:self.config.max_keywords_per_cycle]:
+                sources = self.sources_within_budget(now.date())
+                if not sources:
+                    print("⏰ Budget journalier épuisé pour tous les hôtes")
+                    break
+                print(f"\n⏰ Rafraîchissement '{keyword}' (priorité {priority:.2f}, "
+                      f"{len(sources)} sources)")
+                self.scrape(db, keyword, sources=sources, max_pages=self.config.max_pages)
+                for key in sources:
+                    self.budget.consume(SOURCE_HOSTS[key], self.config.max_pages, now.date())
+                refreshed.append(keyword)
+        finally:
+            db.close()
+        return refreshed
+
+    def run_forever(self, force: bool = False):
+        """Enchaîne les cycles jusqu'à stop()."""
+        while not self._stop.is_set():
+            try:
+                self.run_once(force=force)
+            except Exception as e:
+                print(f"  ❌ Erreur du planificateur : {e}")
+            self._stop.wait(self.config.interval_s)
+
+    def start(self):
+        """Lance le planificateur dans un thread démon."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="refresh-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+
+# ─── Point d'entrée ──────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="⏰ Rafraîchissement des mots-clés surveillés")
+    parser.add_argument("--once", action="store_true", help="Un seul cycle puis sortie")
+    parser.add_argument("--force", action="store_true", help="Ignorer les fenêtres creuses")
+    args = parser.parse_args()
+
+    init_db()
+    scheduler = RefreshScheduler()
+    if args.once:
+        refreshed = scheduler.run_once(force=args.force)
+        print(f"\n✅ {len(refreshed)} mot(s)-clé(s) rafraîchi(s)")
+        return
+
+    print(f"⏰ Planificateur démarré (cycle toutes les {scheduler.config.interval_s:.0f}s)")
+    scheduler.run_forever(force=args.force)
+
+
+if __name__ == "__main__":
+    main()
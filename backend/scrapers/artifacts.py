@@ -0,0 +1,251 @@
+"""
+📸 Job Hunter OS — Captures de debug des scrapers
+=================================================
+Quand une page ne donne aucune offre, les scrapers en gardent le HTML pour
+comprendre pourquoi (sélecteurs cassés, captcha, WAF…). Au lieu d'écrire
+130–270 Ko en clair dans le dossier courant (les debug_*.html qui
+s'accumulaient à la racine), la capture part dans un magasin borné :
+
+    data/debug/
+        index.sqlite                      ← une ligne par capture (URL, source, raison, date)
+        3f/3fa9…c1.html.gz                ← contenu compressé, nommé par son sha256
+
+    - écriture hors du chemin critique : capture() met en file, un thread
+      d'arrière-plan compresse et écrit
+    - dédoublonnage : deux captures identiques (même sha256) partagent un fichier
+    - taille bornée : au-delà de `max_bytes`, les contenus les moins
+      récemment capturés sont supprimés avec leurs lignes d'index
+
+Usage:
+    python -m backend.scrapers.artifacts                   # dernières captures
+    python -m backend.scrapers.artifacts --source safran   # captures d'une source
+    python -m backend.scrapers.artifacts --show 12 > page.html
+"""
+
+import argparse
+import atexit
+import datetime
+import functools
+import gzip
+import hashlib
+import os
+import queue
+import sqlite3
+import sys
+import threading
+from dataclasses import dataclass
+
+DEBUG_DIR = os.getenv(
+    "JOB_HUNTER_DEBUG_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "debug"),
+)
+MAX_BYTES = 64 * 1024 * 1024   # Taille compressée totale avant éviction
+QUEUE_SIZE = 32                # Captures en attente d'écriture au plus
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,              -- Taille du HTML
+    stored_size INTEGER NOT NULL,       -- Taille compressée sur disque
+    last_captured_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS captures (
+    id INTEGER PRIMARY KEY,
+    sha256 TEXT NOT NULL REFERENCES blobs(sha256),
+    source TEXT,
+    url TEXT,
+    reason TEXT,
+    captured_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_captures_source ON captures (source, captured_at);
+CREATE INDEX IF NOT EXISTS ix_captures_sha256 ON captures (sha256);
+CREATE INDEX IF NOT EXISTS ix_blobs_last_captured ON blobs (last_captured_at);
+"""
+
+
+@dataclass
+class Capture:
+    id: int
+    sha256: str
+    source: str
+    url: str
+    reason: str
+    captured_at: str
+    size: int
+
+
+class ArtifactStore:
+    """Magasin de captures HTML (voir l'en-tête du module)."""
+
+    def __init__(self, directory: str = DEBUG_DIR, max_bytes: int = MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.directory, "index.sqlite")
+
+    def blob_path(self, sha256: str) -> str:
+        return os.path.join(self.directory, sha256[:2], f"{sha256}.html.gz")
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(self.directory, exist_ok=True)
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        conn.executescript(SCHEMA)
+        return conn
+
+    # ─── Écriture ─────────────────────────────────────────────────────────
+
+    def capture(self, html: str, url: str = "", source: str = "", reason: str = ""):
+        """Met une capture en file (non bloquant ; ignorée si la file est pleine)."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="debug-artifacts", daemon=True)
+                self._thread.start()
+        now = datetime.datetime.now().isoformat(timespec="seconds")
+        try:
+            self._queue.put_nowait((html, url, source, reason, now))
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self):
+        """Attend que les captures en file soient écrites."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _run(self):
+        conn = self._connect()
+        try:
+            while True:
+                item = self._queue.get()
+                try:
+                    self.write(conn, *item)
+                except Exception as e:
+                    print(f"  ⚠️  Capture de debug non enregistrée : {e}")
+                finally:
+                    self._queue.task_done()
+        finally:
+            conn.close()
+
+    def write(self, conn: sqlite3.Connection, html: str, url: str, source: str, reason: str,
+              captured_at: str) -> str:
+        """Écrit une capture (dans le thread appelant). Retourne son sha256."""
+        data = html.encode("utf-8")
+        sha256 = hashlib.sha256(data).hexdigest()
+        known = conn.execute("SELECT 1 FROM blobs WHERE sha256 = ?", (sha256,)).fetchone()
+        if known and os.path.exists(self.blob_path(sha256)):
+            conn.execute("UPDATE blobs SET last_captured_at = ? WHERE sha256 = ?", (captured_at, sha256))
+        else:
+            path = self.blob_path(sha256)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(gzip.compress(data, compresslevel=6))
+            os.replace(tmp, path)
+            conn.execute(
+                "INSERT OR REPLACE INTO blobs (sha256, size, stored_size, last_captured_at) VALUES (?, ?, ?, ?)",
+                (sha256, len(data), os.path.getsize(path), captured_at),
+            )
+        conn.execute(
+            "INSERT INTO captures (sha256, source, url, reason, captured_at) VALUES (?, ?, ?, ?, ?)",
+            (sha256, source, url, reason, captured_at),
+        )
+        self.evict(conn, keep=sha256)
+        conn.commit()
+        return sha256
+
+    def evict(self, conn: sqlite3.Connection, keep: str | None = None) -> int:
+        """Supprime les contenus les moins récemment capturés au-delà de max_bytes."""
+        total = conn.execute("SELECT COALESCE(SUM(stored_size), 0) FROM blobs").fetchone()[0]
+        evicted = 0
+        if total <= self.max_bytes:
+            return 0
+        for sha256, stored_size in conn.execute(
+            "SELECT sha256, stored_size FROM blobs ORDER BY last_captured_at, sha256"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            if sha256 == keep:
+                continue
+            conn.execute("DELETE FROM captures WHERE sha256 = ?", (sha256,))
+            conn.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+            try:
+                os.remove(self.blob_path(sha256))
+            except FileNotFoundError:
+                pass
+            total -= stored_size
+            evicted += 1
+        return evicted
+
+    # ─── Lecture ──────────────────────────────────────────────────────────
+
+    def captures(self, source: str | None = None, limit: int = 50) -> list[Capture]:
+        """Captures les plus récentes d'abord."""
+        if not os.path.exists(self.index_path):
+            return []
+        conn = self._connect()
+        try:
+            query = ("SELECT c.id, c.sha256, c.source, c.url, c.reason, c.captured_at, b.size "
+                     "FROM captures c JOIN blobs b ON b.sha256 = c.sha256")
+            params: tuple = ()
+            if source:
+                query += " WHERE c.source = ?"
+                params = (source,)
+            query += " ORDER BY c.id DESC LIMIT ?"
+            return [Capture(*row) for row in conn.execute(query, (*params, limit))]
+        finally:
+            conn.close()
+
+    def read(self, capture_id: int) -> str:
+        """HTML d'une capture (pour la rejouer dans un parseur ou un navigateur)."""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT sha256 FROM captures WHERE id = ?", (capture_id,)).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            raise KeyError(capture_id)
+        with gzip.open(self.blob_path(row[0]), "rb") as f:
+            return f.read().decode("utf-8")
+
+
+@functools.cache
+def get_store() -> ArtifactStore:
+    """Magasin partagé dans le process (écrit avant la sortie du programme)."""
+    store = ArtifactStore()
+    atexit.register(store.flush)
+    return store
+
+
+def capture_page(html: str, url: str, source: str, reason: str):
+    """Raccourci des scrapers : capture en arrière-plan dans le magasin partagé."""
+    get_store().capture(html, url, source, reason)
+    print(f"  📸 Capture de debug en file ({reason}) — python -m backend.scrapers.artifacts")
+
+
+# ─── Point d'entrée ──────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="📸 Captures de debug des scrapers")
+    parser.add_argument("--source", default=None, help="Filtrer sur une source")
+    parser.add_argument("--limit", type=int, default=30, help="Nombre de captures listées (défaut: 30)")
+    parser.add_argument("--show", type=int, default=None, help="Écrire le HTML d'une capture sur la sortie")
+    args = parser.parse_args()
+
+    store = ArtifactStore()
+    if args.show is not None:
+        sys.stdout.write(store.read(args.show))
+        return
+
+    captures = store.captures(args.source, args.limit)
+    print(f"📸 {len(captures)} captures dans {store.directory}\n")
+    for c in captures:
+        print(f"  #{c.id:<5d} {c.captured_at}  {c.source:12s} {c.reason:12s} {c.size / 1024:6.0f} Ko  {c.url}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""
+⏱️ Job Hunter OS — Banc d'essai hors ligne des parseurs
+========================================================
+Mesure l'extraction et le parsing des cartes de chaque scraper sur les pages
+capturées, sans réseau ni site réel :
+
+    debug_<source>_page_<n>.html                     ← racine du dépôt
+    scripts/debug_files/debug_<source>_page_<n>.html
+
+Chaque page est chargée par page.set_content() dans un Chromium local dont
+toutes les requêtes sont coupées, puis passée à extract_job_cards() et
+parse_card() du scraper de la source. Pour chaque page :
+
+    - durée d'extraction des cartes et de parsing (médiane sur --repeat passes)
+    - allers-retours Playwright par carte : chaque appel qui interroge le
+      navigateur (count, inner_text, get_attribute…) est compté par un
+      Locator instrumenté ; locator(), first, nth() restent locaux
+    - comparaison avec les résultats enregistrés (data/results/resultats_<source>.json) :
+      offres dont l'URL figure dans les résultats attendus
+
+Le rapport JSON, nommé d'après le commit, se compare d'un commit à l'autre.
+
+Usage:
+    python -m backend.scrapers.bench                         # → data/bench/<commit>.json
+    python -m backend.scrapers.bench --source engie --repeat 5
+    python -m backend.scrapers.bench --compare data/bench/1a3b6e6.json
+"""
+
+import argparse
+import datetime
+import glob
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass
+from importlib.metadata import version
+
+from playwright.sync_api import sync_playwright
+
+from backend.database import DATA_DIR
+from backend.scrapers.companies import COMPANIES_REGISTRY
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+FIXTURE_DIRS = [ROOT_DIR, os.path.join(ROOT_DIR, "scripts", "debug_files")]
+RESULTS_DIR = os.path.join(DATA_DIR, "results")
+BENCH_DIR = os.getenv("JOB_HUNTER_BENCH_DIR", os.path.join(DATA_DIR, "bench"))
+DEFAULT_REPEAT = 3
+
+FIXTURE_PATTERN = re.compile(r"debug_(?P<source>[a-z0-9-]+)_page_(?P<page>\d+)\.html$")
+
+
+@dataclass(frozen=True)
+class Fixture:
+    path: str
+    source: str
+    page_num: int   # Numéro de page tel que dans le nom (1 = première page)
+
+    @property
+    def name(self) -> str:
+        return os.path.relpath(self.path, ROOT_DIR)
+
+
+def find_fixtures(dirs: list[str] | None = None, sources: list[str] | None = None) -> list[Fixture]:
+    """Pages capturées, triées par source puis par page."""
+    fixtures = []
+    for directory in dirs or FIXTURE_DIRS:
+        for path in glob.glob(os.path.join(directory, "debug_*_page_*.html")):
+            m = FIXTURE_PATTERN.search(os.path.basename(path))
+            if m and (sources is None or m["source"] in sources):
+                fixtures.append(Fixture(path, m["source"], int(m["page"])))
+    return sorted(fixtures, key=lambda f: (f.source, f.page_num, f.path))
+
+
+def normalize_url(url: str) -> str:
+    """URL sans paramètres ni "/" final (les paramètres de suivi changent à chaque visite)."""
+    return url.split("?", 1)[0].rstrip("/")
+
+
+def load_expected(source: str, results_dir: str = RESULTS_DIR) -> set[str]:
+    """URLs des résultats enregistrés d'une source (vide si aucun)."""
+    path = os.path.join(results_dir, f"resultats_{source}.json")
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        return {normalize_url(o["url"]) for o in json.load(f) if o.get("url")}
+
+
+def get_bench_scraper(source: str):
+    """Scraper d'une source : extract_job_cards(page) et parse_card(card, base_url)."""
+    if source in COMPANIES_REGISTRY:
+        from backend.scrapers.core import get_scraper
+        return get_scraper(source)
+    from backend.sources import SOURCES
+    return SOURCES[source].load()()
+
+
+# ─── Comptage des allers-retours ──────────────────────────────────────────────
+
+class RoundTripCounter:
+    def __init__(self):
+        self.calls = 0
+
+
+def _is_locator(obj) -> bool:
+    # Un Locator se compose sans interroger le navigateur (contrairement à un ElementHandle)
+    return hasattr(obj, "locator") and hasattr(obj, "nth")
+
+
+class CountingLocator:
+    """
+    Enveloppe un Locator (ou un ElementHandle) : tout appel qui ne renvoie
+    pas un nouveau Locator est un aller-retour avec le navigateur.
+    """
+
+    def __init__(self, target, counter: RoundTripCounter):
+        self._target = target
+        self._counter = counter
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if _is_locator(attr):   # Propriétés first / last
+            return CountingLocator(attr, self._counter)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            if _is_locator(result):
+                return CountingLocator(result, self._counter)
+            self._counter.calls += 1
+            return result
+        return call
+
+
+# ─── Mesure ───────────────────────────────────────────────────────────────────
+
+def bench_fixture(page, scraper, fixture: Fixture, expected: set[str], repeat: int = DEFAULT_REPEAT) -> dict:
+    """Mesure une page capturée, déjà chargée dans `page`."""
+    base_url = scraper.build_url("", fixture.page_num - 1) if hasattr(scraper, "build_url") else ""
+    extract_times, parse_times = [], []
+    offers, errors, round_trips, count = [], 0, 0, 0
+
+    for _ in range(repeat):
+        counter = RoundTripCounter()
+        started = time.perf_counter()
+        cards = scraper.extract_job_cards(page)
+        count = len(cards) if isinstance(cards, list) else cards.count()
+        extract_times.append(time.perf_counter() - started)
+
+        offers, errors = [], 0
+        started = time.perf_counter()
+        for i in range(count):
+            card = cards.nth(i) if hasattr(cards, "nth") else cards[i]
+            try:
+                offer = scraper.parse_card(CountingLocator(card, counter), base_url)
+            except Exception:
+                errors += 1
+                continue
+            if offer:
+                offers.append(offer)
+        parse_times.append(time.perf_counter() - started)
+        round_trips = counter.calls
+
+    parse_ms = statistics.median(parse_times) * 1000
+    matched = sum(1 for o in offers if normalize_url(o.url) in expected)
+    return {
+        "fixture": fixture.name,
+        "source": fixture.source,
+        "bytes": os.path.getsize(fixture.path),
+        "cards": count,
+        "offers": len(offers),
+        "errors": errors,
+        "extract_ms": round(statistics.median(extract_times) * 1000, 3),
+        "parse_ms": round(parse_ms, 3),
+        "parse_ms_per_card": round(parse_ms / count, 3) if count else None,
+        "round_trips": round_trips,
+        "round_trips_per_card": round(round_trips / count, 2) if count else None,
+        "expected": len(expected),
+        "matched": matched,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                             capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def summarize(rows: list[dict]) -> dict:
+    cards = sum(r["cards"] for r in rows)
+    round_trips = sum(r["round_trips"] for r in rows)
+    return {
+        "fixtures": len(rows),
+        "cards": cards,
+        "offers": sum(r["offers"] for r in rows),
+        "errors": sum(r["errors"] for r in rows),
+        "matched": sum(r["matched"] for r in rows),
+        "extract_ms": round(sum(r["extract_ms"] for r in rows), 3),
+        "parse_ms": round(sum(r["parse_ms"] for r in rows), 3),
+        "round_trips": round_trips,
+        "round_trips_per_card": round(round_trips / cards, 2) if cards else None,
+    }
+
+
+def run_bench(fixtures: list[Fixture], repeat: int = DEFAULT_REPEAT, results_dir: str = RESULTS_DIR) -> dict:
+    """Passe chaque page capturée dans le parseur de sa source. Retourne le rapport."""
+    from backend.scrapers.core import launch_browser, new_context
+
+    rows = []
+    with sync_playwright() as p:
+        browser = launch_browser(p)
+        try:
+            context = new_context(browser)
+            # Hors ligne : ni scripts, ni images, ni polices des sites réels
+            context.route("**/*", lambda route: route.abort())
+            page = context.new_page()
+            for fixture in fixtures:
+                scraper = get_bench_scraper(fixture.source)
+                with open(fixture.path, encoding="utf-8", errors="replace") as f:
+                    page.set_content(f.read(), wait_until="domcontentloaded")
+                row = bench_fixture(page, scraper, fixture, load_expected(fixture.source, results_dir), repeat)
+                print(f"  ⏱️  {row['fixture']:50s} {row['cards']:3d} cartes  "
+                      f"{row['parse_ms']:8.1f} ms  {row['round_trips_per_card'] or 0:5.1f} A/R par carte")
+                rows.append(row)
+        finally:
+            browser.close()
+
+    return {
+        "commit": _git_commit(),
+        "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "playwright": version("playwright"),
+        "repeat": repeat,
+        "fixtures": rows,
+        "totals": summarize(rows),
+    }
+
+
+def report_path(report: dict, directory: str = BENCH_DIR) -> str:
+    """data/bench/<commit>.json (horodatage hors dépôt git)."""
+    name = report["commit"] or datetime.datetime.now().strftime("%Y%m%dT%H%M%S")
+    return os.path.join(directory, f"{name}.json")
+
+
+# ─── Comparaison ──────────────────────────────────────────────────────────────
+
+COMPARED_FIELDS = ("offers", "extract_ms", "parse_ms", "round_trips_per_card")
+
+
+def compare_reports(before: dict, after: dict) -> list[dict]:
+    """Écarts par page commune aux deux rapports (after − before)."""
+    previous = {r["fixture"]: r for r in before["fixtures"]}
+    deltas = []
+    for row in after["fixtures"]:
+        old = previous.get(row["fixture"])
+        if old is None:
+            continue
+        delta = {"fixture": row["fixture"]}
+        for name in COMPARED_FIELDS:
+            if row.get(name) is not None and old.get(name) is not None:
+                delta[name] = round(row[name] - old[name], 3)
+        deltas.append(delta)
+    return deltas
+
+
+def print_comparison(before: dict, after: dict):
+    print(f"\n📈 Écarts {before.get('commit') or '?'} → {after.get('commit') or '?'}\n")
+    for delta in compare_reports(before, after):
+        values = "  ".join(f"{name} {delta[name]:+g}" for name in COMPARED_FIELDS if name in delta)
+        print(f"  {delta['fixture']:50s} {values}")
+
+
+# ─── Point d'entrée ──────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="⏱️ Banc d'essai hors ligne des parseurs")
+    parser.add_argument("--source", "-s", action="append", default=None,
+                        help="Source à mesurer (répétable ; défaut : toutes les pages capturées)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"Passes par page, médiane retenue (défaut: {DEFAULT_REPEAT})")
+    parser.add_argument("--out", default=None, help="Fichier du rapport (défaut: data/bench/<commit>.json)")
+    parser.add_argument("--compare", default=None, help="Rapport précédent à comparer")
+    args = parser.parse_args()
+
+    fixtures = find_fixtures(sources=args.source)
+    if not fixtures:
+        print("❌ Aucune page capturée trouvée")
+        return
+    print(f"⏱️  {len(fixtures)} pages capturées, {args.repeat} passes chacune\n")
+
+    report = run_bench(fixtures, args.repeat)
+    out = args.out or report_path(report)
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    totals = report["totals"]
+    print(f"\n📊 {totals['offers']} offres sur {totals['cards']} cartes, {totals['matched']} attendues, "
+          f"{totals['round_trips_per_card'] or 0} A/R par carte → {out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print_comparison(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+🏢 Job Hunter OS — Registre des entreprises
+===========================================
+Données seules (nom, page carrière, classe de scraper, secteur), sans
+dépendance à Playwright : l'API et le planificateur le lisent pour connaître
+les sources et leurs hôtes sans charger les scrapers (backend/sources.py).
+
+Avec JOB_HUNTER_MOCK_FARM=localhost:8765, les URLs construites par les
+scrapers pointent vers la ferme de sites locale (backend/scrapers/mockfarm.py) :
+un sous-domaine par site, http://edf.localhost:8765/edf-recrute/…, pour
+scraper hors ligne. La variable est lue à chaque URL, pas à l'import.
+"""
+
+import os
+from urllib.parse import urlparse
+
+COMPANIES_REGISTRY: dict[str, dict] = {
+    "edf": {
+        "name": "EDF",
+        "career_url": "https://www.edf.fr/edf-recrute/rejoignez-nous/voir-les-offres/nos-offres",
+        "scraper_class": "EDFScraper",
+        "sector": "Énergie",
+    },
+    # ── Prêts à être implémentés ─────────────────────────────────────────
+    "totalenergies": {
+        "name": "TotalEnergies",
+        "career_url": "https://jobs.totalenergies.com/fr_FR/careers/SearchJobs",
+        "scraper_class": "TotalEnergiesScraper",
+        "sector": "Énergie / Pétrole",
+    },
+    "engie": {
+        "name": "Engie",
+        "career_url": "https://jobs.engie.com/search/",
+        "scraper_class": None,
+        "sector": "Énergie",
+    },
+    "safran": {
+        "name": "Safran",
+        "career_url": "https://www.safran-group.com/fr/offres",
+        "scraper_class": "SafranScraper",
+        "sector": "Aéronautique / Défense",
+    },
+    "thales": {
+        "name": "Thales",
+        "career_url": "https://careers.thalesgroup.com/fr/recherche-emploi",
+        "scraper_class": None,
+        "sector": "Défense / Technologie",
+    },
+    "airbus": {
+        "name": "Airbus",
+        "career_url": "https://ag.wd3.myworkdayjobs.com/fr-FR/Airbus",
+        "scraper_class": "AirbusScraper",
+        "sector": "Aéronautique",
+    },
+    "sanofi": {
+        "name": "Sanofi",
+        "career_url": "https://www.sanofi.com/fr/carrieres/trouver-un-emploi",
+        "scraper_class": None,
+        "sector": "Pharmaceutique",
+    },
+    "schneider": {
+        "name": "Schneider Electric",
+        "career_url": "https://careers.se.com/global/en/search-results",
+        "scraper_class": None,
+        "sector": "Électrique / Automatisation",
+    },
+    "saint-gobain": {
+        "name": "Saint-Gobain",
+        "career_url": "https://jobs.saint-gobain.com/fr/offres-d-emploi",
+        "scraper_class": None,
+        "sector": "Matériaux",
+    },
+    "michelin": {
+        "name": "Michelin",
+        "career_url": "https://careers.michelin.com/search/",
+        "scraper_class": None,
+        "sector": "Automobile / Pneumatiques",
+    },
+    "renault": {
+        "name": "Renault Group",
+        "career_url": "https://www.renaultgroup.com/talents/nos-offres/",
+        "scraper_class": None,
+        "sector": "Automobile",
+    },
+    "stellantis": {
+        "name": "Stellantis",
+        "career_url": "https://careers.stellantis.com/",
+        "scraper_class": None,
+        "sector": "Automobile",
+    },
+    "bouygues": {
+        "name": "Bouygues",
+        "career_url": "https://www.bouygues-construction.com/carrieres",
+        "scraper_class": None,
+        "sector": "BTP / Construction",
+    },
+    "vinci": {
+        "name": "Vinci",
+        "career_url": "https://www.vinci.com/talents/nos-offres",
+        "scraper_class": None,
+        "sector": "BTP / Concessions",
+    },
+    "veolia": {
+        "name": "Veolia",
+        "career_url": "https://www.veolia.com/fr/carrieres",
+        "scraper_class": None,
+        "sector": "Environnement / Eau",
+    },
+    "arcelormittal": {
+        "name": "ArcelorMittal",
+        "career_url": "https://corporate.arcelormittal.com/careers",
+        "scraper_class": None,
+        "sector": "Métallurgie / Acier",
+    },
+    "arkema": {
+        "name": "Arkema",
+        "career_url": "https://www.arkema.com/global/fr/careers/offres-emploi/",
+        "scraper_class": None,
+        "sector": "Chimie",
+    },
+    "air-liquide": {
+        "name": "Air Liquide",
+        "career_url": "https://www.airliquide.com/fr/carrieres",
+        "scraper_class": None,
+        "sector": "Chimie / Gaz industriels",
+    },
+    "dassault": {
+        "name": "Dassault Aviation",
+        "career_url": "https://www.dassault-aviation.com/fr/groupe/carrieres/",
+        "scraper_class": None,
+        "sector": "Aéronautique / Défense",
+    },
+    "naval-group": {
+        "name": "Naval Group",
+        "career_url": "https://www.naval-group.com/fr/nos-offres",
+        "scraper_class": None,
+        "sector": "Naval / Défense",
+    },
+    "orano": {
+        "name": "Orano",
+        "career_url": "https://www.orano.group/fr/carrieres",
+        "scraper_class": None,
+        "sector": "Nucléaire",
+    },
+    "legrand": {
+        "name": "Legrand",
+        "career_url": "https://www.legrandgroup.com/fr/carrieres",
+        "scraper_class": None,
+        "sector": "Électrique / Bâtiment",
+    },
+    "alstom": {
+        "name": "Alstom",
+        "career_url": "https://jobsearch.alstom.com/search/",
+        "scraper_class": None,
+        "sector": "Ferroviaire",
+    },
+    "framatome": {
+        "name": "Framatome",
+        "career_url": "https://www.edf.fr/edf-recrute/rejoignez-nous/voir-les-offres/nos-offres",
+        "scraper_class": None,  # Même site qu'EDF (groupe EDF)
+        "sector": "Nucléaire",
+    },
+}
+
+
+def farm_url(key: str, url: str, farm: str | None = None) -> str:
+    """URL `url` du site `key`, servie par la ferme locale si elle est configurée."""
+    if farm is None:
+        farm = os.getenv("JOB_HUNTER_MOCK_FARM", "")
+    if not farm:
+        return url
+    return f"http://{key}.{farm}{urlparse(url).path}"
@@ -7,197 +7,45 @@ sites carrières des grandes entreprises industrielles françaises.
 Architecture :
     - BaseCorporateScraper : classe abstraite réutilisable
     - EDFScraper : implémentation pour EDF Recrute
-    - COMPANIES_REGISTRY : dictionnaire des entreprises et leurs URLs
+    - COMPANIES_REGISTRY : dictionnaire des entreprises et leurs URLs (companies.py)
 
 Pour ajouter une nouvelle entreprise, il suffit de :
     1. Créer une classe qui hérite de BaseCorporateScraper
     2. Implémenter les méthodes extract_job_cards() et parse_card()
-    3. L'ajouter au COMPANIES_REGISTRY
+    3. L'ajouter au COMPANIES_REGISTRY (backend/scrapers/companies.py)
 
 Usage:
-    python3 test_scraper_corporate.py
-    python3 test_scraper_corporate.py --company edf --keyword "ingénieur"
-    python3 test_scraper_corporate.py --company edf --keyword "data" --pages 3
-    python3 test_scraper_corporate.py --list   # Lister les entreprises disponibles
+    python -m backend.scrapers.core
+    python -m backend.scrapers.core --company edf --keyword "ingénieur"
+    python -m backend.scrapers.core --company edf --keyword "data" --pages 3
+    python -m backend.scrapers.core --company edf -k "data" -k "ingénieur"   # lot
+    python -m backend.scrapers.core --company all -k "data"         # toutes, en parallèle
+    python -m backend.scrapers.core --company edf,safran -k "data"  # une sélection
+    python -m backend.scrapers.core --list   # Lister les entreprises disponibles
 """
 
 import argparse
-import csv
-import json
+import queue
 import random
+import socket
+import threading
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from dataclasses import dataclass, asdict, field
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 from playwright.sync_api import sync_playwright, Page, BrowserContext, TimeoutError as PlaywrightTimeout
 
+from backend.scrapers.artifacts import capture_page
+from backend.scrapers.companies import COMPANIES_REGISTRY, farm_url
+from backend.scrapers.records import JobOffer, scrape_batch
+from backend.scrapers.streaming import aiter_in_thread
+from backend.scrapers.resilience import (
+    BlockKind, PageState, classify_block, detect_page_state, get_breaker, goto_with_backoff,
+)
+from backend.scrapers.urls import url_hash
 
-# ─── Modèle de données ───────────────────────────────────────────────────────
-
-@dataclass
-class JobOffer:
-    """Représente une offre d'emploi extraite d'un site carrière."""
-    titre: str
-    entreprise: str
-    lieu: str
-    url: str
-    contrat: str          # CDI, CDD, Stage, Alternance...
-    date_publication: str
-    description_courte: str
-    source: str           # Nom du site (edf, totalenergies, etc.)
-    date_scraping: str = field(default_factory=lambda: datetime.now().isoformat())
-
-
-# ─── Registre des entreprises ────────────────────────────────────────────────
-
-COMPANIES_REGISTRY: dict[str, dict] = {
-    "edf": {
-        "name": "EDF",
-        "career_url": "https://www.edf.fr/edf-recrute/rejoignez-nous/voir-les-offres/nos-offres",
-        "scraper_class": "EDFScraper",
-        "sector": "Énergie",
-    },
-    # ── Prêts à être implémentés ─────────────────────────────────────────
-    "totalenergies": {
-        "name": "TotalEnergies",
-        "career_url": "https://jobs.totalenergies.com/fr_FR/careers/SearchJobs",
-        "scraper_class": "TotalEnergiesScraper",
-        "sector": "Énergie / Pétrole",
-    },
-    "engie": {
-        "name": "Engie",
-        "career_url": "https://jobs.engie.com/search/",
-        "scraper_class": None,
-        "sector": "Énergie",
-    },
-    "safran": {
-        "name": "Safran",
-        "career_url": "https://www.safran-group.com/fr/offres",
-        "scraper_class": "SafranScraper",
-        "sector": "Aéronautique / Défense",
-    },
-    "thales": {
-        "name": "Thales",
-        "career_url": "https://careers.thalesgroup.com/fr/recherche-emploi",
-        "scraper_class": None,
-        "sector": "Défense / Technologie",
-    },
-    "airbus": {
-        "name": "Airbus",
-        "career_url": "https://ag.wd3.myworkdayjobs.com/fr-FR/Airbus",
-        "scraper_class": "AirbusScraper",
-        "sector": "Aéronautique",
-    },
-    "sanofi": {
-        "name": "Sanofi",
-        "career_url": "https://www.sanofi.com/fr/carrieres/trouver-un-emploi",
-        "scraper_class": None,
-        "sector": "Pharmaceutique",
-    },
-    "schneider": {
-        "name": "Schneider Electric",
-        "career_url": "https://careers.se.com/global/en/search-results",
-        "scraper_class": None,
-        "sector": "Électrique / Automatisation",
-    },
-    "saint-gobain": {
-        "name": "Saint-Gobain",
-        "career_url": "https://jobs.saint-gobain.com/fr/offres-d-emploi",
-        "scraper_class": None,
-        "sector": "Matériaux",
-    },
-    "michelin": {
-        "name": "Michelin",
-        "career_url": "https://careers.michelin.com/search/",
-        "scraper_class": None,
-        "sector": "Automobile / Pneumatiques",
-    },
-    "renault": {
-        "name": "Renault Group",
-        "career_url": "https://www.renaultgroup.com/talents/nos-offres/",
-        "scraper_class": None,
-        "sector": "Automobile",
-    },
-    "stellantis": {
-        "name": "Stellantis",
-        "career_url": "https://careers.stellantis.com/",
-        "scraper_class": None,
-        "sector": "Automobile",
-    },
-    "bouygues": {
-        "name": "Bouygues",
-        "career_url": "https://www.bouygues-construction.com/carrieres",
-        "scraper_class": None,
-        "sector": "BTP / Construction",
-    },
-    "vinci": {
-        "name": "Vinci",
-        "career_url": "https://www.vinci.com/talents/nos-offres",
-        "scraper_class": None,
-        "sector": "BTP / Concessions",
-    },
-    "veolia": {
-        "name": "Veolia",
-        "career_url": "https://www.veolia.com/fr/carrieres",
-        "scraper_class": None,
-        "sector": "Environnement / Eau",
-    },
-    "arcelormittal": {
-        "name": "ArcelorMittal",
-        "career_url": "https://corporate.arcelormittal.com/careers",
-        "scraper_class": None,
-        "sector": "Métallurgie / Acier",
-    },
-    "arkema": {
-        "name": "Arkema",
-        "career_url": "https://www.arkema.com/global/fr/careers/offres-emploi/",
-        "scraper_class": None,
-        "sector": "Chimie",
-    },
-    "air-liquide": {
-        "name": "Air Liquide",
-        "career_url": "https://www.airliquide.com/fr/carrieres",
-        "scraper_class": None,
-        "sector": "Chimie / Gaz industriels",
-    },
-    "dassault": {
-        "name": "Dassault Aviation",
-        "career_url": "https://www.dassault-aviation.com/fr/groupe/carrieres/",
-        "scraper_class": None,
-        "sector": "Aéronautique / Défense",
-    },
-    "naval-group": {
-        "name": "Naval Group",
-        "career_url": "https://www.naval-group.com/fr/nos-offres",
-        "scraper_class": None,
-        "sector": "Naval / Défense",
-    },
-    "orano": {
-        "name": "Orano",
-        "career_url": "https://www.orano.group/fr/carrieres",
-        "scraper_class": None,
-        "sector": "Nucléaire",
-    },
-    "legrand": {
-        "name": "Legrand",
-        "career_url": "https://www.legrandgroup.com/fr/carrieres",
-        "scraper_class": None,
-        "sector": "Électrique / Bâtiment",
-    },
-    "alstom": {
-        "name": "Alstom",
-        "career_url": "https://jobsearch.alstom.com/search/",
-        "scraper_class": None,
-        "sector": "Ferroviaire",
-    },
-    "framatome": {
-        "name": "Framatome",
-        "career_url": "https://www.edf.fr/edf-recrute/rejoignez-nous/voir-les-offres/nos-offres",
-        "scraper_class": None,  # Même site qu'EDF (groupe EDF)
-        "sector": "Nucléaire",
-    },
-}
 
 # ─── Fonctions utilitaires ────────────────────────────────────────────────────
 
@@ -208,6 +56,80 @@ def human_delay(min_s: float = 2, max_s: float = 5):
     time.sleep(delay)
 
 
+def launch_browser(p, cdp_port: int | None = None):
+    """
+    Lance le navigateur headless partagé par les scrapers.
+
+    Avec `cdp_port`, le navigateur écoute aussi en CDP sur ce port : d'autres
+    threads s'y connectent (connect_over_cdp) avec leur propre instance Playwright.
+    """
+    extra = [f"--remote-debugging-port={cdp_port}"] if cdp_port else []
+    # Utiliser le Chrome système (meilleure compatibilité avec les WAF)
+    # Fallback sur le Chromium bundlé si Chrome n'est pas installé
+    try:
+        browser = p.chromium.launch(
+            headless=True,
+            channel="chrome",
+            args=["--no-sandbox", "--disable-dev-shm-usage", *extra]
+        )
+        print("  🌐 Navigateur : Chrome système")
+    except Exception:
+        browser = p.chromium.launch(
+            headless=True,
+            args=[
+                "--disable-blink-features=AutomationControlled",
+                "--no-sandbox",
+                "--disable-dev-shm-usage",
+                *extra,
+            ]
+        )
+        print("  🌐 Navigateur : Chromium bundlé")
+    return browser
+
+
+def new_context(browser) -> BrowserContext:
+    """Crée un contexte navigateur réaliste (User-Agent, locale, en-têtes)."""
+    return browser.new_context(
+        user_agent=(
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/122.0.0.0 Safari/537.36"
+        ),
+        viewport={"width": 1920, "height": 1080},
+        locale="fr-FR",
+        extra_http_headers={
+            "Accept-Language": "fr-FR,fr;q=0.9",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        },
+    )
+
+
+def offer_key(o: JobOffer) -> int:
+    """Clé de dédoublonnage : hash de l'URL canonique (ou titre + entreprise à défaut d'URL)."""
+    return url_hash(o.url) if o.url else hash((o.titre, o.entreprise))
+
+
+class OfferDeduper:
+    """Dédoublonnage en flux : ne garde que les clés déjà vues, pas les offres."""
+
+    def __init__(self):
+        self.seen: set[int] = set()
+        self.total = 0
+
+    def new(self, offers) -> Iterator[JobOffer]:
+        """Les offres pas encore vues, dans l'ordre."""
+        for o in offers:
+            self.total += 1
+            key = offer_key(o)
+            if key not in self.seen:
+                self.seen.add(key)
+                yield o
+
+    def report(self):
+        if len(self.seen) < self.total:
+            print(f"\n🔄 Dédoublonnage : {self.total} → {len(self.seen)} offres uniques")
+
+
 # ─── Classe abstraite — Base pour tous les scrapers ──────────────────────────
 
 class BaseCorporateScraper(ABC):
@@ -224,7 +146,7 @@ class BaseCorporateScraper(ABC):
         info = COMPANIES_REGISTRY[company_key]
         self.company_key = company_key
         self.company_name = info["name"]
-        self.base_url = info["career_url"]
+        self.base_url = farm_url(company_key, info["career_url"])
 
     @abstractmethod
     def build_url(self, keyword: str, page_num: int) -> str:
@@ -257,77 +179,123 @@ class BaseCorporateScraper(ABC):
         except Exception:
             pass
 
-    def scrape(self, keyword: str = "", max_pages: int = 1) -> list[JobOffer]:
-        """Lance le scraping. Méthode principale à appeler."""
-        all_offers: list[JobOffer] = []
+    def scrape(self, keyword: str = "", max_pages: int = 1, start_page: int = 0) -> list[JobOffer]:
+        """
+        Lance le scraping. Méthode principale à appeler.
 
-        print(f"\n{'='*60}")
-        print(f"🏭 Recherche {self.company_name} : '{keyword or '(toutes offres)'}'")
-        print(f"   Pages à scraper : {max_pages}")
-        print(f"{'='*60}\n")
+        `start_page` (0-indexé) permet de ne scraper qu'une tranche de pages,
+        par exemple une seule page pour une tâche de la file (backend/task_queue.py).
+        """
+        return self.scrape_many([keyword], max_pages, start_page)[keyword]
 
-        with sync_playwright() as p:
-            # Utiliser le Chrome système (meilleure compatibilité avec les WAF)
-            # Fallback sur le Chromium bundlé si Chrome n'est pas installé
-            try:
-                browser = p.chromium.launch(
-                    headless=True,
-                    channel="chrome",
-                    args=["--no-sandbox", "--disable-dev-shm-usage"]
-                )
-                print("  🌐 Navigateur : Chrome système")
-            except Exception:
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=[
-                        "--disable-blink-features=AutomationControlled",
-                        "--no-sandbox",
-                        "--disable-dev-shm-usage",
-                    ]
-                )
-                print("  🌐 Navigateur : Chromium bundlé")
-
-            context = browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/122.0.0.0 Safari/537.36"
-                ),
-                viewport={"width": 1920, "height": 1080},
-                locale="fr-FR",
-                extra_http_headers={
-                    "Accept-Language": "fr-FR,fr;q=0.9",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                },
-            )
+    def scrape_many(self, keywords: list[str], max_pages: int = 1, start_page: int = 0,
+                    context: BrowserContext | None = None) -> dict[str, list[JobOffer]]:
+        """
+        Scrape plusieurs mots-clés dans une seule session navigateur.
+
+        Le navigateur, le contexte et les cookies acceptés sont réutilisés d'un
+        mot-clé à l'autre, et une URL identique à la page précédente (ex. Workday
+        qui ne pagine pas par l'URL) n'est pas rechargée.
 
-            page = context.new_page()
+        Args:
+            keywords: Mots-clés à rechercher
+            context: Contexte Playwright à réutiliser (sinon un navigateur est lancé)
 
-            for page_num in range(max_pages):
+        Returns:
+            Dictionnaire mot-clé → offres dédoublonnées
+        """
+        results: dict[str, list[JobOffer]] = {kw: [] for kw in keywords}
+        for keyword, offer in self.iter_offers(keywords, max_pages, start_page, context):
+            results[keyword].append(offer)
+        return results
+
+    def iter_offers(self, keywords: list[str], max_pages: int = 1, start_page: int = 0,
+                    context: BrowserContext | None = None) -> Iterator[tuple[str, JobOffer]]:
+        """
+        Version en flux de scrape_many() : produit les couples (mot-clé, offre)
+        page par page, dédoublonnés par mot-clé, dès qu'une page est parsée.
+        L'appelant peut persister pendant que la page suivante se charge.
+        """
+        breaker = get_breaker(self.company_key)
+        if not breaker.allow():
+            print(f"  🔌 {self.company_name} ignoré (bloqué récemment, encore "
+                  f"{breaker.remaining_cooldown() / 60:.0f} min de pause)")
+            return
+
+        with scrape_batch():
+            if context is not None:
+                yield from self._iter_session(context, keywords, max_pages, start_page, breaker)
+                return
+
+            with sync_playwright() as p:
+                browser = launch_browser(p)
+                try:
+                    context = new_context(browser)
+                    yield from self._iter_session(context, keywords, max_pages, start_page, breaker)
+                finally:
+                    browser.close()
+
+    async def aiter_offers(self, keywords: list[str], max_pages: int = 1,
+                           start_page: int = 0) -> AsyncIterator[tuple[str, JobOffer]]:
+        """Pendant asynchrone d'iter_offers() (le navigateur tourne dans un thread dédié)."""
+        async for item in aiter_in_thread(lambda: self.iter_offers(keywords, max_pages, start_page)):
+            yield item
+
+    def _iter_session(self, context: BrowserContext, keywords: list[str], max_pages: int,
+                      start_page: int, breaker) -> Iterator[tuple[str, JobOffer]]:
+        """Parcourt les mots-clés dans un même onglet (popups gérés une seule fois)."""
+        page = context.new_page()
+        # Dernière page parsée seulement : la mémoire reste bornée à une page
+        last_url: str | None = None
+        last_offers: list[JobOffer] = []
+        popups_handled = False
+        blocked = False
+
+        for keyword in keywords:
+            dedupe = OfferDeduper()
+
+            print(f"\n{'='*60}")
+            print(f"🏭 Recherche {self.company_name} : '{keyword or '(toutes offres)'}'")
+            print(f"   Pages à scraper : {max_pages}")
+            print(f"{'='*60}\n")
+
+            last_page = start_page + max_pages
+            for page_num in range(start_page, last_page):
                 url = self.build_url(keyword, page_num)
-                print(f"📄 Page {page_num + 1}/{max_pages} — {url}")
+                print(f"📄 Page {page_num + 1}/{last_page} — {url}")
 
-                # Retry logic (certains sites échouent au premier essai)
-                loaded = False
-                for attempt in range(3):
-                    try:
-                        page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                        loaded = True
-                        break
-                    except Exception as e:
-                        print(f"  🔄 Tentative {attempt + 1}/3 échouée : {type(e).__name__}")
-                        if attempt < 2:
-                            time.sleep(random.uniform(3, 6))
+                if url == last_url:
+                    print(f"  ♻️  Page identique à la précédente, réutilisée")
+                    for offer in dedupe.new(last_offers):
+                        yield keyword, offer
+                    continue
 
-                if not loaded:
-                    print(f"  ❌ Impossible de charger la page après 3 tentatives")
+                # Retry avec backoff exponentiel (certains sites échouent au premier essai)
+                try:
+                    response = goto_with_backoff(page, url)
+                except Exception:
+                    print(f"  ❌ Impossible de charger la page après plusieurs tentatives")
+                    breaker.record_failure("chargement impossible")
+                    if not breaker.allow():
+                        blocked = True
+                        break
                     continue
 
+                # Page de blocage détectée dès le chargement : ni scroll ni extraction
+                state = detect_page_state(page, response)
+                if state.blocking:
+                    print(f"  🚫 Blocage détecté dès le chargement ({state.value}) ! Arrêt.")
+                    capture_page(page.content(), url, self.company_key, state.value)
+                    breaker.record_failure(state.value)
+                    blocked = True
+                    break
+
                 human_delay()
 
-                # Gérer les popups (cookies, etc.)
-                if page_num == 0:
+                # Gérer les popups (cookies, etc.) — une fois par session, ou si un bandeau réapparaît
+                if not popups_handled or state is PageState.CONSENT:
                     self.handle_popups(page)
+                    popups_handled = True
 
                 # Scroll pour charger le contenu
                 for _ in range(3):
@@ -343,45 +311,41 @@ class BaseCorporateScraper(ABC):
 
                 if count == 0:
                     debug_html = page.content()
-                    debug_path = f"debug_{self.company_key}_page_{page_num + 1}.html"
-                    with open(debug_path, "w", encoding="utf-8") as f:
-                        f.write(debug_html)
-                    print(f"  ⚠️  Aucune offre ! HTML sauvegardé dans {debug_path}")
-                    if "captcha" in debug_html.lower():
-                        print("  🚫 CAPTCHA détecté ! Arrêt.")
+                    block = classify_block(debug_html)
+                    print("  ⚠️  Aucune offre !")
+                    capture_page(debug_html, url, self.company_key,
+                                 "no_cards" if block is BlockKind.NONE else block.value)
+                    if block is not BlockKind.NONE:
+                        print(f"  🚫 Blocage détecté ({block.value}) ! Arrêt.")
+                        breaker.record_failure(block.value)
+                        blocked = True
                         break
                     continue
 
+                breaker.record_success()
+
                 # Parser chaque carte
+                page_offers: list[JobOffer] = []
                 for i in range(count):
                     try:
                         card = cards.nth(i) if hasattr(cards, 'nth') else cards[i]
                         offer = self.parse_card(card, url)
                         if offer:
-                            all_offers.append(offer)
+                            page_offers.append(offer)
                             print(f"  ✅ {i+1}. {offer.titre} — {offer.contrat} ({offer.lieu})")
                     except Exception as e:
                         print(f"  ⚠️  Erreur offre {i+1}: {e}")
                         continue
+                last_url, last_offers = url, page_offers
+                for offer in dedupe.new(page_offers):
+                    yield keyword, offer
 
-                if page_num < max_pages - 1:
+                if page_num < last_page - 1:
                     human_delay()
 
-            browser.close()
-
-        # Dédoublonnage
-        seen: set[str] = set()
-        unique: list[JobOffer] = []
-        for o in all_offers:
-            key = o.url or f"{o.titre}|{o.entreprise}"
-            if key not in seen:
-                seen.add(key)
-                unique.append(o)
-
-        if len(unique) < len(all_offers):
-            print(f"\n🔄 Dédoublonnage : {len(all_offers)} → {len(unique)} offres uniques")
-
-        return unique
+            dedupe.report()
+            if blocked:
+                break
 
 
 # ─── Implémentation EDF ─────────────────────────────────────────────────────
@@ -926,8 +890,8 @@ SCRAPER_CLASSES: dict[str, type[BaseCorporateScraper]] = {
 }
 
 
-def get_scraper(company_key: str) -> BaseCorporateScraper:
-    """Retourne une instance du scraper pour l'entreprise donnée."""
+def check_company(company_key: str):
+    """Vérifie que l'entreprise existe et que son scraper est implémenté."""
     if company_key not in COMPANIES_REGISTRY:
         raise ValueError(f"Entreprise '{company_key}' inconnue. Utilisez --list pour voir les disponibles.")
 
@@ -939,60 +903,168 @@ def get_scraper(company_key: str) -> BaseCorporateScraper:
             f"   Pour l'ajouter : créer une classe héritant de BaseCorporateScraper"
         )
 
+
+def get_scraper(company_key: str) -> BaseCorporateScraper:
+    """Retourne une instance du scraper pour l'entreprise donnée."""
+    check_company(company_key)
     return SCRAPER_CLASSES[company_key]()
 
 
-# ─── Export des résultats ─────────────────────────────────────────────────────
+def parse_companies(value: str) -> list[str]:
+    """--company : "all" (tous les scrapers implémentés), une clé ou une liste "edf,safran"."""
+    if value.strip().lower() == "all":
+        return list(SCRAPER_CLASSES)
+    keys: list[str] = []
+    for key in value.split(","):
+        key = key.strip().lower()
+        if key and key not in keys:
+            check_company(key)
+            keys.append(key)
+    return keys
 
-def save_to_csv(offers: list[JobOffer], filename: str):
-    if not offers:
-        return
-    with open(filename, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=list(asdict(offers[0]).keys()))
-        writer.writeheader()
-        for o in offers:
-            writer.writerow(asdict(o))
-    print(f"\n💾 {len(offers)} offres → '{filename}'")
 
+# ─── Lancement multi-entreprises ──────────────────────────────────────────────
 
-def save_to_json(offers: list[JobOffer], filename: str):
-    if not offers:
-        return
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump([asdict(o) for o in offers], f, ensure_ascii=False, indent=2)
-    print(f"💾 {len(offers)} offres → '{filename}'")
+STREAM_QUEUE_SIZE = 200   # Offres en attente d'écriture, toutes entreprises confondues
 
 
-def print_summary(offers: list[JobOffer], company_name: str):
+@dataclass
+class CompanyRun:
+    """Bilan d'une entreprise dans un lancement multi-entreprises."""
+    key: str
+    name: str
+    offers: int = 0
+    duration_s: float = 0.0
+    error: str = ""
+
+
+def scrape_concurrently(keys: list[str], scrape: Callable[[str], Iterable[tuple[str, JobOffer]]],
+                        runs: list[CompanyRun] | None = None,
+                        max_workers: int | None = None) -> Iterator[tuple[str, str, JobOffer]]:
+    """
+    Lance `scrape(clé)` pour chaque entreprise dans son propre thread et
+    produit les (clé, mot-clé, offre) dans l'ordre d'arrivée, via une file
+    bornée. Une entreprise en erreur n'interrompt pas les autres ; `runs`
+    reçoit un CompanyRun par entreprise (offres, durée, erreur).
+    """
+    runs = runs if runs is not None else []
+    out: queue.Queue = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+    stop = threading.Event()
+    done = object()
+
+    def work(run: CompanyRun):
+        started = time.perf_counter()
+        try:
+            for kw, offer in scrape(run.key):
+                out.put((run, kw, offer))
+                if stop.is_set():
+                    break
+        except Exception as e:
+            run.error = str(e) or type(e).__name__
+            print(f"  ❌ {run.name} : {run.error}")
+        finally:
+            run.duration_s = time.perf_counter() - started
+            out.put((run, None, done))
+
+    remaining = len(keys)
+    with ThreadPoolExecutor(max_workers=max_workers or max(1, len(keys)), thread_name_prefix="company") as pool:
+        for key in keys:
+            run = CompanyRun(key, COMPANIES_REGISTRY[key]["name"])
+            runs.append(run)
+            pool.submit(work, run)
+        try:
+            while remaining:
+                run, kw, offer = out.get()
+                if offer is done:
+                    remaining -= 1
+                    continue
+                run.offers += 1
+                yield run.key, kw, offer
+        finally:
+            # Consommateur arrêté en route : libérer les threads bloqués sur la file
+            stop.set()
+            while remaining:
+                if out.get()[2] is done:
+                    remaining -= 1
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def scrape_companies(keys: list[str], keywords: list[str], max_pages: int,
+                     runs: list[CompanyRun] | None = None) -> Iterator[tuple[str, str, JobOffer]]:
+    """
+    Scrape plusieurs entreprises en parallèle dans un seul navigateur :
+    chaque thread s'y connecte en CDP et ouvre son propre contexte
+    (cookies séparés). Les chargements de page restent espacés par hôte
+    (resilience.HOST_RATE_LIMITER).
+    """
+    port = _free_port()
+    endpoint = f"http://127.0.0.1:{port}"
+
+    def scrape(key: str):
+        scraper = get_scraper(key)
+        with sync_playwright() as p:
+            browser = p.chromium.connect_over_cdp(endpoint)
+            context = new_context(browser)
+            try:
+                yield from scraper.iter_offers(keywords, max_pages, context=context)
+            finally:
+                context.close()
+
+    with sync_playwright() as p:
+        browser = launch_browser(p, cdp_port=port)
+        try:
+            yield from scrape_concurrently(keys, scrape, runs)
+        finally:
+            browser.close()
+
+
+# ─── Résumé ───────────────────────────────────────────────────────────────────
+
+class OfferSummary:
+    """Statistiques de fin de lancement, tenues au fil des offres sans les garder."""
+
+    PREVIEW_SIZE = 5
+
+    def __init__(self):
+        self.count = 0
+        self.contrats: dict[str, int] = {}
+        self.lieux: dict[str, int] = {}
+        self.preview: list[JobOffer] = []
+
+    def add(self, o: JobOffer):
+        self.count += 1
+        c = o.contrat or "Non précisé"
+        self.contrats[c] = self.contrats.get(c, 0) + 1
+        l = o.lieu or "Non précisé"
+        self.lieux[l] = self.lieux.get(l, 0) + 1
+        if len(self.preview) < self.PREVIEW_SIZE:
+            self.preview.append(o)
+
+
+def print_summary(summary: OfferSummary, company_name: str):
     print(f"\n{'='*60}")
-    print(f"📊 RÉSUMÉ {company_name} — {len(offers)} offres extraites")
+    print(f"📊 RÉSUMÉ {company_name} — {summary.count} offres extraites")
     print(f"{'='*60}")
 
-    if not offers:
+    if not summary.count:
         print("  Aucune offre trouvée.")
         return
 
-    # Stats par type de contrat
-    contrats: dict[str, int] = {}
-    for o in offers:
-        c = o.contrat or "Non précisé"
-        contrats[c] = contrats.get(c, 0) + 1
-
-    lieux: dict[str, int] = {}
-    for o in offers:
-        l = o.lieu or "Non précisé"
-        lieux[l] = lieux.get(l, 0) + 1
-
     print(f"\n  📝 Types de contrat :")
-    for contrat, count in sorted(contrats.items(), key=lambda x: x[1], reverse=True):
+    for contrat, count in sorted(summary.contrats.items(), key=lambda x: x[1], reverse=True):
         print(f"    • {contrat} ({count})")
 
     print(f"\n  📍 Top lieux :")
-    for lieu, count in sorted(lieux.items(), key=lambda x: x[1], reverse=True)[:8]:
+    for lieu, count in sorted(summary.lieux.items(), key=lambda x: x[1], reverse=True)[:8]:
         print(f"    • {lieu} ({count})")
 
-    print(f"\n  📋 Aperçu (5 premières) :")
-    for i, o in enumerate(offers[:5], 1):
+    print(f"\n  📋 Aperçu ({OfferSummary.PREVIEW_SIZE} premières) :")
+    for i, o in enumerate(summary.preview, 1):
         print(f"    {i}. {o.titre}")
         print(f"       {o.entreprise} — {o.contrat} — {o.lieu}")
         if o.date_publication:
@@ -1000,6 +1072,16 @@ def print_summary(offers: list[JobOffer], company_name: str):
         print()
 
 
+def print_runs_summary(runs: list[CompanyRun], elapsed_s: float):
+    """Résumé d'un lancement multi-entreprises : offres et durée par source."""
+    print(f"\n{'='*60}")
+    print(f"📊 RÉSUMÉ — {sum(r.offers for r in runs)} offres, {len(runs)} entreprises en {elapsed_s:.1f}s")
+    print(f"{'='*60}\n")
+    for run in runs:
+        status = f"❌ {run.error}" if run.error else "✅"
+        print(f"  {status:3s} {run.name:25s} {run.offers:5d} offres  {run.duration_s:7.1f}s")
+
+
 def list_companies():
     """Affiche la liste des entreprises disponibles."""
     print(f"\n{'='*60}")
@@ -1022,19 +1104,24 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Exemples :
-  python3 test_scraper_corporate.py --list
-  python3 test_scraper_corporate.py --company edf
-  python3 test_scraper_corporate.py --company edf --keyword "ingénieur" --pages 2
+  python -m backend.scrapers.core --list
+  python -m backend.scrapers.core --company edf
+  python -m backend.scrapers.core --company edf --keyword "ingénieur" --pages 2
+  python -m backend.scrapers.core --company edf -k "data" -k "chef de projet"
+  python -m backend.scrapers.core --company all -k "data"
+  python -m backend.scrapers.core --company edf,safran,airbus -k "data"
         """
     )
     parser.add_argument("--company", "-c", default="edf",
-                        help="Clé de l'entreprise (défaut: edf)")
-    parser.add_argument("--keyword", "-k", default="",
-                        help="Mots-clés de recherche")
+                        help="Clé de l'entreprise, liste \"edf,safran\" ou \"all\" (défaut: edf)")
+    parser.add_argument("--keyword", "-k", action="append", default=None,
+                        help="Mots-clés de recherche (répétable : une session pour tous)")
     parser.add_argument("--pages", "-p", type=int, default=2,
                         help="Nombre de pages à scraper (défaut: 2)")
     parser.add_argument("--list", action="store_true",
                         help="Lister les entreprises disponibles")
+    parser.add_argument("--parquet", action="store_true",
+                        help="Exporter aussi le lancement en Parquet (data/exports/runs, nécessite pyarrow)")
 
     args = parser.parse_args()
 
@@ -1042,24 +1129,72 @@ Exemples :
         list_companies()
         return
 
+    from backend.runlog import RunLog
+
+    companies = parse_companies(args.company)
+    keywords = args.keyword or [""]
+    if len(companies) > 1:
+        run_companies(companies, keywords, args.pages, args.parquet)
+        return
+
+    args.company = companies[0]
     scraper = get_scraper(args.company)
 
-    offers = scraper.scrape(
-        keyword=args.keyword,
-        max_pages=args.pages,
-    )
+    # Chaque offre part au fil de l'eau dans le journal des lancements (et le
+    # Parquet) ; seuls les compteurs du résumé restent en mémoire
+    dedupe, summary = OfferDeduper(), OfferSummary()
+    exporter = _run_exporter(args.parquet)
+    try:
+        with RunLog().run(args.company, keywords, pages=args.pages) as log:
+            for kw, offer in scraper.iter_offers(keywords, max_pages=args.pages):
+                log.write(kw, offer)
+                if exporter:
+                    exporter.write(args.company, kw, offer)
+                for o in dedupe.new([offer]):
+                    summary.add(o)
+    finally:
+        if exporter:
+            exporter.close()
+    dedupe.report()
 
     company_name = COMPANIES_REGISTRY[args.company]["name"]
-    print_summary(offers, company_name)
+    print_summary(summary, company_name)
 
-    if offers:
-        save_to_csv(offers, f"resultats_{args.company}.csv")
-        save_to_json(offers, f"resultats_{args.company}.json")
+    if summary.count:
+        print(f"\n🧾 {log.offers} offres ajoutées au journal (lancement {log.run_id}) — python -m backend.runlog")
         print(f"\n✅ Test {company_name} terminé avec succès !")
     else:
         print(f"\n⚠️  Aucune offre récupérée pour {company_name}.")
-        print(f"   💡 Vérifie le fichier debug_{args.company}_page_1.html")
-
+        print(f"   💡 Vérifie les captures : python -m backend.scrapers.artifacts --source {args.company}")
+
+
+def _run_exporter(parquet: bool):
+    """Export Parquet du lancement pendant le scraping (--parquet), sinon None."""
+    if not parquet:
+        return None
+    from backend.export import RunExporter
+    return RunExporter()
+
+
+def run_companies(keys: list[str], keywords: list[str], max_pages: int, parquet: bool = False):
+    """Mode --company all / liste : toutes les entreprises en parallèle, un seul journal."""
+    from backend.runlog import RunLog
+
+    print(f"🏭 {len(keys)} entreprises en parallèle : {', '.join(keys)}")
+    runs: list[CompanyRun] = []
+    started = time.perf_counter()
+    exporter = _run_exporter(parquet)
+    try:
+        with RunLog().run(",".join(keys), keywords, pages=max_pages) as log:
+            for key, kw, offer in scrape_companies(keys, keywords, max_pages, runs):
+                log.write(kw, offer, company=key)
+                if exporter:
+                    exporter.write(key, kw, offer)   # Une partition par entreprise
+    finally:
+        if exporter:
+            exporter.close()
+    print_runs_summary(runs, time.perf_counter() - started)
+    print(f"\n🧾 {log.offers} offres ajoutées au journal (lancement {log.run_id}) — python -m backend.runlog")
 
 if __name__ == "__main__":
     main()
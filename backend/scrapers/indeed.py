@@ -0,0 +1,436 @@
+"""
+🔍 Job Hunter OS — Scraper Indeed (Playwright)
+==============================================
+Scrape les offres d'emploi d'Indeed.fr.
+Utilise Playwright en mode headless pour naviguer comme un vrai navigateur.
+Enregistré comme source "indeed" (IndeedScraper) dans backend/sources.py.
+
+Usage:
+    python -m backend.scrapers.indeed
+    python -m backend.scrapers.indeed --query "développeur python" --location "Paris"
+    python -m backend.scrapers.indeed --query "data analyst" --location "Lyon" --pages 3
+"""
+
+import argparse
+import random
+import time
+from collections.abc import AsyncIterator, Iterator
+
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+
+from backend.scrapers.artifacts import capture_page
+from backend.scrapers.companies import farm_url
+from backend.scrapers.core import OfferDeduper
+from backend.scrapers.records import JobOffer, scrape_batch
+from backend.scrapers.streaming import aiter_in_thread
+from backend.scrapers.resilience import (
+    BlockKind, PageState, classify_block, detect_page_state, get_breaker, goto_with_backoff,
+)
+
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+DEFAULT_QUERY = "développeur"
+DEFAULT_LOCATION = "Paris"
+DEFAULT_PAGES = 1
+BASE_URL = "https://fr.indeed.com"
+
+# Délais aléatoires pour simuler un humain (en secondes)
+MIN_DELAY = 2
+MAX_DELAY = 5
+
+
+# ─── Fonctions utilitaires ────────────────────────────────────────────────────
+
+def human_delay():
+    """Attend un délai aléatoire pour imiter un humain."""
+    delay = random.uniform(MIN_DELAY, MAX_DELAY)
+    print(f"  ⏳ Pause de {delay:.1f}s...")
+    time.sleep(delay)
+
+
+def build_search_url(query: str, location: str, start: int = 0) -> str:
+    """Construit l'URL de recherche Indeed."""
+    from urllib.parse import quote_plus
+    base = farm_url("indeed", BASE_URL)
+    url = f"{base}/jobs?q={quote_plus(query)}&l={quote_plus(location)}"
+    if start > 0:
+        url += f"&start={start}"
+    return url
+
+
+# ─── Parsing des cartes ──────────────────────────────────────────────────────
+
+# Cartes d'offres d'une page de résultats
+JOB_CARDS_SELECTOR = (
+    "div.job_seen_beacon, "
+    "div.jobsearch-ResultsList > div, "
+    "li.css-5lfssm, "
+    "div[data-jk], "
+    "td.resultContent"
+)
+
+
+def parse_card(card) -> JobOffer:
+    """Parse une carte d'offre Indeed."""
+    # Titre du poste
+    title_el = card.locator(
+        "h2.jobTitle a, "
+        "a[data-jk], "
+        "span[id^='jobTitle'], "
+        "h2 a"
+    )
+    titre = title_el.first.inner_text(timeout=2000).strip() if title_el.count() > 0 else "N/A"
+
+    # Lien de l'offre
+    link_el = card.locator("h2 a, a[data-jk], a.jcs-JobTitle")
+    href = ""
+    if link_el.count() > 0:
+        href = link_el.first.get_attribute("href") or ""
+        if href.startswith("/"):
+            href = farm_url("indeed", BASE_URL) + href
+
+    # Entreprise
+    company_el = card.locator(
+        "span[data-testid='company-name'], "
+        "span.css-1h7lukg, "
+        "span.companyName, "
+        "a[data-tn-element='companyName']"
+    )
+    entreprise = company_el.first.inner_text(timeout=2000).strip() if company_el.count() > 0 else "N/A"
+
+    # Lieu
+    location_el = card.locator(
+        "div[data-testid='text-location'], "
+        "div.css-1restlb, "
+        "div.companyLocation"
+    )
+    lieu = location_el.first.inner_text(timeout=2000).strip() if location_el.count() > 0 else "N/A"
+
+    # Description courte
+    desc_el = card.locator(
+        "div.css-9446fg, "
+        "div.job-snippet, "
+        "ul[style] li, "
+        "table.jobCardShelfContainer"
+    )
+    description = ""
+    if desc_el.count() > 0:
+        description = desc_el.first.inner_text(timeout=2000).strip()[:200]
+
+    return JobOffer(
+        titre=titre,
+        entreprise=entreprise,
+        lieu=lieu,
+        url=href,
+        contrat="",
+        date_publication="",
+        description_courte=description,
+        source="indeed",
+    )
+
+
+# ─── Scraper principal ───────────────────────────────────────────────────────
+
+def scrape_indeed(query: str, location: str, max_pages: int = 1,
+                  start_page: int = 0) -> list[JobOffer]:
+    """
+    Scrape les offres d'emploi depuis Indeed.fr avec Playwright.
+
+    Args:
+        query: Mots-clés de recherche (ex: "développeur python")
+        location: Ville ou région (ex: "Paris")
+        max_pages: Nombre de pages de résultats à scraper
+        start_page: Première page à scraper (0-indexée)
+
+    Returns:
+        Liste d'objets JobOffer
+    """
+    return scrape_indeed_many([query], location, max_pages, start_page)[query]
+
+
+def scrape_indeed_many(queries: list[str], location: str, max_pages: int = 1,
+                       start_page: int = 0) -> dict[str, list[JobOffer]]:
+    """
+    Scrape plusieurs mots-clés dans une seule session navigateur
+    (un seul lancement, cookies acceptés une fois).
+
+    Args:
+        queries: Mots-clés de recherche, un par recherche (ex: ["développeur python", "data"])
+        location: Ville ou région (ex: "Paris")
+        max_pages: Nombre de pages de résultats à scraper
+        start_page: Première page à scraper (0-indexée)
+
+    Returns:
+        Dictionnaire mot-clé → offres dédoublonnées
+    """
+    results: dict[str, list[JobOffer]] = {q: [] for q in queries}
+    for query, offer in iter_indeed_offers(queries, location, max_pages, start_page):
+        results[query].append(offer)
+    return results
+
+
+def iter_indeed_offers(queries: list[str], location: str, max_pages: int = 1,
+                       start_page: int = 0) -> Iterator[tuple[str, JobOffer]]:
+    """
+    Version en flux de scrape_indeed_many() : produit les couples (mot-clé, offre)
+    page par page, dédoublonnés par mot-clé, dès qu'une page est parsée.
+    """
+    breaker = get_breaker("indeed")
+    if not breaker.allow():
+        print(f"  🔌 Indeed ignoré (bloqué récemment, encore "
+              f"{breaker.remaining_cooldown() / 60:.0f} min de pause)")
+        return
+
+    with scrape_batch(), sync_playwright() as p:
+        # Lancer le navigateur en mode headless (invisible)
+        browser = p.chromium.launch(
+            headless=True,
+            args=[
+                "--disable-blink-features=AutomationControlled",
+                "--no-sandbox",
+            ]
+        )
+
+        # Créer un contexte avec un User-Agent réaliste
+        context = browser.new_context(
+            user_agent=(
+                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/122.0.0.0 Safari/537.36"
+            ),
+            viewport={"width": 1920, "height": 1080},
+            locale="fr-FR",
+        )
+
+        page = context.new_page()
+
+        # Bloquer les ressources inutiles pour aller plus vite
+        page.route("**/*.{png,jpg,jpeg,gif,svg,ico,woff,woff2}", lambda route: route.abort())
+        page.route("**/analytics**", lambda route: route.abort())
+        page.route("**/tracking**", lambda route: route.abort())
+
+        cookies_accepted = False
+        blocked = False
+
+        for query in queries:
+            dedupe = OfferDeduper()   # Indeed affiche parfois le même job dans 2 containers
+            page_offers: list[JobOffer] = []
+
+            print(f"\n{'='*60}")
+            print(f"🔍 Recherche Indeed : '{query}' à '{location}'")
+            print(f"   Pages à scraper : {max_pages}")
+            print(f"{'='*60}\n")
+
+            last_page = start_page + max_pages
+            for page_num in range(start_page, last_page):
+                start = page_num * 10
+                url = build_search_url(query, location, start)
+
+                print(f"📄 Page {page_num + 1}/{last_page} — {url}")
+
+                try:
+                    # Naviguer vers la page de résultats (retry avec backoff exponentiel)
+                    response = goto_with_backoff(page, url)
+
+                    # Page de blocage détectée dès le chargement : ni scroll ni extraction
+                    state = detect_page_state(page, response)
+                    if state.blocking:
+                        print(f"  🚫 Blocage détecté dès le chargement ({state.value}) ! Arrêt du scraping.")
+                        capture_page(page.content(), url, "indeed", state.value)
+                        breaker.record_failure(state.value)
+                        blocked = True
+                        break
+
+                    human_delay()
+
+                    # Gérer le popup de cookies s'il apparaît — une fois par session
+                    try:
+                        if not cookies_accepted or state is PageState.CONSENT:
+                            cookie_btn = page.locator(
+                                "button#onetrust-accept-btn-handler, "
+                                "button[aria-label='Accepter'], "
+                                "button:has-text('Tout accepter'), "
+                                "button:has-text('Accepter')"
+                            )
+                            cookies_accepted = True
+                            if cookie_btn.count() > 0:
+                                cookie_btn.first.click(timeout=3000)
+                                print("  🍪 Popup cookies fermé")
+                                time.sleep(1)
+                    except Exception:
+                        pass  # Pas de popup, on continue
+
+                    # Chercher les cartes d'offres d'emploi
+                    # Indeed utilise plusieurs sélecteurs possibles selon la version du site
+                    job_cards = page.locator(JOB_CARDS_SELECTOR)
+
+                    count = job_cards.count()
+                    print(f"  📋 {count} offres trouvées sur cette page")
+
+                    if count == 0:
+                        # Capture du HTML pour debug (écrite en arrière-plan)
+                        debug_html = page.content()
+                        block = classify_block(debug_html)
+                        print("  ⚠️  Aucune offre trouvée !")
+                        capture_page(debug_html, url, "indeed", "no_cards" if block is BlockKind.NONE else block.value)
+                        print(f"  💡 Le site a peut-être détecté le scraping ou la structure a changé.")
+
+                        # Vérifier si on est bloqué
+                        if block is not BlockKind.NONE:
+                            print(f"  🚫 Blocage détecté ({block.value}) ! Arrêt du scraping.")
+                            breaker.record_failure(block.value)
+                            blocked = True
+                            break
+                        continue
+
+                    breaker.record_success()
+
+                    # Extraire les données de chaque offre
+                    for i in range(count):
+                        try:
+                            offer = parse_card(job_cards.nth(i))
+                            page_offers.append(offer)
+                            print(f"  ✅ {i+1}. {offer.titre} — {offer.entreprise} ({offer.lieu})")
+
+                        except Exception as e:
+                            print(f"  ⚠️  Erreur sur l'offre {i+1}: {e}")
+                            continue
+
+                except PlaywrightTimeout:
+                    print(f"  ⏰ Timeout sur la page {page_num + 1}, on passe à la suivante")
+                    breaker.record_failure("timeout")
+                    if not breaker.allow():
+                        blocked = True
+                        break
+                    continue
+                except Exception as e:
+                    print(f"  ❌ Erreur inattendue : {e}")
+                    break
+
+                # Offres de la page, transmises sans attendre la suivante
+                yield from ((query, o) for o in dedupe.new(page_offers))
+                page_offers.clear()
+
+                # Pause entre les pages
+                if page_num < last_page - 1:
+                    human_delay()
+
+            yield from ((query, o) for o in dedupe.new(page_offers))   # Page interrompue
+            dedupe.report()
+            if blocked:
+                break
+
+        browser.close()
+
+
+# ─── Source du registre ───────────────────────────────────────────────────────
+
+class IndeedScraper:
+    """Source "indeed" de backend/sources.py : même interface que BaseCorporateScraper."""
+
+    def __init__(self, location: str = "France"):
+        self.location = location
+
+    def scrape_many(self, keywords: list[str], max_pages: int = 1,
+                    start_page: int = 0) -> dict[str, list[JobOffer]]:
+        return scrape_indeed_many(keywords, self.location, max_pages, start_page)
+
+    def extract_job_cards(self, page):
+        return page.locator(JOB_CARDS_SELECTOR)
+
+    def parse_card(self, card, base_url: str) -> JobOffer | None:
+        return parse_card(card)
+
+    def iter_offers(self, keywords: list[str], max_pages: int = 1,
+                    start_page: int = 0) -> Iterator[tuple[str, JobOffer]]:
+        return iter_indeed_offers(keywords, self.location, max_pages, start_page)
+
+    async def aiter_offers(self, keywords: list[str], max_pages: int = 1,
+                           start_page: int = 0) -> AsyncIterator[tuple[str, JobOffer]]:
+        async for item in aiter_in_thread(lambda: self.iter_offers(keywords, max_pages, start_page)):
+            yield item
+
+
+# ─── Résumé ───────────────────────────────────────────────────────────────────
+
+def print_summary(offers: list[JobOffer]):
+    """Affiche un résumé des offres trouvées."""
+    print(f"\n{'='*60}")
+    print(f"📊 RÉSUMÉ — {len(offers)} offres extraites")
+    print(f"{'='*60}")
+
+    if not offers:
+        print("  Aucune offre trouvée.")
+        return
+
+    # Stats par entreprise
+    companies: dict[str, int] = {}
+    for o in offers:
+        companies[o.entreprise] = companies.get(o.entreprise, 0) + 1
+
+    print(f"\n  🏢 Entreprises uniques : {len(companies)}")
+    print(f"  📍 Lieux uniques : {len(set(o.lieu for o in offers))}")
+
+    print(f"\n  Top entreprises :")
+    for company, count in sorted(companies.items(), key=lambda x: x[1], reverse=True)[:5]:
+        print(f"    • {company} ({count} offre{'s' if count > 1 else ''})")
+
+    # Aperçu des premières offres
+    print(f"\n  📋 Aperçu (5 premières) :")
+    for i, o in enumerate(offers[:5], 1):
+        print(f"    {i}. {o.titre}")
+        print(f"       {o.entreprise} — {o.lieu}")
+        if o.description_courte:
+            print(f"       {o.description_courte[:80]}...")
+        print()
+
+
+# ─── Point d'entrée ──────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="🔍 Scraper Indeed.fr — Test Job Hunter OS",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples d'utilisation :
+  python -m backend.scrapers.indeed
+  python -m backend.scrapers.indeed --query "data analyst" --location "Lyon"
+  python -m backend.scrapers.indeed --query "chef de projet" --location "Marseille" --pages 3
+        """
+    )
+    parser.add_argument("--query", "-q", default=DEFAULT_QUERY,
+                        help=f"Mots-clés de recherche (défaut: '{DEFAULT_QUERY}')")
+    parser.add_argument("--location", "-l", default=DEFAULT_LOCATION,
+                        help=f"Ville ou région (défaut: '{DEFAULT_LOCATION}')")
+    parser.add_argument("--pages", "-p", type=int, default=DEFAULT_PAGES,
+                        help=f"Nombre de pages à scraper (défaut: {DEFAULT_PAGES})")
+
+    args = parser.parse_args()
+
+    from backend.runlog import RunLog
+
+    # Lancer le scraping : chaque offre part dans le journal des lancements au fil de l'eau
+    offers = []
+    with RunLog().run("indeed", [args.query], location=args.location, pages=args.pages) as log:
+        for query, offer in iter_indeed_offers([args.query], args.location, args.pages):
+            log.write(query, offer)
+            offers.append(offer)
+
+    # Afficher le résumé
+    print_summary(offers)
+
+    if offers:
+        print(f"\n🧾 {log.offers} offres ajoutées au journal (lancement {log.run_id}) — python -m backend.runlog")
+        print("\n✅ Test terminé avec succès !")
+    else:
+        print("\n⚠️  Aucune offre récupérée.")
+        print("   Causes possibles :")
+        print("   • Indeed a détecté le scraping (CAPTCHA)")
+        print("   • La structure HTML a changé")
+        print("   • Problème de connexion réseau")
+        print("   💡 Vérifie les captures : python -m backend.scrapers.artifacts --source indeed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,466 @@
+"""
+🔍 Job Hunter OS — Scraper LinkedIn Jobs (Playwright)
+=====================================================
+Scrape les offres d'emploi de la page publique LinkedIn Jobs (pas besoin de login).
+Playwright en mode headless pour naviguer comme un vrai navigateur.
+Enregistré comme source "linkedin" (LinkedInScraper) dans backend/sources.py.
+
+Usage:
+    python -m backend.scrapers.linkedin
+    python -m backend.scrapers.linkedin --query "data analyst" --location "Lyon"
+    python -m backend.scrapers.linkedin --query "développeur python" --location "Paris" --pages 3
+"""
+
+import argparse
+import random
+import time
+from collections.abc import AsyncIterator, Iterator
+
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+
+from backend.scrapers.artifacts import capture_page
+from backend.scrapers.companies import farm_url
+from backend.scrapers.core import OfferDeduper
+from backend.scrapers.records import JobOffer, scrape_batch
+from backend.scrapers.streaming import aiter_in_thread
+from backend.scrapers.resilience import (
+    BlockKind, PageState, classify_block, detect_page_state, get_breaker, goto_with_backoff,
+)
+
+
+# ─── Configuration ────────────────────────────────────────────────────────────
+
+DEFAULT_QUERY = "développeur"
+DEFAULT_LOCATION = "Paris"
+DEFAULT_PAGES = 1
+BASE_URL = "https://www.linkedin.com"
+RESULTS_PER_PAGE = 25  # LinkedIn affiche 25 offres par page
+
+# Délais aléatoires pour simuler un humain (en secondes)
+MIN_DELAY = 3
+MAX_DELAY = 6
+
+
+# ─── Fonctions utilitaires ────────────────────────────────────────────────────
+
+def human_delay(min_s: float = MIN_DELAY, max_s: float = MAX_DELAY):
+    """Attend un délai aléatoire pour imiter un humain."""
+    delay = random.uniform(min_s, max_s)
+    print(f"  ⏳ Pause de {delay:.1f}s...")
+    time.sleep(delay)
+
+
+def build_search_url(query: str, location: str, start: int = 0) -> str:
+    """Construit l'URL de recherche LinkedIn Jobs (page publique)."""
+    from urllib.parse import quote_plus
+    base = farm_url("linkedin", BASE_URL)
+    url = f"{base}/jobs/search/?keywords={quote_plus(query)}&location={quote_plus(location)}"
+    if start > 0:
+        url += f"&start={start}"
+    return url
+
+
+# ─── Parsing des cartes ──────────────────────────────────────────────────────
+
+# Cartes d'offres d'une page de résultats
+JOB_CARDS_SELECTOR = (
+    "div.base-card, "
+    "li.jobs-search-results__list-item, "
+    "div.job-search-card, "
+    "ul.jobs-search__results-list > li"
+)
+
+
+def parse_card(card) -> JobOffer | None:
+    """Parse une carte d'offre LinkedIn (None sans titre)."""
+    # Titre du poste
+    title_el = card.locator(
+        "h3.base-search-card__title, "
+        "a.base-card__full-link, "
+        "h3.job-search-card__title, "
+        "span.sr-only"
+    )
+    titre = ""
+    if title_el.count() > 0:
+        titre = title_el.first.inner_text(timeout=2000).strip()
+
+    if not titre:
+        return None
+
+    # Lien de l'offre
+    link_el = card.locator(
+        "a.base-card__full-link, "
+        "a[data-tracking-control-name='public_jobs_jserp-result_search-card']"
+    )
+    href = ""
+    if link_el.count() > 0:
+        href = link_el.first.get_attribute("href") or ""
+        # Nettoyer l'URL (retirer les paramètres de tracking)
+        if "?" in href:
+            href = href.split("?")[0]
+
+    # Entreprise
+    company_el = card.locator(
+        "h4.base-search-card__subtitle, "
+        "a.hidden-nested-link, "
+        "h4.job-search-card__company-name"
+    )
+    entreprise = company_el.first.inner_text(timeout=2000).strip() if company_el.count() > 0 else "N/A"
+
+    # Lieu
+    location_el = card.locator(
+        "span.job-search-card__location, "
+        "span.base-search-card__metadata"
+    )
+    lieu = location_el.first.inner_text(timeout=2000).strip() if location_el.count() > 0 else "N/A"
+
+    # Date de publication
+    date_el = card.locator(
+        "time, "
+        "span.job-search-card__listdate"
+    )
+    date_pub = ""
+    if date_el.count() > 0:
+        date_pub = date_el.first.get_attribute("datetime") or date_el.first.inner_text(timeout=2000).strip()
+
+    return JobOffer(
+        titre=titre,
+        entreprise=entreprise,
+        lieu=lieu,
+        url=href,
+        contrat="",
+        date_publication=date_pub,
+        description_courte="",  # Nécessiterait de cliquer sur chaque offre
+        source="linkedin",
+    )
+
+
+# ─── Scraper principal ───────────────────────────────────────────────────────
+
+def scrape_linkedin(query: str, location: str, max_pages: int = 1,
+                    start_page: int = 0) -> list[JobOffer]:
+    """
+    Scrape les offres d'emploi depuis LinkedIn Jobs avec Playwright.
+    Utilise la page publique (pas besoin de login).
+
+    Args:
+        query: Mots-clés de recherche (ex: "data analyst")
+        location: Ville ou région (ex: "Paris")
+        max_pages: Nombre de pages de résultats à scraper
+        start_page: Première page à scraper (0-indexée)
+
+    Returns:
+        Liste d'objets JobOffer
+    """
+    return scrape_linkedin_many([query], location, max_pages, start_page)[query]
+
+
+def scrape_linkedin_many(queries: list[str], location: str, max_pages: int = 1,
+                         start_page: int = 0) -> dict[str, list[JobOffer]]:
+    """
+    Scrape plusieurs mots-clés dans une seule session navigateur
+    (un seul lancement, cookies acceptés une fois).
+
+    Args:
+        queries: Mots-clés de recherche, un par recherche (ex: ["data analyst", "chef de projet"])
+        location: Ville ou région (ex: "Paris")
+        max_pages: Nombre de pages de résultats à scraper
+        start_page: Première page à scraper (0-indexée)
+
+    Returns:
+        Dictionnaire mot-clé → offres dédoublonnées
+    """
+    results: dict[str, list[JobOffer]] = {q: [] for q in queries}
+    for query, offer in iter_linkedin_offers(queries, location, max_pages, start_page):
+        results[query].append(offer)
+    return results
+
+
+def iter_linkedin_offers(queries: list[str], location: str, max_pages: int = 1,
+                         start_page: int = 0) -> Iterator[tuple[str, JobOffer]]:
+    """
+    Version en flux de scrape_linkedin_many() : produit les couples (mot-clé, offre)
+    page par page, dédoublonnés par mot-clé, dès qu'une page est parsée.
+    """
+    breaker = get_breaker("linkedin")
+    if not breaker.allow():
+        print(f"  🔌 LinkedIn ignoré (bloqué récemment, encore "
+              f"{breaker.remaining_cooldown() / 60:.0f} min de pause)")
+        return
+
+    with scrape_batch(), sync_playwright() as p:
+        browser = p.chromium.launch(
+            headless=True,
+            args=[
+                "--disable-blink-features=AutomationControlled",
+                "--no-sandbox",
+                "--disable-dev-shm-usage",
+            ]
+        )
+
+        context = browser.new_context(
+            user_agent=(
+                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/122.0.0.0 Safari/537.36"
+            ),
+            viewport={"width": 1920, "height": 1080},
+            locale="fr-FR",
+            extra_http_headers={
+                "Accept-Language": "fr-FR,fr;q=0.9,en-US;q=0.8,en;q=0.7",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            }
+        )
+
+        page = context.new_page()
+
+        # Bloquer les ressources inutiles pour aller plus vite
+        page.route("**/*.{png,jpg,jpeg,gif,svg,ico,woff,woff2}", lambda route: route.abort())
+        page.route("**/li/track**", lambda route: route.abort())
+        page.route("**/analytics**", lambda route: route.abort())
+
+        cookies_accepted = False
+        blocked = False
+
+        for query in queries:
+            dedupe = OfferDeduper()
+            page_offers: list[JobOffer] = []
+
+            print(f"\n{'='*60}")
+            print(f"🔍 Recherche LinkedIn : '{query}' à '{location}'")
+            print(f"   Pages à scraper : {max_pages}")
+            print(f"{'='*60}\n")
+
+            last_page = start_page + max_pages
+            for page_num in range(start_page, last_page):
+                start = page_num * RESULTS_PER_PAGE
+                url = build_search_url(query, location, start)
+
+                print(f"📄 Page {page_num + 1}/{last_page} — {url}")
+
+                try:
+                    response = goto_with_backoff(page, url)
+
+                    # Page de blocage détectée dès le chargement : ni scroll ni extraction
+                    state = detect_page_state(page, response)
+                    if state.blocking:
+                        print(f"  🚫 Blocage détecté dès le chargement ({state.value}) ! Arrêt du scraping.")
+                        capture_page(page.content(), url, "linkedin", state.value)
+                        breaker.record_failure(state.value)
+                        blocked = True
+                        break
+
+                    human_delay()
+
+                    # Gérer le popup cookies LinkedIn — une fois par session
+                    try:
+                        if not cookies_accepted or state is PageState.CONSENT:
+                            cookie_btn = page.locator(
+                                "button[action-type='ACCEPT'], "
+                                "button:has-text('Accepter'), "
+                                "button:has-text('Accept'), "
+                                "button.artdeco-global-alert__action"
+                            )
+                            cookies_accepted = True
+                            if cookie_btn.count() > 0:
+                                cookie_btn.first.click(timeout=3000)
+                                print("  🍪 Popup cookies fermé")
+                                time.sleep(1)
+                    except Exception:
+                        pass
+
+                    # Fermer le popup "Rejoignez LinkedIn" s'il apparaît
+                    try:
+                        dismiss_btn = page.locator(
+                            "button[data-tracking-control-name='public_jobs_contextual-sign-in-modal_modal_dismiss'], "
+                            "button.modal__dismiss, "
+                            "icon[data-test-icon='close-medium']"
+                        ).first
+                        if dismiss_btn.is_visible(timeout=2000):
+                            dismiss_btn.click()
+                            print("  ❌ Popup login fermé")
+                            time.sleep(1)
+                    except Exception:
+                        pass
+
+                    # Scroller vers le bas pour charger toutes les offres (lazy loading)
+                    print("  📜 Scroll pour charger les offres...")
+                    for scroll_i in range(5):
+                        page.evaluate("window.scrollBy(0, 800)")
+                        time.sleep(random.uniform(0.5, 1.2))
+
+                    # Remonter en haut
+                    page.evaluate("window.scrollTo(0, 0)")
+                    time.sleep(1)
+
+                    # Chercher les cartes d'offres (LinkedIn public job search)
+                    job_cards = page.locator(JOB_CARDS_SELECTOR)
+
+                    count = job_cards.count()
+                    print(f"  📋 {count} offres trouvées sur cette page")
+
+                    if count == 0:
+                        # Capture du HTML pour debug (écrite en arrière-plan)
+                        debug_html = page.content()
+                        block = classify_block(debug_html)
+                        print("  ⚠️  Aucune offre trouvée !")
+                        capture_page(debug_html, url, "linkedin", "no_cards" if block is BlockKind.NONE else block.value)
+
+                        if block is BlockKind.AUTHWALL:
+                            print("  🔒 LinkedIn demande un login. La page publique est peut-être bloquée.")
+                        if block is not BlockKind.NONE:
+                            print(f"  🚫 Blocage détecté ({block.value}) ! Arrêt du scraping.")
+                            breaker.record_failure(block.value)
+                            blocked = True
+                            break
+                        continue
+
+                    breaker.record_success()
+
+                    # Extraire les données de chaque offre
+                    for i in range(count):
+                        try:
+                            offer = parse_card(job_cards.nth(i))
+                            if offer is None:
+                                continue
+                            page_offers.append(offer)
+                            print(f"  ✅ {i+1}. {offer.titre} — {offer.entreprise} ({offer.lieu})")
+
+                        except Exception as e:
+                            print(f"  ⚠️  Erreur sur l'offre {i+1}: {e}")
+                            continue
+
+                except PlaywrightTimeout:
+                    print(f"  ⏰ Timeout sur la page {page_num + 1}, on passe à la suivante")
+                    breaker.record_failure("timeout")
+                    if not breaker.allow():
+                        blocked = True
+                        break
+                    continue
+                except Exception as e:
+                    print(f"  ❌ Erreur inattendue : {e}")
+                    break
+
+                # Offres de la page, transmises sans attendre la suivante
+                yield from ((query, o) for o in dedupe.new(page_offers))
+                page_offers.clear()
+
+                # Pause entre les pages
+                if page_num < last_page - 1:
+                    human_delay(4, 7)
+
+            yield from ((query, o) for o in dedupe.new(page_offers))   # Page interrompue
+            dedupe.report()
+            if blocked:
+                break
+
+        browser.close()
+
+
+# ─── Source du registre ───────────────────────────────────────────────────────
+
+class LinkedInScraper:
+    """Source "linkedin" de backend/sources.py : même interface que BaseCorporateScraper."""
+
+    def __init__(self, location: str = "France"):
+        self.location = location
+
+    def scrape_many(self, keywords: list[str], max_pages: int = 1,
+                    start_page: int = 0) -> dict[str, list[JobOffer]]:
+        return scrape_linkedin_many(keywords, self.location, max_pages, start_page)
+
+    def extract_job_cards(self, page):
+        return page.locator(JOB_CARDS_SELECTOR)
+
+    def parse_card(self, card, base_url: str) -> JobOffer | None:
+        return parse_card(card)
+
+    def iter_offers(self, keywords: list[str], max_pages: int = 1,
+                    start_page: int = 0) -> Iterator[tuple[str, JobOffer]]:
+        return iter_linkedin_offers(keywords, self.location, max_pages, start_page)
+
+    async def aiter_offers(self, keywords: list[str], max_pages: int = 1,
+                           start_page: int = 0) -> AsyncIterator[tuple[str, JobOffer]]:
+        async for item in aiter_in_thread(lambda: self.iter_offers(keywords, max_pages, start_page)):
+            yield item
+
+
+# ─── Résumé ───────────────────────────────────────────────────────────────────
+
+def print_summary(offers: list[JobOffer]):
+    """Affiche un résumé des offres trouvées."""
+    print(f"\n{'='*60}")
+    print(f"📊 RÉSUMÉ — {len(offers)} offres extraites")
+    print(f"{'='*60}")
+
+    if not offers:
+        print("  Aucune offre trouvée.")
+        return
+
+    companies: dict[str, int] = {}
+    for o in offers:
+        companies[o.entreprise] = companies.get(o.entreprise, 0) + 1
+
+    print(f"\n  🏢 Entreprises uniques : {len(companies)}")
+    print(f"  📍 Lieux uniques : {len(set(o.lieu for o in offers))}")
+
+    print(f"\n  Top entreprises :")
+    for company, count in sorted(companies.items(), key=lambda x: x[1], reverse=True)[:5]:
+        print(f"    • {company} ({count} offre{'s' if count > 1 else ''})")
+
+    print(f"\n  📋 Aperçu (5 premières) :")
+    for i, o in enumerate(offers[:5], 1):
+        print(f"    {i}. {o.titre}")
+        print(f"       {o.entreprise} — {o.lieu}")
+        if o.date_publication:
+            print(f"       📅 {o.date_publication}")
+        print()
+
+
+# ─── Point d'entrée ──────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="🔍 Scraper LinkedIn Jobs — Test Job Hunter OS",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemples d'utilisation :
+  python -m backend.scrapers.linkedin
+  python -m backend.scrapers.linkedin --query "data analyst" --location "Lyon"
+  python -m backend.scrapers.linkedin --query "chef de projet" --location "Marseille" --pages 2
+        """
+    )
+    parser.add_argument("--query", "-q", default=DEFAULT_QUERY,
+                        help=f"Mots-clés de recherche (défaut: '{DEFAULT_QUERY}')")
+    parser.add_argument("--location", "-l", default=DEFAULT_LOCATION,
+                        help=f"Ville ou région (défaut: '{DEFAULT_LOCATION}')")
+    parser.add_argument("--pages", "-p", type=int, default=DEFAULT_PAGES,
+                        help=f"Nombre de pages à scraper (défaut: {DEFAULT_PAGES})")
+
+    args = parser.parse_args()
+
+    from backend.runlog import RunLog
+
+    # Lancer le scraping : chaque offre part dans le journal des lancements au fil de l'eau
+    offers = []
+    with RunLog().run("linkedin", [args.query], location=args.location, pages=args.pages) as log:
+        for query, offer in iter_linkedin_offers([args.query], args.location, args.pages):
+            log.write(query, offer)
+            offers.append(offer)
+
+    print_summary(offers)
+
+    if offers:
+        print(f"\n🧾 {log.offers} offres ajoutées au journal (lancement {log.run_id}) — python -m backend.runlog")
+        print("\n✅ Test terminé avec succès !")
+    else:
+        print("\n⚠️  Aucune offre récupérée.")
+        print("   Causes possibles :")
+        print("   • LinkedIn bloque le scraping (authwall/CAPTCHA)")
+        print("   • La structure HTML a changé")
+        print("   • Problème de connexion réseau")
+        print("   💡 Vérifie les captures : python -m backend.scrapers.artifacts --source linkedin")
+
+
+if __name__ == "__main__":
+    main()
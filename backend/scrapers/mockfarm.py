@@ -0,0 +1,345 @@
+"""
+🧪 Job Hunter OS — Ferme de sites carrières locale
+===================================================
+Un serveur HTTP local qui imite EDF, TotalEnergies, Safran, Airbus, Engie,
+Indeed et LinkedIn, pour mesurer le moteur de scraping hors ligne : offres
+par seconde, montée en charge avec --company all, backoff et coupe-circuit.
+
+Chaque site a son sous-domaine de localhost (Chromium les résout vers la
+machine locale ; les limites par hôte restent donc par site) :
+
+    http://edf.localhost:8765/edf-recrute/…?page=2&search[keyword]=data
+    http://indeed.localhost:8765/jobs?q=data&start=10
+
+Le sous-domaine (ou, à défaut, le premier segment du chemin : /edf/…)
+désigne le site ; la page de résultats reprend le balisage des pages
+capturées (mêmes sélecteurs que les scrapers) et la pagination de chaque
+build_url(). Les offres viennent de data/results/resultats_<site>.json,
+répétées jusqu'à --offers par site avec des URLs uniques.
+
+Pannes injectées, tirées par requête :
+    - latence (--latency, --jitter)
+    - bandeau de cookies sur chaque page (--consent)
+    - page captcha 403 façon Cloudflare (--captcha-rate)
+    - erreur HTTP (--error-rate, --error-status)
+    - connexion coupée sans réponse (--reset-rate) : page.goto échoue, backoff
+
+Usage:
+    python -m backend.scrapers.mockfarm --latency 300 --captcha-rate 0.02
+    JOB_HUNTER_MOCK_FARM=localhost:8765 python -m backend.scrapers.core --company all -k data --pages 5
+    curl http://127.0.0.1:8765/_stats    # requêtes servies par site et par statut
+"""
+
+import argparse
+import html
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote_plus, urlparse
+
+from backend.database import DATA_DIR
+
+RESULTS_DIR = os.path.join(DATA_DIR, "results")
+DEFAULT_PORT = 8765
+DEFAULT_OFFERS = 200   # Offres par site
+
+
+@dataclass
+class Faults:
+    """Pannes injectées (taux entre 0 et 1, tirés à chaque requête)."""
+    latency_ms: float = 0
+    jitter_ms: float = 0
+    consent: bool = False
+    captcha_rate: float = 0
+    error_rate: float = 0
+    error_status: int = 503
+    reset_rate: float = 0
+    seed: int | None = None
+
+
+# ─── Sites ────────────────────────────────────────────────────────────────────
+
+ONETRUST_BANNER = (
+    '<div id="onetrust-banner-sdk"><p>Nous utilisons des cookies.</p>'
+    '<button id="onetrust-accept-btn-handler" onclick="this.parentNode.remove()">Tout accepter</button></div>'
+)
+COOKIEBOT_BANNER = (
+    '<div id="CybotCookiebotDialog"><p>Ce site utilise des cookies.</p>'
+    '<button id="CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll" '
+    'onclick="this.parentNode.remove()">Autoriser tous les cookies</button></div>'
+)
+
+
+@dataclass(frozen=True)
+class Site:
+    """Un site imité : paramètres de recherche (ceux de build_url) et gabarits."""
+    key: str
+    page_size: int
+    page_param: str           # Paramètre de pagination
+    page_unit: str            # "page" (numéro de page), "offset" (index de la 1re offre) ou "none"
+    first_page: int           # Numéro de la première page ("page")
+    keyword_param: str        # "" : mot-clé en fin de chemin (TotalEnergies)
+    title: str
+    list_html: str            # Conteneur des cartes, {cards} remplacé
+    card_html: str            # Gabarit d'une carte : {id} {titre} {entreprise} {lieu} {contrat} {date}
+    consent_html: str = ONETRUST_BANNER
+
+    def offset(self, params: dict[str, list[str]]) -> int:
+        value = params.get(self.page_param, [""])[0]
+        number = int(value) if value.isdigit() else None
+        if self.page_unit == "offset":
+            return number or 0
+        if self.page_unit == "page" and number is not None:
+            return max(number - self.first_page, 0) * self.page_size
+        return 0
+
+    def keyword(self, path: str, params: dict[str, list[str]]) -> str:
+        if self.keyword_param:
+            return params.get(self.keyword_param, [""])[0]
+        last = path.rstrip("/").rsplit("/", 1)[-1]
+        return "" if last == "SearchJobs" else unquote_plus(last)
+
+
+SITES: dict[str, Site] = {site.key: site for site in (
+    Site("edf", 10, "page", "page", 1, "search[keyword]", "Nos offres | EDF Recrute",
+         '<div class="offers-list">{cards}</div>',
+         '<a class="offer-link" href="/edf-recrute/offre/detail/mock-{id}"><span>{date}</span>'
+         '<h3>{titre}</h3><p>Contrat : {contrat}</p><p>Lieu : {lieu}</p></a>'),
+    Site("totalenergies", 20, "jobOffset", "offset", 0, "", "Offres d'emploi | TotalEnergies",
+         '<section class="section--results">{cards}</section>',
+         '<div class="article--result"><h3 class="article__header__text__title">'
+         '<a class="link" href="/fr_FR/careers/JobDetail/mock/{id}">{titre}</a></h3><ul>'
+         '<li class="list-item-jobCountry">{lieu}</li><li class="list-item-employmentType">{contrat}</li>'
+         '<li class="list-item-jobCreationDate">{date}</li>'
+         '<li class="list-item-jobEmployerCompany">{entreprise}</li></ul></div>'),
+    Site("safran", 10, "page", "page", 0, "search", "Offres d'emploi | Safran",
+         '<div class="c-offers-list">{cards}</div>',
+         '<div class="c-offer-item"><a class="c-offer-item__title" href="/fr/offres/mock-{id}">{titre}</a>'
+         '<span>{date}</span><div><span>{entreprise}</span><span>{lieu}</span><span>Cadre</span>'
+         '<span>{contrat}</span></div></div>'),
+    Site("airbus", 20, "", "none", 0, "q", "Airbus Careers",
+         '<section data-automation-id="jobResults"><ul>{cards}</ul></section>',
+         '<li><h3><a data-automation-id="jobTitle" href="/fr-FR/Airbus/job/mock_{id}">{titre}</a></h3>'
+         '<div data-automation-id="locations"><dt>locations</dt><dd>{lieu}</dd></div>'
+         '<div data-automation-id="postedOn">{date}</div><ul data-automation-id="subtitle"><li>JR{id}</li></ul></li>'),
+    Site("engie", 10, "startrow", "offset", 0, "q", "Offres d'emploi | ENGIE",
+         '<ul data-testid="jobCardList">{cards}</ul>',
+         '<li data-testid="jobCard"><a class="jobCardTitle" href="/job/mock/{id}-fr_FR">{titre}</a>'
+         '<div data-testid="jobCardLocation">{lieu}</div><div>'
+         '<span class="jobCardFooterValue">{contrat}</span><span class="jobCardFooterValue">{id}</span>'
+         '<span class="jobCardFooterValue">{entreprise}</span><span class="jobCardFooterValue">{date}</span>'
+         '</div></li>',
+         COOKIEBOT_BANNER),
+    Site("indeed", 10, "start", "offset", 0, "q", "Emplois | Indeed",
+         '<div id="mosaic-jobResults">{cards}</div>',
+         '<div class="job_seen_beacon"><h2 class="jobTitle"><a data-jk="{id}" href="/rc/clk?jk={id}">{titre}</a>'
+         '</h2><span data-testid="company-name">{entreprise}</span>'
+         '<div data-testid="text-location">{lieu}</div><div class="css-9446fg">{contrat}</div></div>'),
+    Site("linkedin", 25, "start", "offset", 0, "keywords", "Offres d'emploi | LinkedIn",
+         '<ul class="mock-results">{cards}</ul>',
+         '<li><div class="base-card"><a class="base-card__full-link" '
+         'href="https://www.linkedin.com/jobs/view/mock-{id}?trk=public_jobs"><span class="sr-only">{titre}</span>'
+         '</a><h3 class="base-search-card__title">{titre}</h3><h4 class="base-search-card__subtitle">{entreprise}</h4>'
+         '<span class="job-search-card__location">{lieu}</span><time datetime="{date}">{date}</time></div></li>'),
+)}
+
+CAPTCHA_PAGE = (
+    "<!DOCTYPE html><html><head><title>Just a moment...</title></head><body>"
+    '<form id="challenge-form" action="/cdn-cgi/challenge-platform" method="POST">'
+    "<p>Vérification que vous n'êtes pas un robot.</p></form></body></html>"
+)
+
+
+def load_offers(key: str, results_dir: str = RESULTS_DIR) -> list[dict]:
+    """Offres enregistrées d'un site (une offre générique s'il n'y en a pas)."""
+    path = os.path.join(results_dir, f"resultats_{key}.json")
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            offers = json.load(f)
+        if offers:
+            return offers
+    return [{"titre": "Ingénieur", "entreprise": key, "lieu": "France", "contrat": "CDI", "date_publication": ""}]
+
+
+def render_page(site: Site, offers: list[dict], total: int, offset: int, keyword: str = "",
+                consent: bool = False) -> str:
+    """Page de résultats : offres [offset, offset + page_size) d'un total de `total`."""
+    cards = []
+    for i in range(offset, min(offset + site.page_size, total)):
+        offer = offers[i % len(offers)]
+        values = {name: html.escape(str(offer.get(name) or "")) for name in ("titre", "entreprise", "lieu", "contrat")}
+        values["date"] = html.escape(str(offer.get("date_publication") or "").split("\n")[-1])
+        cards.append(site.card_html.format(id=100000 + i, **values))
+    banner = site.consent_html if consent else ""
+    return (
+        f"<!DOCTYPE html><html lang=\"fr\"><head><meta charset=\"utf-8\"><title>{html.escape(site.title)}</title>"
+        f"</head><body><h1>{len(cards)} offres — {html.escape(keyword)}</h1>"
+        f"{site.list_html.format(cards=''.join(cards))}{banner}</body></html>"
+    )
+
+
+# ─── Serveur ──────────────────────────────────────────────────────────────────
+
+class MockFarm:
+    """
+    Ferme de sites dans un thread (tests) ou au premier plan (CLI).
+
+    Usage:
+        with MockFarm(port=0, faults=Faults(latency_ms=200)) as farm:
+            os.environ["JOB_HUNTER_MOCK_FARM"] = farm.address
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT, offers_per_site: int = DEFAULT_OFFERS,
+                 faults: Faults | None = None, results_dir: str = RESULTS_DIR):
+        self.offers_per_site = offers_per_site
+        self.faults = faults or Faults()
+        self.stats: Counter = Counter()   # (site, statut) → requêtes
+        self._offers = {key: load_offers(key, results_dir) for key in SITES}
+        self._random = random.Random(self.faults.seed)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+
+    @property
+    def port(self) -> int:
+        return self.server.server_address[1]
+
+    @property
+    def address(self) -> str:
+        """Valeur de JOB_HUNTER_MOCK_FARM pour cette ferme."""
+        return f"localhost:{self.port}"
+
+    def _draw(self) -> float:
+        with self._lock:
+            return self._random.random()
+
+    def _record(self, site: str, status: int | str):
+        with self._lock:
+            self.stats[(site, status)] += 1
+
+    def stats_by_site(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            result: dict[str, dict[str, int]] = {}
+            for (site, status), count in sorted(self.stats.items(), key=str):
+                result.setdefault(site, {})[str(status)] = count
+            return result
+
+    def respond(self, host: str, target: str) -> tuple[str, int | None, dict[str, str], str]:
+        """
+        Réponse à une requête GET : (site, statut, en-têtes, corps). Un statut
+        None signifie couper la connexion sans répondre.
+        """
+        url = urlparse(target)
+        site_key = host.split(":", 1)[0].split(".", 1)[0]
+        path = url.path
+        if site_key not in SITES:
+            site_key, _, rest = path.lstrip("/").partition("/")
+            path = "/" + rest
+        site = SITES.get(site_key)
+        if site is None:
+            return site_key or "?", 404, {}, "Site inconnu"
+
+        faults = self.faults
+        delay = faults.latency_ms + (self._draw() * faults.jitter_ms if faults.jitter_ms else 0)
+        if delay:
+            time.sleep(delay / 1000)
+        if faults.reset_rate and self._draw() < faults.reset_rate:
+            return site.key, None, {}, ""
+        if faults.captcha_rate and self._draw() < faults.captcha_rate:
+            return site.key, 403, {"cf-mitigated": "challenge"}, CAPTCHA_PAGE
+        if faults.error_rate and self._draw() < faults.error_rate:
+            return site.key, faults.error_status, {}, f"<html><body>Erreur {faults.error_status}</body></html>"
+
+        params = parse_qs(url.query)
+        body = render_page(site, self._offers[site.key], self.offers_per_site, site.offset(params),
+                           site.keyword(path, params), faults.consent)
+        return site.key, 200, {}, body
+
+    def _handler_class(self):
+        farm = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/_stats":
+                    self._send(200, {"content-type": "application/json"}, json.dumps(farm.stats_by_site()))
+                    return
+                site, status, headers, body = farm.respond(self.headers.get("Host", ""), self.path)
+                farm._record(site, status or "reset")
+                if status is None:
+                    self.close_connection = True
+                    self.connection.close()
+                    return
+                self._send(status, {"content-type": "text/html; charset=utf-8", **headers}, body)
+
+            def _send(self, status: int, headers: dict[str, str], body: str):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("content-length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass   # Silencieux : /_stats et le résumé de fin suffisent
+
+        return Handler
+
+    def start(self) -> "MockFarm":
+        self._thread = threading.Thread(target=self.server.serve_forever, name="mockfarm", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+# ─── Point d'entrée ──────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="🧪 Ferme de sites carrières locale")
+    parser.add_argument("--host", default="127.0.0.1", help="Adresse d'écoute (défaut: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (défaut: {DEFAULT_PORT})")
+    parser.add_argument("--offers", type=int, default=DEFAULT_OFFERS,
+                        help=f"Offres par site (défaut: {DEFAULT_OFFERS})")
+    parser.add_argument("--latency", type=float, default=0, help="Latence ajoutée à chaque réponse (ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="Latence aléatoire en plus, jusqu'à (ms)")
+    parser.add_argument("--consent", action="store_true", help="Bandeau de cookies sur chaque page")
+    parser.add_argument("--captcha-rate", type=float, default=0, help="Part des pages captcha (0-1)")
+    parser.add_argument("--error-rate", type=float, default=0, help="Part des réponses en erreur HTTP (0-1)")
+    parser.add_argument("--error-status", type=int, default=503, help="Statut des erreurs (défaut: 503)")
+    parser.add_argument("--reset-rate", type=float, default=0, help="Part des connexions coupées (0-1)")
+    parser.add_argument("--seed", type=int, default=None, help="Graine des tirages (reproductible)")
+    args = parser.parse_args()
+
+    faults = Faults(args.latency, args.jitter, args.consent, args.captcha_rate, args.error_rate,
+                    args.error_status, args.reset_rate, args.seed)
+    farm = MockFarm(args.host, args.port, args.offers, faults)
+    print(f"🧪 Ferme de sites sur http://{args.host}:{farm.port} — {', '.join(SITES)}")
+    print(f"   JOB_HUNTER_MOCK_FARM={farm.address} pour y diriger les scrapers\n")
+    try:
+        farm.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        farm.server.server_close()
+        print("\n📊 Requêtes servies :")
+        for site, statuses in farm.stats_by_site().items():
+            print(f"  {site:15s} " + "  ".join(f"{status}: {count}" for status, count in statuses.items()))
+
+
+if __name__ == "__main__":
+    main()
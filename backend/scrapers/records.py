@@ -0,0 +1,70 @@
+"""
+📦 Job Hunter OS — Enregistrement JobOffer des scrapers
+=======================================================
+Une offre telle qu'extraite d'un site, partagée par tous les scrapers
+(sites carrières, Indeed, LinkedIn) et sans dépendance à Playwright.
+
+Un lot multi-mots-clés peut garder des milliers d'offres en mémoire avant
+la persistance ; l'enregistrement est donc compact :
+
+    - slots=True : pas de __dict__ par offre
+    - frozen=True : une offre extraite ne change plus (hashable)
+    - les champs très répétés (entreprise, lieu, contrat, source) sont
+      internés : une seule chaîne par valeur distincte pour tout le lot
+    - date_scraping est l'horodatage du lot (scrape_batch), calculé une
+      fois, et non un datetime.now().isoformat() par offre
+"""
+
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+
+# Champs à faible cardinalité, internés à la construction
+INTERNED_FIELDS = ("entreprise", "lieu", "contrat", "source")
+
+_batch_timestamp: ContextVar[str | None] = ContextVar("batch_timestamp", default=None)
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+def scraping_timestamp() -> str:
+    """Horodatage du lot en cours, ou l'instant présent hors lot."""
+    return _batch_timestamp.get() or datetime.now().isoformat()
+
+
+@contextmanager
+def scrape_batch():
+    """
+    Toutes les offres créées dans le bloc (ou la fonction décorée) partagent
+    le même date_scraping. Un lot imbriqué garde l'horodatage du lot englobant.
+    """
+    if _batch_timestamp.get() is not None:
+        yield _batch_timestamp.get()
+        return
+    token = _batch_timestamp.set(sys.intern(datetime.now().isoformat()))
+    try:
+        yield _batch_timestamp.get()
+    finally:
+        _batch_timestamp.reset(token)
+
+
+@dataclass(frozen=True, slots=True)
+class JobOffer:
+    """Représente une offre d'emploi extraite d'un site."""
+    titre: str
+    entreprise: str
+    lieu: str
+    url: str
+    contrat: str          # CDI, CDD, Stage, Alternance...
+    date_publication: str
+    description_courte: str
+    source: str           # Nom du site (edf, totalenergies, indeed, etc.)
+    date_scraping: str = field(default_factory=scraping_timestamp)
+
+    def __post_init__(self):
+        for name in INTERNED_FIELDS:
+            object.__setattr__(self, name, _intern(getattr(self, name)))
@@ -0,0 +1,323 @@
+"""
+🛡️ Job Hunter OS — Couche de résilience partagée des scrapers
+==============================================================
+Regroupe ce que chaque scraper réimplémentait à sa façon :
+
+    - BackoffPolicy   : retry exponentiel avec jitter (au lieu d'un sleep fixe 3–6 s)
+    - detect_page_state : état d'une page juste après goto (ok, consentement,
+                        authwall, captcha, WAF) sans attendre l'extraction
+    - classify_block  : classification blocage / captcha / authwall d'une page
+                        vide, d'après son titre et des éléments caractéristiques
+    - CircuitBreaker  : coupe-circuit par source ; après plusieurs blocages,
+                        la source est ignorée pendant une période de refroidissement
+    - HostRateLimiter : intervalle minimal entre deux chargements de page
+                        vers un même hôte, tous threads confondus
+
+Les coupe-circuits et la limite de débit sont partagés au niveau du
+process (voir get_breaker, HOST_RATE_LIMITER), donc un serveur API qui
+enchaîne les requêtes ne repaie pas les minutes d'attente d'une source
+déjà bloquée.
+"""
+
+import os
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from html import unescape
+from urllib.parse import urlparse
+
+
+# ─── Backoff exponentiel ─────────────────────────────────────────────────────
+
+@dataclass
+class BackoffPolicy:
+    """Délais de retry : base * factor**attempt, plafonné, avec jitter."""
+    attempts: int = 3
+    base_delay: float = 2.0
+    factor: float = 2.0
+    max_delay: float = 30.0
+    jitter: float = 0.5   # Fraction du délai tirée aléatoirement (0 = aucun)
+
+    def delay(self, attempt: int) -> float:
+        """Délai à attendre après l'échec de la tentative `attempt` (0-indexée)."""
+        raw = min(self.max_delay, self.base_delay * (self.factor ** attempt))
+        return raw * (1 - self.jitter) + random.uniform(0, raw * self.jitter)
+
+
+DEFAULT_BACKOFF = BackoffPolicy()
+
+
+# ─── Limite de débit par hôte ────────────────────────────────────────────────
+
+class HostRateLimiter:
+    """
+    Réserve à chaque chargement un créneau par hôte, espacé d'au moins
+    `min_interval_s` du précédent. Des scrapers lancés en parallèle
+    (python -m backend.scrapers.core --company all) ne dépassent donc pas
+    un chargement par intervalle sur un même site.
+    """
+
+    def __init__(self, min_interval_s: float = 2.0):
+        self.min_interval_s = min_interval_s
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> float:
+        """Attend le créneau de l'hôte de `url`. Retourne l'attente en secondes."""
+        host = urlparse(url).netloc or url
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.min_interval_s
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+HOST_RATE_LIMITER = HostRateLimiter(float(os.getenv("JOB_HUNTER_HOST_INTERVAL", "2")))
+
+
+def goto_with_backoff(page, url: str, policy: BackoffPolicy = DEFAULT_BACKOFF,
+                      timeout: int = 30000, limiter: HostRateLimiter | None = HOST_RATE_LIMITER):
+    """
+    Navigue vers `url` en réessayant avec backoff exponentiel. Chaque
+    tentative attend son créneau auprès de `limiter` (None : aucune limite).
+
+    Returns:
+        La réponse Playwright (peut être None pour une navigation sans réponse)
+
+    Raises:
+        L'exception de la dernière tentative si toutes ont échoué.
+    """
+    for attempt in range(policy.attempts):
+        if limiter is not None:
+            limiter.wait(url)
+        try:
+            return page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+        except Exception as e:
+            print(f"  🔄 Tentative {attempt + 1}/{policy.attempts} échouée : {type(e).__name__}")
+            if attempt == policy.attempts - 1:
+                raise
+            delay = policy.delay(attempt)
+            print(f"  ⏳ Nouvel essai dans {delay:.1f}s...")
+            time.sleep(delay)
+
+
+# ─── Détection précoce de l'état de la page ─────────────────────────────────
+
+class PageState(str, Enum):
+    """État d'une page juste après sa navigation."""
+    OK = "ok"
+    CONSENT = "consent"     # Bandeau de cookies à fermer : pas un blocage
+    AUTHWALL = "authwall"
+    CAPTCHA = "captcha"
+    WAF = "waf"
+
+    @property
+    def blocking(self) -> bool:
+        return self in (PageState.AUTHWALL, PageState.CAPTCHA, PageState.WAF)
+
+
+WAF_STATUSES = {403, 429, 503, 999}   # 999 : refus propre à LinkedIn
+
+# Chemins de l'URL finale (après redirections)
+URL_MARKERS: list[tuple[PageState, tuple[str, ...]]] = [
+    (PageState.CAPTCHA, ("/captcha", "/cdn-cgi/challenge", "captcha-delivery.com", "validate.perfdrive.com")),
+    (PageState.AUTHWALL, ("/authwall", "/uas/login", "/checkpoint/", "/login?", "/signup?",
+                          "secure.indeed.com/auth")),
+    (PageState.CONSENT, ("consent.", "/consent")),
+]
+# Titres (document.title) : une page de blocage a rarement un titre de liste d'offres
+TITLE_MARKERS: list[tuple[PageState, tuple[str, ...]]] = [
+    (PageState.CAPTCHA, ("just a moment", "un instant", "captcha", "are you a robot", "êtes-vous un robot",
+                         "security check", "vérification de sécurité")),
+    (PageState.WAF, ("access denied", "accès refusé", "attention required", "request rejected",
+                     "403 forbidden", "error 1020", "request unsuccessful")),
+    (PageState.AUTHWALL, ("sign in | linkedin", "s'identifier | linkedin", "connexion | linkedin",
+                          "sign up | linkedin", "s'inscrire | linkedin",
+                          "connexion | comptes indeed", "sign in | indeed accounts")),
+]
+# Éléments propres aux pages de blocage (pas le bouton "S'identifier" d'une page normale)
+SELECTOR_MARKERS: dict[str, str] = {
+    PageState.CAPTCHA.value: ("iframe[src*='captcha'], iframe[src*='challenges.cloudflare.com'], "
+                              ".g-recaptcha, .h-captcha, #captcha-container, #challenge-form, #px-captcha"),
+    PageState.AUTHWALL.value: "form.authwall-join-form, .authwall-sign-in-form, main.authwall, #organic-div form.login__form",
+    PageState.CONSENT.value: ("#onetrust-banner-sdk, #didomi-host, #footer_tc_privacy, #tarteaucitronRoot, "
+                              "#CybotCookiebotDialog, #axeptio_overlay"),
+}
+
+# Un seul aller-retour avec le navigateur : titre + présence de chaque marqueur
+_PROBE_JS = """(selectors) => {
+    const found = {};
+    for (const [state, selector] of Object.entries(selectors)) {
+        found[state] = document.querySelector(selector) !== null;
+    }
+    return {title: document.title || "", found};
+}"""
+
+
+def _match_markers(markers: list[tuple[PageState, tuple[str, ...]]], text: str) -> PageState | None:
+    for state, needles in markers:
+        if any(n in text for n in needles):
+            return state
+    return None
+
+
+def detect_page_state(page, response=None) -> PageState:
+    """
+    Classe la page juste après page.goto() d'après le statut HTTP, les
+    en-têtes, l'URL finale, le <title> et quelques sélecteurs. Quelques
+    millisecondes : une page bloquée ne coûte ni le scroll ni les timeouts
+    d'extraction.
+    """
+    status = getattr(response, "status", None)
+    headers = {k.lower(): v for k, v in (getattr(response, "headers", None) or {}).items()}
+    if headers.get("cf-mitigated") == "challenge":
+        return PageState.CAPTCHA
+    if status in WAF_STATUSES and ("x-datadome" in headers or "x-px-block" in headers):
+        return PageState.CAPTCHA
+
+    url_state = _match_markers(URL_MARKERS, (getattr(page, "url", "") or "").lower())
+    if url_state in (PageState.CAPTCHA, PageState.AUTHWALL):
+        return url_state
+
+    try:
+        probe = page.evaluate(_PROBE_JS, SELECTOR_MARKERS)
+    except Exception:
+        probe = {"title": "", "found": {}}
+    found = probe.get("found") or {}
+    title_state = _match_markers(TITLE_MARKERS, (probe.get("title") or "").lower())
+
+    if found.get(PageState.CAPTCHA.value) or title_state is PageState.CAPTCHA:
+        return PageState.CAPTCHA
+    if found.get(PageState.AUTHWALL.value) or title_state is PageState.AUTHWALL:
+        return PageState.AUTHWALL
+    if title_state is PageState.WAF or status in WAF_STATUSES:
+        return PageState.WAF
+    if url_state is PageState.CONSENT or found.get(PageState.CONSENT.value):
+        return PageState.CONSENT
+    return PageState.OK
+
+
+# ─── Classification des blocages ─────────────────────────────────────────────
+
+class BlockKind(str, Enum):
+    """Nature d'une page qui ne contient pas d'offres."""
+    NONE = "none"
+    CAPTCHA = "captcha"
+    AUTHWALL = "authwall"
+    BLOCKED = "blocked"
+
+
+# Éléments propres aux pages de blocage, repérés par leur id ou une de leurs
+# classes (les équivalents statiques de SELECTOR_MARKERS) : un script reCAPTCHA
+# en pied de page ou un lien vers /authwall ne suffisent pas
+BLOCK_ELEMENT_MARKERS: list[tuple[BlockKind, set[str]]] = [
+    (BlockKind.CAPTCHA, {"g-recaptcha", "h-captcha", "captcha-container", "challenge-form", "px-captcha"}),
+    (BlockKind.AUTHWALL, {"authwall", "authwall-join-form", "authwall-sign-in-form"}),
+]
+CAPTCHA_IFRAME_MARKERS = ("captcha", "challenges.cloudflare.com")
+_PAGE_STATE_BLOCKS = {
+    PageState.CAPTCHA: BlockKind.CAPTCHA,
+    PageState.AUTHWALL: BlockKind.AUTHWALL,
+    PageState.WAF: BlockKind.BLOCKED,
+}
+
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.I | re.S)
+_ID_CLASS_RE = re.compile(r"""\b(?:id|class)\s*=\s*["']([^"']*)["']""", re.I)
+_IFRAME_SRC_RE = re.compile(r"""<iframe\b[^>]*\bsrc\s*=\s*["']([^"']*)["']""", re.I)
+
+
+def classify_block(html: str) -> BlockKind:
+    """
+    Détermine si une page vide correspond à un blocage anti-bot, d'après son
+    <title> (TITLE_MARKERS) et des éléments caractéristiques, jamais d'après
+    une sous-chaîne quelconque du HTML.
+    """
+    tokens = {t.lower() for value in _ID_CLASS_RE.findall(html) for t in value.split()}
+    if any(m in src.lower() for src in _IFRAME_SRC_RE.findall(html) for m in CAPTCHA_IFRAME_MARKERS):
+        return BlockKind.CAPTCHA
+    for kind, markers in BLOCK_ELEMENT_MARKERS:
+        if tokens & markers:
+            return kind
+    title = _TITLE_RE.search(html)
+    state = _match_markers(TITLE_MARKERS, unescape(title.group(1)).strip().lower()) if title else None
+    return _PAGE_STATE_BLOCKS.get(state, BlockKind.NONE)
+
+
+# ─── Coupe-circuit par source ────────────────────────────────────────────────
+
+class CircuitBreaker:
+    """
+    Coupe-circuit simple à trois états :
+
+        - fermé      : la source est scrapée normalement
+        - ouvert     : trop de blocages consécutifs, la source est ignorée
+                       jusqu'à la fin du refroidissement
+        - semi-ouvert: le refroidissement est écoulé, un essai est autorisé ;
+                       un succès referme le circuit, un échec le rouvre
+    """
+
+    def __init__(self, source: str, failure_threshold: int = 3, cooldown_s: float = 1800):
+        self.source = source
+        self.failure_threshold = failure_threshold
+        self.cooldown_s = cooldown_s
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown_s:
+            return "half-open"
+        return "open"
+
+    def remaining_cooldown(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.cooldown_s - (time.monotonic() - self.opened_at))
+
+    def allow(self) -> bool:
+        """True si la source peut être scrapée maintenant."""
+        return self.state != "open"
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self, reason: str = ""):
+        """Enregistre un blocage (ou un échec de chargement répété)."""
+        with self._lock:
+            self.failures += 1
+            # En semi-ouvert, un seul échec suffit à rouvrir
+            if self.failures >= self.failure_threshold or self.opened_at is not None:
+                self.opened_at = time.monotonic()
+                print(
+                    f"  🔌 Coupe-circuit ouvert pour {self.source} "
+                    f"({reason or 'échecs répétés'}) — pause de {self.cooldown_s / 60:.0f} min"
+                )
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(source: str, **kwargs) -> CircuitBreaker:
+    """Retourne le coupe-circuit (partagé dans le process) d'une source."""
+    with _breakers_lock:
+        if source not in _breakers:
+            _breakers[source] = CircuitBreaker(source, **kwargs)
+        return _breakers[source]
+
+
+def reset_breakers():
+    """Remet tous les coupe-circuits à zéro (tests, redémarrage manuel)."""
+    with _breakers_lock:
+        _breakers.clear()
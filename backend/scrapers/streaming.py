@@ -0,0 +1,70 @@
+"""
+🌊 Job Hunter OS — Flux d'offres asynchrones
+============================================
+Les scrapers utilisent l'API synchrone de Playwright : leurs iter_offers()
+sont des générateurs bloquants. aiter_in_thread() les fait tourner dans un
+thread dédié et les expose en itérateur asynchrone, sans bloquer la boucle
+d'événements. La file est bornée : le scraper attend que le consommateur
+ait traité les offres déjà produites (mémoire bornée à quelques pages).
+
+Usage:
+    async for keyword, offer in EDFScraper().aiter_offers(["data"]):
+        ...
+"""
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+
+QUEUE_SIZE = 100   # Offres en attente au plus (≈ 2-5 pages)
+
+_ITEM, _ERROR, _DONE = range(3)
+
+
+async def aiter_in_thread(make_iter: Callable[[], Iterator], maxsize: int = QUEUE_SIZE) -> AsyncIterator:
+    """
+    Itère `make_iter()` dans un thread et produit ses éléments de façon asynchrone.
+    Une exception du générateur est relancée chez le consommateur ; si le
+    consommateur s'arrête, le générateur est fermé (navigateur compris).
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize)
+    stop = threading.Event()
+
+    def put(kind, value=None):
+        asyncio.run_coroutine_threadsafe(queue.put((kind, value)), loop).result()
+
+    def produce():
+        iterator = make_iter()
+        try:
+            for item in iterator:
+                if stop.is_set():
+                    break
+                put(_ITEM, item)
+        except Exception as e:
+            put(_ERROR, e)
+            return
+        finally:
+            close = getattr(iterator, "close", None)
+            if close:
+                close()
+        put(_DONE)
+
+    thread = threading.Thread(target=produce, name="aiter-offers", daemon=True)
+    thread.start()
+    try:
+        while True:
+            kind, value = await queue.get()
+            if kind == _DONE:
+                break
+            if kind == _ERROR:
+                raise value
+            yield value
+    finally:
+        # Débloquer le producteur s'il attend une place dans la file
+        stop.set()
+        while thread.is_alive():
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                await asyncio.sleep(0.01)
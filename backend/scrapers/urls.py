@@ -0,0 +1,97 @@
+"""
+🔗 Job Hunter OS — URL canonique et hash de dédoublonnage
+=========================================================
+Une même offre revient avec des URLs différentes selon la recherche qui l'a
+trouvée : paramètres de session et de tracking d'Indeed (/rc/clk?jk=…&tk=…),
+mot-clé recopié dans l'URL Workday (?q=…), sous-domaine et slug LinkedIn, etc.
+
+    canonical_url(url)  → URL réduite à ce qui identifie l'offre
+    url_hash(url)       → entier signé 64 bits (BigInteger SQLite) de l'URL canonique
+
+La base et les scrapers dédoublonnent sur url_hash : comparaisons d'entiers
+et index unique à largeur fixe au lieu de longues chaînes.
+"""
+
+import hashlib
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Paramètres de tracking retirés quel que soit le site
+TRACKING_PARAMS = {"gclid", "fbclid", "msclkid", "trk", "trackingid", "refid"}
+
+# Paramètres de session / d'affichage d'Indeed (liens /pagead/clk sans jk)
+INDEED_PARAMS = {"tk", "xkcb", "camk", "p", "fvj", "vjs", "from", "advn", "sjdu", "acatk", "bb", "xpse", "xfps"}
+
+_LINKEDIN_JOB_ID = re.compile(r"/jobs/view/(?:[^/]*-)?(\d+)/?$")
+
+
+def _clean_query(query: str, drop: set[str] = frozenset()) -> str:
+    """Retire le tracking (et `drop`) puis trie les paramètres restants."""
+    params = []
+    for key, value in parse_qsl(query):
+        lower = key.lower()
+        if lower in TRACKING_PARAMS or lower in drop or lower.startswith("utm_"):
+            continue
+        params.append((key, value))
+    return urlencode(sorted(params))
+
+
+# ─── Règles par source ────────────────────────────────────────────────────────
+
+def _indeed(parts):
+    # /rc/clk, /viewjob, /pagead/clk… : l'offre est identifiée par jk
+    params = dict(parse_qsl(parts.query))
+    if "jk" in params:
+        return ("https", parts.netloc, "/viewjob", urlencode({"jk": params["jk"]}))
+    return ("https", parts.netloc, parts.path, _clean_query(parts.query, INDEED_PARAMS))
+
+
+def _linkedin(parts):
+    # fr.linkedin.com/jobs/view/<slug>-<id> → www.linkedin.com/jobs/view/<id>
+    match = _LINKEDIN_JOB_ID.search(parts.path)
+    if match:
+        return ("https", "www.linkedin.com", f"/jobs/view/{match.group(1)}", "")
+    return ("https", parts.netloc, parts.path, "")
+
+
+def _without_query(parts):
+    # Workday (?q=<mot-clé>) et Avature (/careers/JobDetail/…?source=…) :
+    # le chemin identifie déjà l'offre, la query ne porte que la recherche et le tracking
+    return ("https", parts.netloc, parts.path, "")
+
+
+def _rule_for(host: str, path: str):
+    if host.endswith("indeed.com") or ".indeed." in host:
+        return _indeed
+    if host.endswith("linkedin.com"):
+        return _linkedin
+    if host.endswith("myworkdayjobs.com") or host.endswith("avature.net") or "/careers/JobDetail/" in path:
+        return _without_query
+    return None
+
+
+def canonical_url(url: str) -> str:
+    """
+    URL canonique : schéma et hôte en minuscules, fragment et slash final
+    retirés, paramètres de tracking supprimés et triés, puis règle du site.
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    path = parts.path.rstrip("/") or "/"
+    parts = parts._replace(scheme=(parts.scheme or "https").lower(), netloc=host, path=path, fragment="")
+
+    rule = _rule_for(host, path)
+    if rule:
+        scheme, netloc, path, query = rule(parts)
+    else:
+        scheme, netloc, path, query = parts.scheme, host, path, _clean_query(parts.query)
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def url_hash(url: str) -> int:
+    """Hash 64 bits signé (blake2b) de l'URL canonique, pour une colonne BigInteger."""
+    digest = hashlib.blake2b(canonical_url(url).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
@@ -0,0 +1,172 @@
+"""
+🔌 Job Hunter OS — Registre des sources de scraping
+===================================================
+Chaque source est décrite par une SourceSpec : clé, libellé, hôte contacté
+(budgets de requêtes du planificateur) et cible "module:attribut" du code
+qui scrape. La cible n'est importée qu'au premier appel du runner : l'API
+qui ne sert que /api/jobs ne charge jamais Playwright ni les scrapers, et
+un worker n'importe que les sources qu'il lance.
+
+Une cible est :
+    - soit une classe de source (SourcePlugin : sites carrières, Indeed,
+      LinkedIn) : instanciée puis appelée via scrape_many()
+    - soit une fonction runner(queries, max_pages, start_page=0) → {mot-clé: offres}
+
+Des sources externes s'ajoutent par le groupe d'entry points "job_hunter.sources"
+d'un paquet installé ; l'entry point pointe vers une SourceSpec (légère, la
+cible reste importée à la demande) :
+
+    [project.entry-points."job_hunter.sources"]
+    welcome = "jh_welcome:SPEC"
+
+Le registre lui-même (SOURCES) n'est construit qu'au premier accès : importer
+backend.orchestrator ou backend.main ne parcourt pas les entry points.
+"""
+
+import functools
+import importlib
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+from typing import Protocol
+from urllib.parse import urlparse
+
+from backend.scrapers.companies import COMPANIES_REGISTRY
+
+ENTRY_POINT_GROUP = "job_hunter.sources"
+
+
+class SourcePlugin(Protocol):
+    """
+    Interface commune des sources : {mot-clé: [JobOffer]} pour une liste de
+    mots-clés, ou en flux les couples (mot-clé, offre) page par page.
+    """
+
+    def scrape_many(self, keywords: list[str], max_pages: int = 1,
+                    start_page: int = 0) -> dict[str, list]: ...
+
+    def iter_offers(self, keywords: list[str], max_pages: int = 1,
+                    start_page: int = 0) -> Iterator[tuple[str, object]]: ...
+
+
+@dataclass(frozen=True)
+class SourceSpec:
+    key: str
+    label: str
+    host: str
+    target: str   # "module:attribut", importé à la demande
+
+    def load(self):
+        return _import_target(self.target)
+
+
+@functools.cache
+def _import_target(target: str):
+    module_name, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def iter_results(results: dict[str, list], queries: list[str]) -> Iterator[tuple[str, object]]:
+    """Aplatit un résultat {mot-clé: offres} en couples (mot-clé, offre)."""
+    for query in queries:
+        for offer in results.get(query, []):
+            yield query, offer
+
+
+class LazyRunner:
+    """Runner de scraping qui n'importe sa source qu'au premier appel."""
+
+    def __init__(self, spec: SourceSpec):
+        self.spec = spec
+
+    def __call__(self, queries: list[str], max_pages: int, start_page: int = 0) -> dict[str, list]:
+        target = self.spec.load()
+        if isinstance(target, type):
+            return target().scrape_many(queries, max_pages=max_pages, start_page=start_page)
+        return target(queries, max_pages, start_page=start_page)
+
+    def iter(self, queries: list[str], max_pages: int, start_page: int = 0) -> Iterator[tuple[str, object]]:
+        """Couples (mot-clé, offre) au fil des pages (d'un bloc pour une source sans iter_offers)."""
+        target = self.spec.load()
+        if isinstance(target, type) and hasattr(target, "iter_offers"):
+            yield from target().iter_offers(queries, max_pages=max_pages, start_page=start_page)
+            return
+        yield from iter_results(self(queries, max_pages, start_page), queries)
+
+    def __repr__(self):
+        return f"LazyRunner({self.spec.target})"
+
+
+# ─── Registre ─────────────────────────────────────────────────────────────────
+
+def _corporate(key: str) -> SourceSpec:
+    info = COMPANIES_REGISTRY[key]
+    return SourceSpec(key, info["name"], urlparse(info["career_url"]).netloc,
+                      f"backend.scrapers.core:{info['scraper_class']}")
+
+
+def discover_sources(group: str = ENTRY_POINT_GROUP) -> list[SourceSpec]:
+    """SourceSpec déclarées par les paquets installés (une source cassée est ignorée)."""
+    specs = []
+    for ep in entry_points(group=group):
+        try:
+            spec = ep.load()
+        except Exception as e:
+            print(f"⚠️ Source {ep.name} ignorée : {e}")
+            continue
+        if not isinstance(spec, SourceSpec):
+            # Classe ou fonction : importée de toute façon, on la référence telle quelle
+            spec = SourceSpec(ep.name, ep.name, "", ep.value)
+        specs.append(spec)
+    return specs
+
+
+class LazyRegistry(Mapping):
+    """Mapping en lecture seule construit par `build()` au premier accès, une seule fois."""
+
+    def __init__(self, build: Callable[[], dict]):
+        self._build = build
+        self._data: dict | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def built(self) -> bool:
+        return self._data is not None
+
+    def _resolve(self) -> dict:
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    self._data = self._build()
+        return self._data
+
+    def __getitem__(self, key):
+        return self._resolve()[key]
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __len__(self):
+        return len(self._resolve())
+
+    def __repr__(self):
+        return f"LazyRegistry({self._data!r})" if self.built else "LazyRegistry(<non construit>)"
+
+
+def _build_sources() -> dict[str, SourceSpec]:
+    # Dans l'ordre de scraping
+    return {
+        spec.key: spec for spec in (
+            _corporate("edf"),
+            _corporate("totalenergies"),
+            _corporate("safran"),
+            _corporate("airbus"),
+            SourceSpec("indeed", "Indeed", "fr.indeed.com", "backend.scrapers.indeed:IndeedScraper"),
+            SourceSpec("linkedin", "LinkedIn", "www.linkedin.com", "backend.scrapers.linkedin:LinkedInScraper"),
+            *discover_sources(),
+        )
+    }
+
+
+SOURCES: Mapping[str, SourceSpec] = LazyRegistry(_build_sources)
@@ -0,0 +1,200 @@
+"""
+File de tâches de scraping durable, stockée dans la base SQLite.
+
+Chaque tâche est une page d'une source pour un mot-clé : (keyword, source, page).
+N'importe quel nombre de workers (python -m backend.worker), sur cette machine
+ou sur d'autres partageant le fichier de base, peuvent se les répartir :
+
+    PENDING ──claim()──▶ LEASED ──complete()──▶ DONE
+       ▲                   │
+       └──── fail() ◀──────┤   (retry avec backoff exponentiel)
+                           └──▶ DEAD   (tentatives épuisées : dead-letter)
+
+Un worker qui prend une tâche obtient un bail (lease) qu'il prolonge par
+heartbeat() ; si le worker meurt, le bail expire et la tâche redevient
+disponible pour un autre. Le claim est un seul UPDATE … RETURNING, donc
+atomique sous le verrou d'écriture SQLite.
+"""
+
+import datetime
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from backend.models import ScrapeTask
+from backend.scrapers.resilience import BackoffPolicy
+
+PENDING, LEASED, DONE, DEAD = "PENDING", "LEASED", "DONE", "DEAD"
+
+LEASE_SECONDS = 300
+RETRY_BACKOFF = BackoffPolicy(base_delay=60, factor=2, max_delay=3600)
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.utcnow()
+
+
+def enqueue(db: Session, keyword: str, sources: list[str], max_pages: int = 2,
+            max_attempts: int = 3) -> int:
+    """
+    Ajoute les tâches (keyword, source, page) manquantes.
+    Une tâche identique déjà PENDING ou LEASED n'est pas dupliquée.
+
+    Returns:
+        Nombre de tâches créées
+    """
+    keyword = keyword.strip()
+    active = set(
+        db.execute(
+            select(ScrapeTask.source, ScrapeTask.page)
+            .where(ScrapeTask.keyword == keyword, ScrapeTask.status.in_([PENDING, LEASED]))
+        ).all()
+    )
+    created = 0
+    for source in sources:
+        for page in range(max_pages):
+            if (source, page) in active:
+                continue
+            db.add(ScrapeTask(keyword=keyword, source=source, page=page, max_attempts=max_attempts))
+            created += 1
+    db.commit()
+    return created
+
+
+def claim(db: Session, worker_id: str, sources: list[str] | None = None,
+          lease_s: float = LEASE_SECONDS) -> ScrapeTask | None:
+    """Prend la prochaine tâche disponible (ou dont le bail a expiré)."""
+    now = _now()
+
+    # Les baux expirés dont les tentatives sont épuisées partent en dead-letter
+    db.execute(
+        update(ScrapeTask)
+        .where(ScrapeTask.status == LEASED, ScrapeTask.lease_expires_at < now,
+               ScrapeTask.attempts >= ScrapeTask.max_attempts)
+        .values(status=DEAD, lease_owner=None, updated_at=now,
+                last_error="Bail expiré (worker arrêté ?) après la dernière tentative")
+        .execution_options(synchronize_session=False)
+    )
+
+    candidate = (
+        select(ScrapeTask.id)
+        .where(or_(
+            and_(ScrapeTask.status == PENDING, ScrapeTask.available_at <= now),
+            and_(ScrapeTask.status == LEASED, ScrapeTask.lease_expires_at < now),
+        ))
+        .order_by(ScrapeTask.available_at, ScrapeTask.id)
+        .limit(1)
+    )
+    if sources:
+        candidate = candidate.where(ScrapeTask.source.in_(sources))
+
+    row = db.execute(
+        update(ScrapeTask)
+        .where(ScrapeTask.id == candidate.scalar_subquery())
+        .values(status=LEASED, lease_owner=worker_id,
+                lease_expires_at=now + datetime.timedelta(seconds=lease_s),
+                attempts=ScrapeTask.attempts + 1, updated_at=now)
+        .returning(ScrapeTask.id)
+        .execution_options(synchronize_session=False)
+    ).first()
+    db.commit()
+
+    if row is None:
+        return None
+    return db.get(ScrapeTask, row[0], populate_existing=True)
+
+
+def heartbeat(db: Session, task_id: int, worker_id: str, lease_s: float = LEASE_SECONDS) -> bool:
+    """Prolonge le bail. Retourne False si la tâche a été reprise par un autre worker."""
+    now = _now()
+    result = db.execute(
+        update(ScrapeTask)
+        .where(ScrapeTask.id == task_id, ScrapeTask.lease_owner == worker_id,
+               ScrapeTask.status == LEASED)
+        .values(lease_expires_at=now + datetime.timedelta(seconds=lease_s), updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def complete(db: Session, task_id: int, worker_id: str, offers_found: int = 0) -> bool:
+    now = _now()
+    result = db.execute(
+        update(ScrapeTask)
+        .where(ScrapeTask.id == task_id, ScrapeTask.lease_owner == worker_id)
+        .values(status=DONE, offers_found=offers_found, lease_expires_at=None,
+                last_error=None, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def fail(db: Session, task: ScrapeTask, worker_id: str, error: str) -> str:
+    """
+    Enregistre l'échec d'une tentative : retry différé ou dead-letter.
+
+    Returns:
+        Le nouveau statut (PENDING ou DEAD)
+    """
+    now = _now()
+    if task.attempts >= task.max_attempts:
+        status, available_at = DEAD, task.available_at
+    else:
+        status = PENDING
+        available_at = now + datetime.timedelta(seconds=RETRY_BACKOFF.delay(task.attempts - 1))
+
+    db.execute(
+        update(ScrapeTask)
+        .where(ScrapeTask.id == task.id, ScrapeTask.lease_owner == worker_id)
+        .values(status=status, available_at=available_at, lease_owner=None,
+                lease_expires_at=None, last_error=error[:500], updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return status
+
+
+def finished_round(db: Session, keyword: str, source: str,
+                   since: datetime.datetime | None = None) -> tuple[int, datetime.datetime] | None:
+    """
+    Bilan des pages (keyword, source) terminées après `since`, une fois qu'il
+    n'en reste plus aucune en file ni en cours.
+
+    Returns:
+        (total des offres trouvées, date de la dernière page terminée), ou
+        None si des pages restent à traiter ou qu'aucune n'a été terminée
+    """
+    identity = (ScrapeTask.keyword == keyword, ScrapeTask.source == source)
+    active = db.scalar(
+        select(func.count()).select_from(ScrapeTask).where(*identity, ScrapeTask.status.in_([PENDING, LEASED]))
+    )
+    if active:
+        return None
+    query = select(func.coalesce(func.sum(ScrapeTask.offers_found), 0), func.max(ScrapeTask.updated_at)).where(
+        *identity, ScrapeTask.status == DONE)
+    if since is not None:
+        query = query.where(ScrapeTask.updated_at > since)
+    total, last_done = db.execute(query).one()
+    return (total, last_done) if last_done else None
+
+
+def retry_dead(db: Session) -> int:
+    """Remet les tâches en dead-letter dans la file (après correction d'un scraper)."""
+    result = db.execute(
+        update(ScrapeTask)
+        .where(ScrapeTask.status == DEAD)
+        .values(status=PENDING, attempts=0, available_at=_now(), updated_at=_now())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
+def queue_stats(db: Session) -> dict[str, int]:
+    """Nombre de tâches par statut."""
+    rows = db.execute(
+        select(ScrapeTask.status, func.count()).group_by(ScrapeTask.status)
+    ).all()
+    return {status: count for status, count in rows}
@@ -0,0 +1,48 @@
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Les tests tournent sur une base temporaire, jamais sur data/job_hunter.db
+_TMP_DIR = tempfile.mkdtemp(prefix="job_hunter_tests_")
+os.environ.setdefault("JOB_HUNTER_DB_URL", f"sqlite:///{os.path.join(_TMP_DIR, 'test.db')}")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def migrated_database():
+    """Le schéma n'est plus créé à l'import de backend.main : on l'applique une fois."""
+    from backend.database import init_db
+    init_db()
+
+
+@pytest.fixture
+def memory_sessions():
+    """Fabrique de sessions sur une base SQLite en mémoire, schéma complet créé."""
+    from backend.database import Base
+    import backend.models  # noqa: F401
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def memory_db(memory_sessions):
+    """Session sur une base SQLite en mémoire, fermée en fin de test."""
+    db = memory_sessions()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def make_offer():
+    """Fabrique d'offres telles que les renvoient les scrapers (valeurs par défaut : un CDI EDF à Lyon)."""
+    from backend.scrapers.records import JobOffer
+
+    def make(url, titre="Ingénieur", entreprise="EDF", lieu="Lyon", contrat="CDI", date_publication="",
+             source="edf-recrute", **extra):
+        return JobOffer(titre, entreprise, lieu, url, contrat, date_publication, "", source, **extra)
+    return make
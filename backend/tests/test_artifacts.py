@@ -0,0 +1,43 @@
+import gzip
+import os
+
+from backend.scrapers.artifacts import ArtifactStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def fixture_html(name):
+    with open(os.path.join(ROOT, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_captures_are_written_in_background_compressed_and_deduped(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    html = fixture_html("debug_safran_page_2.html")
+    store.capture(html, "https://www.safran-group.com/fr/offres?page=2", "safran", "no_cards")
+    store.capture(html, "https://www.safran-group.com/fr/offres?page=3", "safran", "no_cards")
+    store.capture("<html>captcha</html>", "https://fr.indeed.com/jobs", "indeed", "captcha")
+    store.flush()
+
+    blobs = [f for _, _, files in os.walk(tmp_path) for f in files if f.endswith(".html.gz")]
+    assert len(blobs) == 2   # Deux captures identiques : un seul fichier
+    captures = store.captures()
+    assert [(c.source, c.reason) for c in captures] == [("indeed", "captcha"), ("safran", "no_cards"),
+                                                        ("safran", "no_cards")]
+    assert store.read(captures[-1].id) == html
+    stored = os.path.getsize(store.blob_path(captures[-1].sha256))
+    assert stored < len(html.encode("utf-8")) / 4
+    assert [c.url for c in store.captures(source="safran")][0].endswith("page=3")
+
+
+def test_size_cap_evicts_least_recent_content(tmp_path):
+    store = ArtifactStore(str(tmp_path), max_bytes=1)
+    conn = store._connect()
+    first = store.write(conn, "<p>1</p>", "u1", "edf", "no_cards", "2026-03-01T10:00:00")
+    second = store.write(conn, "<p>2</p>", "u2", "edf", "no_cards", "2026-03-01T10:05:00")
+    conn.close()
+
+    assert not os.path.exists(store.blob_path(first))
+    with gzip.open(store.blob_path(second), "rt") as f:
+        assert f.read() == "<p>2</p>"
+    assert [c.url for c in store.captures()] == ["u2"]   # Lignes d'index évincées avec leur contenu
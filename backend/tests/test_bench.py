@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+from backend.scrapers.bench import (
+    CountingLocator, Fixture, RoundTripCounter, bench_fixture, compare_reports, find_fixtures, load_expected,
+)
+from backend.scrapers.records import JobOffer
+
+
+class FakeLocator:
+    """Locator factice : une liste de cartes {sélecteur: texte}."""
+
+    def __init__(self, cards):
+        self.cards = cards
+
+    def locator(self, selector):
+        return FakeLocator([c for c in self.cards if selector in c])
+
+    def nth(self, i):
+        return FakeLocator([self.cards[i]])
+
+    @property
+    def first(self):
+        return self.nth(0)
+
+    def count(self):
+        return len(self.cards)
+
+    def inner_text(self, timeout=None):
+        return self.cards[0]["text"]
+
+
+def test_find_fixtures_reads_source_and_page_from_names():
+    fixtures = find_fixtures(sources=["engie"])
+    assert [(f.source, f.page_num) for f in fixtures] == [("engie", 1), ("engie", 2)]
+    assert fixtures[0].name == "scripts/debug_files/debug_engie_page_1.html"
+    assert "https://jobs.engie.com/job/INGENIEUR-EXLOITATION/61954-fr_FR" in load_expected("engie")
+
+
+def test_counting_locator_counts_browser_calls_only():
+    counter = RoundTripCounter()
+    card = CountingLocator(FakeLocator([{"h3": 1, "text": "Ingénieur"}]), counter)
+    title = card.locator("h3")
+    assert counter.calls == 0   # locator() et first ne quittent pas Python
+    assert title.count() == 1 and title.first.inner_text() == "Ingénieur"
+    assert counter.calls == 2
+
+
+def test_bench_fixture_reports_round_trips_and_matches(tmp_path):
+    path = tmp_path / "debug_edf_page_1.html"
+    path.write_text("<html></html>")
+
+    def parse_card(card, base_url):
+        titre = card.locator("h3").first.inner_text()
+        return JobOffer(titre, "EDF", "Paris", f"https://www.edf.fr/{titre}?trk=1", "CDI", "", "", "edf-recrute")
+
+    scraper = SimpleNamespace(extract_job_cards=lambda page: FakeLocator([{"h3": 1, "text": "a"},
+                                                                           {"h3": 1, "text": "b"}]),
+                              parse_card=parse_card)
+    row = bench_fixture(None, scraper, Fixture(str(path), "edf", 1), {"https://www.edf.fr/a"}, repeat=2)
+    assert (row["cards"], row["offers"], row["errors"], row["matched"]) == (2, 2, 0, 1)
+    assert row["round_trips_per_card"] == 1.0
+
+
+def test_compare_reports():
+    before = {"fixtures": [{"fixture": "a.html", "offers": 10, "parse_ms": 50.0, "round_trips_per_card": 9.0}]}
+    after = {"fixtures": [{"fixture": "a.html", "offers": 10, "parse_ms": 20.0, "round_trips_per_card": 3.0},
+                          {"fixture": "b.html", "offers": 1}]}
+    assert compare_reports(before, after) == [
+        {"fixture": "a.html", "offers": 0, "parse_ms": -30.0, "round_trips_per_card": -6.0},
+    ]
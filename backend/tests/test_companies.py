@@ -0,0 +1,47 @@
+import threading
+
+import pytest
+
+from backend.scrapers.core import SCRAPER_CLASSES, parse_companies, scrape_concurrently
+from backend.scrapers.records import JobOffer
+
+
+def offer(key, i):
+    return JobOffer(f"Data {i}", key, "Lyon", f"https://{key}.fr/{i}", "CDI", "", "", key)
+
+
+def test_parse_companies():
+    assert parse_companies("all") == list(SCRAPER_CLASSES)
+    assert parse_companies("EDF, safran,edf") == ["edf", "safran"]
+    with pytest.raises(ValueError):
+        parse_companies("edf,inconnue")
+
+
+def test_scrape_concurrently_overlaps_companies_and_isolates_errors():
+    # edf et safran ne franchissent la barrière qu'ensemble : en séquentiel, elle casse
+    overlap = threading.Barrier(2, timeout=5)
+
+    def scrape(key):
+        if key == "airbus":
+            raise RuntimeError("Workday indisponible")
+        overlap.wait()
+        for i in range(3):
+            yield "data", offer(key, i)
+
+    runs = []
+    items = list(scrape_concurrently(["edf", "safran", "airbus"], scrape, runs))
+
+    assert sorted((key, o.url) for key, _, o in items) == sorted(
+        (key, f"https://{key}.fr/{i}") for key in ("edf", "safran") for i in range(3))
+    assert [(r.key, r.offers, r.error) for r in runs] == [("edf", 3, ""), ("safran", 3, ""),
+                                                          ("airbus", 0, "Workday indisponible")]
+
+
+def test_scrape_concurrently_releases_workers_when_consumer_stops():
+    def scrape(key):
+        for i in range(1000):
+            yield "data", offer(key, i)
+
+    stream = scrape_concurrently(["edf", "safran"], scrape)
+    assert next(stream)[1] == "data"
+    stream.close()   # Ne bloque pas : les threads sont libérés
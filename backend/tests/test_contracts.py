@@ -0,0 +1,80 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.contracts import ContractKind, contract_kind, parse_contract_filter
+from backend.database import SessionLocal
+from backend.models import JobOffer
+from backend.persistence import backfill_contract_kinds, bulk_upsert_offers
+
+
+@pytest.mark.parametrize("contract, title, expected", [
+    ("CDI", "Ingénieur", ContractKind.CDI),
+    ("CDI / Autre", "Data Engineer", ContractKind.CDI),
+    ("Stage conventionné", "Assistant achats", ContractKind.STAGE),
+    ("Contrat de professionnalisation Temps plein", "Technicien", ContractKind.ALTERNANCE),
+    ("Contrat à durée déterminée", "", ContractKind.CDD),
+    ("V.I.E", "", ContractKind.VIE),
+    ("Intérim", "", ContractKind.INTERIM),
+    ("", "Stage - Data Analyst H/F", ContractKind.STAGE),
+    ("", "Alternant(e) maintenance aéronautique", ContractKind.ALTERNANCE),
+    ("", "VIE - Ingénieur projet Allemagne", ContractKind.VIE),
+    ("", "Compressor stage design engineer", ContractKind.UNKNOWN),
+    ("Cadre", "Chef de projet", ContractKind.UNKNOWN),
+    ("Graduate", "", ContractKind.UNKNOWN),
+])
+def test_contract_kind(contract, title, expected):
+    assert contract_kind(contract, title) is expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("CDI", ContractKind.CDI),
+    ("stage", ContractKind.STAGE),
+    ("Intérim", ContractKind.INTERIM),
+    ("V.I.E", ContractKind.VIE),
+    ("4", ContractKind.ALTERNANCE),
+    ("Non précisé", ContractKind.UNKNOWN),
+    ("Freelance", None),
+])
+def test_parse_contract_filter(value, expected):
+    assert parse_contract_filter(value) is expected
+
+
+def test_backfill_contract_kinds(memory_db):
+    db = memory_db
+    db.add_all([
+        JobOffer(title="Stagiaire RH", contract_type="", url="https://a.fr/1"),
+        JobOffer(title="Ingénieur", contract_type="CDD", url="https://a.fr/2"),
+    ])
+    db.commit()
+
+    assert backfill_contract_kinds(db) == 2
+    assert backfill_contract_kinds(db) == 0
+    assert [o.contract_kind for o in db.query(JobOffer).order_by(JobOffer.id)] == [ContractKind.STAGE, ContractKind.CDD]
+
+
+def test_api_contract_filter_uses_kind(make_offer):
+    from backend.main import app
+
+    offers = [
+        make_offer(f"https://airbus.fr/contrat/{i}", titre, "Airbus", "Toulouse", contrat, source="airbus")
+        for i, (titre, contrat) in enumerate([
+            ("Contrat Data", "CDI / Autre"), ("Stage - Contrat Data", ""), ("Contrat Alternance", "Apprentissage"),
+        ])
+    ]
+    db = SessionLocal()
+    try:
+        bulk_upsert_offers(db, offers, "contrat")
+        db.commit()
+        client = TestClient(app)
+
+        cdi = client.get("/api/jobs", params={"keyword": "Contrat", "contract_type": "CDI"}).json()
+        assert [o["title"] for o in cdi] == ["Contrat Data"]
+        stage = client.get("/api/jobs", params={"keyword": "Contrat", "contract_type": "Stage"}).json()
+        assert [o["title"] for o in stage] == ["Stage - Contrat Data"]
+        assert stage[0]["contract_kind"] == ContractKind.STAGE
+        alternance = client.get("/api/jobs", params={"keyword": "Contrat", "contract_type": "alternance"}).json()
+        assert [o["title"] for o in alternance] == ["Contrat Alternance"]
+    finally:
+        db.query(JobOffer).delete()
+        db.commit()
+        db.close()
@@ -7,3 +7,26 @@ def test_database_tables_created():
     Base.metadata.create_all(bind=engine)
     inspector = inspect(engine)
     assert "job_offers" in inspector.get_table_names()
+
+
+def test_ensure_autoincrement_rebuilds_legacy_offers_table():
+    from sqlalchemy import MetaData, create_engine, text
+
+    from backend.database import ensure_autoincrement
+
+    engine = create_engine("sqlite://")
+    offers = JobOffer.__table__
+    legacy = offers.to_metadata(MetaData())
+    legacy.dialect_options["sqlite"]["autoincrement"] = False
+    with engine.begin() as conn:
+        legacy.create(conn)
+        conn.execute(legacy.insert(), [{"id": 1, "url": "https://a.fr/1"}, {"id": 2, "url": "https://a.fr/2"}])
+        assert ensure_autoincrement(conn, offers, reserved_max_id=7)
+        assert not ensure_autoincrement(conn, offers)
+
+        assert conn.execute(text("SELECT id, url FROM job_offers ORDER BY id")).all() == [
+            (1, "https://a.fr/1"), (2, "https://a.fr/2")]
+        conn.execute(offers.insert(), {"url": "https://a.fr/3"})
+        assert conn.execute(text("SELECT MAX(id) FROM job_offers")).scalar() == 8
+        indexes = {i["name"] for i in inspect(conn).get_indexes("job_offers")}
+        assert {"ix_job_offers_status_id", "ix_job_offers_url_hash"} <= indexes
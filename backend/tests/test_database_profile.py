@@ -0,0 +1,54 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from backend.database import SQLiteProfile, apply_profile, check_sqlite_settings
+
+
+def test_profile_applied_on_connect(tmp_path):
+    url = f"sqlite:///{tmp_path / 'profile.db'}"
+    engine = create_engine(url)
+    apply_profile(engine, SQLiteProfile())
+
+    settings = check_sqlite_settings(engine)
+    assert settings["journal_mode"] == "wal"
+    assert settings["synchronous"] == 1          # NORMAL
+    assert settings["temp_store"] == 2           # MEMORY
+    assert settings["busy_timeout"] == 5000
+    assert settings["cache_size"] == -64000
+    assert settings["query_only"] == 0
+
+
+def test_read_engine_is_query_only(tmp_path):
+    url = f"sqlite:///{tmp_path / 'profile.db'}"
+    writer = create_engine(url)
+    apply_profile(writer, SQLiteProfile())
+    reader = create_engine(url)
+    apply_profile(reader, SQLiteProfile(), read_only=True)
+
+    with writer.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+
+    with reader.connect() as conn:
+        assert conn.execute(text("SELECT x FROM t")).scalar() == 1
+        with pytest.raises(OperationalError):
+            conn.execute(text("INSERT INTO t VALUES (2)"))
+
+
+def test_profile_from_env(monkeypatch):
+    monkeypatch.setenv("JOB_HUNTER_SQLITE_PROFILE", "default")
+    monkeypatch.setenv("JOB_HUNTER_SQLITE_BUSY_TIMEOUT", "1000")
+    profile = SQLiteProfile.from_env()
+    assert profile.pragmas() == {"busy_timeout": 1000}
+
+
+def test_shared_profile_avoids_wal(monkeypatch, tmp_path):
+    monkeypatch.setenv("JOB_HUNTER_SQLITE_PROFILE", "shared")
+    engine = create_engine(f"sqlite:///{tmp_path / 'shared.db'}")
+    apply_profile(engine, SQLiteProfile.from_env())
+
+    settings = check_sqlite_settings(engine)
+    assert settings["journal_mode"] == "delete"
+    assert settings["mmap_size"] == 0
+    assert settings["synchronous"] == 2          # FULL
@@ -0,0 +1,54 @@
+import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.database import SessionLocal
+from backend.dates import parse_published_date
+from backend.models import JobOffer
+from backend.persistence import bulk_upsert_offers
+
+ANCHOR = "2026-02-28T16:15:53"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("28 Février 2026", datetime.datetime(2026, 2, 28)),
+    ("Publié le 12/02/2026", datetime.datetime(2026, 2, 12)),
+    ("05.02.2026", datetime.datetime(2026, 2, 5)),
+    ("2026-02-27", datetime.datetime(2026, 2, 27)),
+    ("1er mars 2026", datetime.datetime(2026, 3, 1)),
+    ("February 3, 2026", datetime.datetime(2026, 2, 3)),
+    ("posted on\nOffre publiée hier", datetime.datetime(2026, 2, 27)),
+    ("Offre publiée il y a 10 jours", datetime.datetime(2026, 2, 18)),
+    ("Posted 30+ Days Ago", datetime.datetime(2026, 1, 29)),
+    ("Posted Today", datetime.datetime(2026, 2, 28)),
+    ("il y a 2 semaines", datetime.datetime(2026, 2, 14)),
+    ("Il y a 3 heures", datetime.datetime(2026, 2, 28, 13, 15, 53)),
+    ("", None),
+    ("n/a", None),
+])
+def test_parse_published_date(text, expected):
+    assert parse_published_date(text, anchor=ANCHOR) == expected
+
+
+def test_api_since_and_recent_sort(make_offer):
+    from backend.main import app
+
+    offers = [
+        make_offer(f"https://edf.fr/dates/{i}", f"Dates {i}", date_publication=text, date_scraping=ANCHOR)
+        for i, text in enumerate(["02 Février 2026", "il y a 3 jours", "", "27 Février 2026"])
+    ]
+    db = SessionLocal()
+    try:
+        bulk_upsert_offers(db, offers, "dates")
+        db.commit()
+        client = TestClient(app)
+
+        recent = client.get("/api/jobs", params={"keyword": "Dates", "sort": "recent"}).json()
+        assert [o["title"] for o in recent] == ["Dates 3", "Dates 1", "Dates 0", "Dates 2"]
+        since = client.get("/api/jobs", params={"keyword": "Dates", "since": "2026-02-20"}).json()
+        assert sorted(o["title"] for o in since) == ["Dates 1", "Dates 3"]
+    finally:
+        db.query(JobOffer).delete()
+        db.commit()
+        db.close()
@@ -0,0 +1,80 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import distinct, func, select
+
+from backend.database import SessionLocal
+from backend.dedup import forget_offers, index_missing, normalize_company, signature_for, similarity
+from backend.models import JobOffer, OfferLshBand
+from backend.persistence import bulk_upsert_offers
+
+
+@pytest.fixture
+def cross_source(make_offer):
+    return [
+        make_offer("https://www.edf.fr/edf-recrute/offre/detail/1", "Data Engineer H/F", "EDF", "Paris"),
+        make_offer("https://fr.linkedin.com/jobs/view/data-engineer-at-edf-42", "DATA ENGINEER (F/H)", "EDF",
+                   "Paris, Île-de-France, France", source="linkedin"),
+        make_offer("https://fr.indeed.com/rc/clk?jk=abc", "Data Engineer - F/H", "Groupe EDF", "75008 Paris",
+                   source="indeed"),
+        make_offer("https://www.edf.fr/edf-recrute/offre/detail/2", "Data Analyst H/F", "EDF", "Paris"),
+        make_offer("https://www.safran-group.com/fr/offres/3", "Data Engineer H/F", "Safran", "Paris",
+                   source="safran-group"),
+    ]
+
+
+def test_signature_similarity_ignores_formatting():
+    base = signature_for("Data Engineer H/F", "EDF", "Paris")
+    assert similarity(base, signature_for("DATA ENGINEER (F/H)", "Groupe EDF", "Paris (75)")) == 1.0
+    assert similarity(base, signature_for("Data Analyst H/F", "EDF", "Paris")) < 0.8
+
+
+def test_ingest_links_cross_source_duplicates(memory_db, cross_source):
+    db = memory_db
+    bulk_upsert_offers(db, cross_source[:2], "data")
+    bulk_upsert_offers(db, cross_source[2:], "data")
+    db.commit()
+
+    clusters = {o.source: o.duplicate_cluster_id for o in db.query(JobOffer).order_by(JobOffer.id)}
+    first = db.query(JobOffer).order_by(JobOffer.id).first().id
+    assert clusters["linkedin"] == clusters["indeed"] == first
+    assert db.query(JobOffer).filter(JobOffer.duplicate_cluster_id == first).count() == 3
+    clusters_count = select(func.count(distinct(func.coalesce(JobOffer.duplicate_cluster_id, JobOffer.id))))
+    assert db.scalar(clusters_count) == 3
+    assert db.query(OfferLshBand).count() == 5 * 16
+
+    # Reconstruire l'index donne les mêmes clusters
+    assert index_missing(db, rebuild=True) == (5, 2)
+
+
+def test_companies_sharing_a_first_word_stay_apart(memory_db, make_offer):
+    assert normalize_company("Groupe EDF SA") == normalize_company("EDF") == "edf"
+    assert normalize_company("Société Générale") != normalize_company("Société Nationale SNCF")
+
+    db = memory_db
+    bulk_upsert_offers(db, [
+        make_offer("https://fr.indeed.com/rc/clk?jk=sg", "Data Engineer H/F", "Société Générale", "Paris",
+                   source="indeed"),
+        make_offer("https://fr.indeed.com/rc/clk?jk=sn", "Data Engineer H/F", "Société Nationale SNCF", "Paris",
+                   source="indeed"),
+    ], "data")
+    db.commit()
+
+    assert [o.duplicate_cluster_id for o in db.query(JobOffer).order_by(JobOffer.id)] == [1, 2]
+
+
+def test_api_collapses_duplicates(cross_source):
+    from backend.main import app
+
+    db = SessionLocal()
+    try:
+        bulk_upsert_offers(db, cross_source, "data")
+        db.commit()
+        client = TestClient(app)
+        assert len(client.get("/api/jobs", params={"keyword": "Data"}).json()) == 5
+        collapsed = client.get("/api/jobs", params={"keyword": "Data", "collapse_duplicates": True}).json()
+        assert sorted(o["title"] for o in collapsed) == ["Data Analyst H/F", "Data Engineer H/F", "Data Engineer H/F"]
+    finally:
+        forget_offers(db, [offer_id for (offer_id,) in db.query(JobOffer.id)])
+        db.query(JobOffer).delete()
+        db.commit()
+        db.close()
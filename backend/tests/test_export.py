@@ -0,0 +1,65 @@
+import datetime
+
+import pytest
+
+from backend.export import RunExporter, export_run, export_table, read_export
+from backend.persistence import bulk_upsert_offers
+from backend.scrapers.records import JobOffer
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+DAY = datetime.date(2026, 3, 2)
+
+
+def test_export_table_partitions_by_source_and_reads_columns(tmp_path, memory_db, make_offer):
+    db = memory_db
+
+    def offer(i, source):
+        return make_offer(f"https://{source}.fr/{i}", titre=f"Ingénieur {i}", source=source)
+    bulk_upsert_offers(db, [offer(i, "edf-recrute") for i in range(3)] + [offer(i, "safran") for i in range(2)], "data")
+    db.commit()
+
+    # Lots de 2 lignes : une partition du curseur chevauche les deux sources
+    files = export_table(db, out_dir=str(tmp_path / "offers"), day=DAY, batch_size=2)
+    assert sorted(p.split("offers/")[1] for p in files) == [
+        "source=edf-recrute/date=2026-03-02/part-0.parquet",
+        "source=safran/date=2026-03-02/part-0.parquet",
+    ]
+    column = pq.ParquetFile(files[0]).metadata.row_group(0).column(2)   # company
+    assert "RLE_DICTIONARY" in str(column.encodings) or "PLAIN_DICTIONARY" in str(column.encodings)
+
+    table = read_export(str(tmp_path / "offers"), ["title", "contract_kind", "source"], source="safran")
+    assert table.column_names == ["title", "contract_kind", "source"]
+    assert sorted(table.column("title").to_pylist()) == ["Ingénieur 0", "Ingénieur 1"]
+    assert read_export(str(tmp_path / "offers"), ["id"], date="2026-03-02").num_rows == 5
+
+    # Un nouvel instantané du jour remplace le précédent
+    export_table(db, out_dir=str(tmp_path / "offers"), day=DAY)
+    assert read_export(str(tmp_path / "offers"), ["id"]).num_rows == 5
+
+
+def test_export_run_streams_batches(tmp_path):
+    offers = ((kw, JobOffer(f"Data {i}", "EDF", "Lyon", f"https://edf.fr/{kw}/{i}", "CDI", "", "", "edf"))
+              for kw in ("data", "chimie") for i in range(3))
+    path = export_run(offers, "edf", str(tmp_path), run_at=datetime.datetime(2026, 3, 2, 10, 15), batch_size=4)
+
+    assert path.endswith("source=edf/date=2026-03-02/run-20260302T101500.parquet")
+    assert pq.ParquetFile(path).metadata.num_row_groups == 2
+    table = read_export(str(tmp_path), ["keyword", "url"])
+    assert table.column("keyword").to_pylist() == ["data"] * 3 + ["chimie"] * 3
+    assert export_run(iter(()), "edf", str(tmp_path)) is None
+
+
+def test_run_exporter_writes_interleaved_sources_in_one_pass(tmp_path):
+    with RunExporter(str(tmp_path), run_at=datetime.datetime(2026, 3, 2, 10, 15), batch_size=2) as exporter:
+        for i in range(3):
+            for key in ("edf", "safran"):
+                exporter.write(key, "data", JobOffer(f"Data {i}", key, "Lyon", f"https://{key}.fr/{i}",
+                                                     "CDI", "", "", key))
+
+    assert sorted(exporter.files) == ["edf", "safran"]
+    assert exporter.files["safran"].endswith("source=safran/date=2026-03-02/run-20260302T101500.parquet")
+    assert pq.ParquetFile(exporter.files["edf"]).metadata.num_row_groups == 2
+    table = read_export(str(tmp_path), ["url"], source="safran")
+    assert table.column("url").to_pylist() == [f"https://safran.fr/{i}" for i in range(3)]
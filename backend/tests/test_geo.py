@@ -0,0 +1,103 @@
+import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, select
+
+from backend.database import SessionLocal
+from backend.geo import backfill_locations, bounding_box, haversine_km, resolve_location
+from backend.models import OFFER_GEO, JobOffer, JobOfferArchive
+from backend.persistence import bulk_upsert_offers
+from backend.retention import RetentionConfig, archive_chunk
+
+
+@pytest.fixture
+def offer(make_offer):
+    return lambda titre, lieu, url: make_offer(url, titre=titre, lieu=lieu)
+
+
+@pytest.mark.parametrize("location, expected", [
+    ("Etrez, France", "Étrez"),
+    ("69006 LYON", "Lyon"),
+    ("Rennes (35)", "Rennes"),
+    ("Toulouse Area", "Toulouse"),
+    ("Télétravail partiel à 92200 Neuilly-sur-Seine", "Neuilly-sur-Seine"),
+    ("BAgnols sur cèze", "Bagnols-sur-Cèze"),
+    ("St Etienne du Rouvray", "Saint-Étienne-du-Rouvray"),
+    ("12 rue de Paris, 69003 Lyon", "Lyon"),
+    ("2 rue Ampère 93200", "Seine-Saint-Denis"),
+    ("Hauts-de-Seine", "Hauts-de-Seine"),
+    ("Multi-sites", None),
+    ("Herstal, Belgique", None),
+    ("Strafford County, New Hampshire, États-Unis", None),
+    ("", None),
+])
+def test_resolve_location(location, expected):
+    place = resolve_location(location)
+    assert (place.name if place else None) == expected
+
+
+def test_homonyms_prefer_hint_then_metropole():
+    assert resolve_location("Saint-Denis").departement == "93"
+    assert resolve_location("97400 Saint-Denis").departement == "974"
+
+
+def test_bounding_box_contains_radius():
+    lyon = resolve_location("Lyon")
+    min_lat, max_lat, min_lon, max_lon = bounding_box(lyon.lat, lyon.lon, 50)
+    assert haversine_km(lyon.lat, lyon.lon, min_lat, lyon.lon) == pytest.approx(50, rel=1e-3)
+    assert haversine_km(lyon.lat, lyon.lon, lyon.lat, max_lon) == pytest.approx(50, rel=1e-2)
+    assert 390 < haversine_km(lyon.lat, lyon.lon, 48.857, 2.352) < 400   # Lyon → Paris
+
+
+def test_ingest_indexes_locations_and_retention_forgets_them(memory_db, offer):
+    db = memory_db
+    bulk_upsert_offers(db, [
+        offer("Ingénieur", "Villeurbanne, France", "https://edf.fr/geo/1"),
+        offer("Ingénieur", "Multi-sites", "https://edf.fr/geo/2"),
+    ], "geo")
+    db.commit()
+    located = db.scalars(select(OFFER_GEO.c.id)).all()
+    assert located == [db.scalar(select(JobOffer.id).where(JobOffer.location == "Villeurbanne, France"))]
+
+    db.execute(delete(OFFER_GEO))
+    db.commit()
+    assert backfill_locations(db) == 1
+    assert len(db.scalars(select(OFFER_GEO.c.id)).all()) == 1
+
+    db.query(JobOffer).update({"status": "CLOSED"})
+    db.commit()
+    archive_chunk(db, RetentionConfig(), datetime.datetime.utcnow())
+    assert db.scalars(select(OFFER_GEO.c.id)).all() == []
+    archived = db.query(JobOfferArchive).filter(JobOfferArchive.latitude.is_not(None)).one()
+    assert archived.location == "Villeurbanne, France"
+
+
+def test_api_radius_search(offer):
+    from backend.main import app
+
+    offers = [
+        offer("Geo Lyon", "69006 LYON", "https://edf.fr/geo-api/1"),
+        offer("Geo Vienne", "Vienne (38)", "https://edf.fr/geo-api/2"),          # ≈ 27 km
+        offer("Geo Grenoble", "Grenoble, France", "https://edf.fr/geo-api/3"),   # ≈ 95 km
+        offer("Geo Etranger", "Herstal, Belgique", "https://edf.fr/geo-api/4"),
+    ]
+    db = SessionLocal()
+    try:
+        bulk_upsert_offers(db, offers, "geo")
+        db.commit()
+        client = TestClient(app)
+
+        near = client.get("/api/jobs", params={"keyword": "Geo", "near": "Lyon", "radius_km": 50,
+                                               "sort": "distance"}).json()
+        assert [o["title"] for o in near] == ["Geo Lyon", "Geo Vienne"]
+        wide = client.get("/api/jobs", params={"keyword": "Geo", "near": "Lyon", "radius_km": 120}).json()
+        assert sorted(o["title"] for o in wide) == ["Geo Grenoble", "Geo Lyon", "Geo Vienne"]
+        # Lieu inconnu du gazetteer : filtre texte sur location
+        text = client.get("/api/jobs", params={"keyword": "Geo", "near": "Herstal"}).json()
+        assert [o["title"] for o in text] == ["Geo Etranger"]
+    finally:
+        db.query(JobOffer).delete()
+        db.execute(delete(OFFER_GEO))
+        db.commit()
+        db.close()
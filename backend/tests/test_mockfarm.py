@@ -0,0 +1,80 @@
+import http.client
+import json
+
+import pytest
+
+from backend.scrapers.companies import farm_url
+from backend.scrapers.mockfarm import SITES, Faults, MockFarm
+
+
+def _get(farm, host, path):
+    conn = http.client.HTTPConnection("127.0.0.1", farm.port, timeout=5)
+    try:
+        conn.request("GET", path, headers={"Host": host})
+        response = conn.getresponse()
+        return response.status, dict(response.getheaders()), response.read().decode("utf-8")
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def farm():
+    with MockFarm(port=0, offers_per_site=25) as farm:
+        yield farm
+
+
+def test_farm_url_points_each_site_at_its_subdomain():
+    url = "https://www.edf.fr/edf-recrute/rejoignez-nous/voir-les-offres/nos-offres"
+    assert farm_url("edf", url, farm="localhost:8765") == \
+        "http://edf.localhost:8765/edf-recrute/rejoignez-nous/voir-les-offres/nos-offres"
+    assert farm_url("edf", url, farm="") == url
+
+
+def test_farm_is_read_when_urls_are_built_not_at_import(monkeypatch):
+    from backend.scrapers import indeed, linkedin
+    from backend.scrapers.companies import COMPANIES_REGISTRY
+    from backend.scrapers.core import EDFScraper
+
+    monkeypatch.setenv("JOB_HUNTER_MOCK_FARM", "localhost:8765")
+    assert EDFScraper().build_url("data", 0).startswith("http://edf.localhost:8765/edf-recrute/")
+    assert indeed.build_search_url("data", "Paris").startswith("http://indeed.localhost:8765/jobs?")
+    assert linkedin.build_search_url("data", "Paris").startswith("http://linkedin.localhost:8765/jobs/search/?")
+    assert COMPANIES_REGISTRY["edf"]["career_url"].startswith("https://www.edf.fr/")
+
+    monkeypatch.delenv("JOB_HUNTER_MOCK_FARM")
+    assert EDFScraper().build_url("data", 0).startswith("https://www.edf.fr/")
+    assert indeed.build_search_url("data", "Paris").startswith("https://fr.indeed.com/jobs?")
+
+
+def test_farm_paginates_like_build_url(farm):
+    host = f"edf.{farm.address}"
+    status, _, first = _get(farm, host, "/edf-recrute/nos-offres?page=1&search[keyword]=data")
+    assert status == 200 and first.count('class="offer-link"') == 10
+    assert "mock-100000" in first and "— data" in first
+    _, _, third = _get(farm, host, "/edf-recrute/nos-offres?page=3")
+    assert third.count('class="offer-link"') == 5 and "mock-100024" in third   # 25 offres au total
+
+    # Sans sous-domaine : le site est le premier segment du chemin
+    _, _, indeed = _get(farm, f"127.0.0.1:{farm.port}", "/indeed/jobs?q=data&start=20")
+    assert indeed.count("job_seen_beacon") == 5
+    _, _, total = _get(farm, f"totalenergies.{farm.address}", "/fr_FR/careers/SearchJobs/data?jobOffset=20")
+    assert total.count("article--result") == 5 and "— data" in total
+
+
+def test_farm_injects_faults():
+    with MockFarm(port=0, faults=Faults(captcha_rate=1)) as farm:
+        status, headers, body = _get(farm, f"linkedin.{farm.address}", "/jobs/search/?keywords=data")
+        assert status == 403 and headers["cf-mitigated"] == "challenge" and "challenge-form" in body
+    with MockFarm(port=0, faults=Faults(error_rate=1, error_status=429)) as farm:
+        assert _get(farm, f"safran.{farm.address}", "/fr/offres")[0] == 429
+    with MockFarm(port=0, faults=Faults(consent=True)) as farm:
+        assert "CybotCookiebotDialog" in _get(farm, f"engie.{farm.address}", "/search/?q=data")[2]
+        _, _, stats = _get(farm, farm.address, "/_stats")
+        assert json.loads(stats) == {"engie": {"200": 1}}
+    with MockFarm(port=0, faults=Faults(reset_rate=1)) as farm:
+        with pytest.raises(http.client.RemoteDisconnected):
+            _get(farm, f"edf.{farm.address}", "/edf-recrute/nos-offres")
+
+
+def test_every_site_has_a_template():
+    assert set(SITES) == {"edf", "totalenergies", "safran", "airbus", "engie", "indeed", "linkedin"}
@@ -0,0 +1,31 @@
+from backend import orchestrator
+from backend.models import JobOffer
+
+
+def test_batch_scrape_dedupes_across_keywords_and_sources(monkeypatch, memory_db, make_offer):
+    db, offer = memory_db, make_offer
+    calls = []
+
+    def fake_runner(queries, max_pages, start_page=0):
+        calls.append(list(queries))
+        return {q: [offer("https://edf.fr/1"), offer(f"https://edf.fr/{q}")] for q in queries}
+
+    monkeypatch.setattr(orchestrator, "SOURCE_RUNNERS", {
+        "a": ("A", fake_runner),
+        "b": ("B", fake_runner),
+    })
+
+    total, by_keyword, sources = orchestrator.run_batch_scrape(db, ["data", "Data", " chimie "])
+
+    # Une seule session par source pour tout le lot (doublons de mots-clés retirés)
+    assert calls == [["data", "chimie"], ["data", "chimie"]]
+    assert total == 3
+    assert by_keyword == {"data": 2, "chimie": 2}
+    assert sources == ["A: 3", "B: 0"]
+    shared = db.query(JobOffer).filter(JobOffer.url == "https://edf.fr/1").one()
+    assert shared.original_search == "data | chimie"
+
+
+def test_merge_search():
+    assert orchestrator.merge_search(None, "data") == "data"
+    assert orchestrator.merge_search("data", "Data | chimie") == "data | chimie"
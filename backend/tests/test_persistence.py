@@ -0,0 +1,125 @@
+import time
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from backend.models import JobOffer
+from backend.persistence import OfferWriter, backfill_url_hashes, bulk_upsert_offers
+
+
+@pytest.fixture
+def offer(make_offer):
+    return lambda i: make_offer(f"https://safran.com/{i}", titre=f"Offre {i}", entreprise="Safran",
+                                lieu="Bordeaux", source="safran-group")
+
+
+def test_bulk_upsert_counts_and_merges_keywords(memory_db, offer):
+    db = memory_db
+
+    first = bulk_upsert_offers(db, [offer(i) for i in range(3000)], "data")
+    db.commit()
+    assert (first.inserted, first.updated) == (3000, 0)
+
+    second = bulk_upsert_offers(db, [offer(i) for i in range(2990, 3010)], "chimie")
+    db.commit()
+    assert (second.inserted, second.updated) == (10, 10)
+    assert second.inserted_urls == {f"https://safran.com/{i}" for i in range(3000, 3010)}
+
+    assert db.query(JobOffer).count() == 3010
+    merged = db.query(JobOffer).filter(JobOffer.url == "https://safran.com/2995").one()
+    assert merged.original_search == "data | chimie"
+    assert merged.status == "NEW"
+
+
+def test_offer_writer_commits_in_batches(memory_sessions, offer):
+    Session = memory_sessions
+
+    reports = []
+    with OfferWriter(Session, batch_size=4, on_batch=reports.append) as writer:
+        for i in range(10):
+            writer.add(offer(i), "data", tag="safran")
+        writer.add(offer(0), "chimie", tag="safran")
+        # Les lots pleins sont déjà en base avant la fin du flux
+        assert Session().query(JobOffer).count() == 8
+
+    assert [r.size for r in reports] == [4, 4, 3]
+    assert writer.inserted == 10 and writer.updated == 1
+    assert writer.inserted_by_tag == {"safran": 10}
+    assert writer.inserted_by_keyword == {"data": 10}
+
+
+def test_offer_writer_flushes_stale_batch_when_idle(memory_sessions, offer):
+    Session = memory_sessions
+
+    writer = OfferWriter(Session, batch_size=200, max_interval_s=0.05, on_batch=None)
+    assert writer.time_until_flush() is None
+    writer.add(offer(1), "data")
+    assert writer.flush_if_due() is None and 0 < writer.time_until_flush() <= 0.05
+    time.sleep(0.06)
+    assert writer.time_until_flush() == 0.0
+    assert writer.flush_if_due().size == 1
+    assert Session().query(JobOffer).count() == 1
+
+
+def test_offer_writer_keeps_a_failed_batch_for_retry(memory_sessions, offer):
+    locked = [OperationalError("COMMIT", {}, Exception("database is locked"))]
+
+    def flaky_session():
+        db = memory_sessions()
+        if locked:
+            error = locked.pop()
+
+            def commit():
+                raise error
+            db.commit = commit
+        return db
+
+    writer = OfferWriter(flaky_session, batch_size=2, on_batch=None, retry_delay_s=0.05)
+    writer.add(offer(1), "data")
+    with pytest.raises(OperationalError):
+        writer.add(offer(2), "data")
+    assert len(writer.pending) == 2 and writer.failures == 1
+
+    # Pas de nouvel essai avant la fin du backoff, même lot plein
+    writer.add(offer(3), "data")
+    assert len(writer.pending) == 3 and 0 < writer.time_until_flush() <= 0.05
+    time.sleep(0.06)
+    assert writer.flush_if_due().size == 3
+    assert (writer.batches, writer.failures, writer.inserted) == (1, 0, 3)
+    assert memory_sessions().query(JobOffer).count() == 3
+
+
+def test_url_variants_dedupe_on_canonical_hash(memory_db, make_offer):
+    db = memory_db
+    variants = [
+        make_offer(f"https://ag.wd3.myworkdayjobs.com/fr-FR/Airbus/job/Data_JR1?q={q}", titre="Data",
+                   entreprise="Airbus", lieu="", contrat="", source="airbus-workday")
+        for q in ("data", "cloud")
+    ]
+    first = bulk_upsert_offers(db, variants[:1], "data")
+    second = bulk_upsert_offers(db, variants[1:], "cloud")
+    db.commit()
+
+    assert (first.inserted, second.inserted, second.updated) == (1, 0, 1)
+    stored = db.query(JobOffer).one()
+    assert stored.url == "https://ag.wd3.myworkdayjobs.com/fr-FR/Airbus/job/Data_JR1"
+    assert stored.original_search == "data | cloud"
+
+
+def test_backfill_url_hashes_merges_legacy_duplicates(memory_db):
+    db = memory_db
+    table = JobOffer.__table__
+    db.execute(table.insert(), [
+        {"title": "A", "url": "https://fr.indeed.com/rc/clk?jk=1&tk=a", "url_hash": None, "original_search": "data"},
+        {"title": "A", "url": "https://fr.indeed.com/rc/clk?jk=1&tk=b", "url_hash": None, "original_search": "cloud"},
+        {"title": "B", "url": "https://fr.indeed.com/rc/clk?jk=2", "url_hash": None, "original_search": "data"},
+    ])
+    db.commit()
+
+    assert backfill_url_hashes(db) == 3
+    rows = db.query(JobOffer).order_by(JobOffer.id).all()
+    assert [(r.url, r.original_search) for r in rows] == [
+        ("https://fr.indeed.com/viewjob?jk=1", "data | cloud"),
+        ("https://fr.indeed.com/viewjob?jk=2", "data"),
+    ]
+    assert backfill_url_hashes(db) == 0
@@ -0,0 +1,38 @@
+import dataclasses
+
+import pytest
+
+from backend.scrapers.records import JobOffer, scrape_batch
+
+
+def make(i, **overrides):
+    fields = dict(titre=f"Ingénieur {i}", entreprise="".join(["E", "DF"]), lieu="".join(["Lyon, ", "France"]),
+                  url=f"https://edf.fr/{i}", contrat="".join(["C", "DI"]), date_publication="",
+                  description_courte="", source="".join(["edf", "-recrute"]))
+    return JobOffer(**{**fields, **overrides})
+
+
+def test_offer_is_slotted_and_frozen():
+    offer = make(1)
+    assert not hasattr(offer, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        offer.titre = "autre"
+    assert dataclasses.asdict(offer)["entreprise"] == "EDF"
+
+
+def test_repeated_fields_are_interned():
+    a, b = make(1), make(2)
+    for name in ("entreprise", "lieu", "contrat", "source"):
+        assert getattr(a, name) is getattr(b, name)
+    assert a.titre is not b.titre
+
+
+def test_batch_shares_one_timestamp():
+    with scrape_batch() as stamp:
+        offers = [make(i) for i in range(3)]
+        with scrape_batch() as inner:   # Lot imbriqué : même horodatage
+            offers.append(make(3))
+    assert inner == stamp
+    assert all(o.date_scraping is stamp for o in offers)
+    assert make(4, date_scraping="2026-01-01T00:00:00").date_scraping == "2026-01-01T00:00:00"
+
@@ -0,0 +1,96 @@
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.scrapers.resilience import (
+    BackoffPolicy, BlockKind, CircuitBreaker, HostRateLimiter, PageState, classify_block, detect_page_state,
+)
+
+
+def test_backoff_grows_and_is_capped():
+    policy = BackoffPolicy(base_delay=1, factor=2, max_delay=5, jitter=0)
+    assert [policy.delay(i) for i in range(4)] == [1, 2, 4, 5]
+
+
+def test_classify_block():
+    assert classify_block("<div class='g-recaptcha'></div>") is BlockKind.CAPTCHA
+    assert classify_block('<form class="authwall-join-form"></form>') is BlockKind.AUTHWALL
+    assert classify_block("<title>Access Denied</title>") is BlockKind.BLOCKED
+    assert classify_block("<ul><li>Ingénieur</li></ul>") is BlockKind.NONE
+
+
+def test_classify_block_ignores_ordinary_markup_on_empty_results():
+    # Page de résultats vide : script reCAPTCHA du pied de page, lien de connexion, JS quelconque
+    html = (
+        "<html><head><title>0 offre | EDF Recrute</title></head><body><p>Aucune offre</p>"
+        "<a href='/authwall?trk=public_jobs_nav-header-signin'>S'identifier</a>"
+        "<script src='https://www.google.com/recaptcha/api.js'></script>"
+        "<script>if (cookiesBlocked) { console.log('blocked'); }</script></body></html>"
+    )
+    assert classify_block(html) is BlockKind.NONE
+
+
+def test_classify_block_on_captured_pages():
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    def classify(name):
+        with open(os.path.join(root, name), encoding="utf-8") as f:
+            return classify_block(f.read())
+
+    # Page de connexion Indeed (son JSON contient "showPasswordCaptcha")
+    assert classify("debug_indeed_page_2.html") is BlockKind.AUTHWALL
+    assert classify("debug_safran_page_2.html") is BlockKind.NONE
+    assert classify("debug_edf_page_1.html") is BlockKind.NONE
+
+
+def test_circuit_breaker_opens_after_threshold():
+    breaker = CircuitBreaker("edf", failure_threshold=2, cooldown_s=60)
+    breaker.record_failure("captcha")
+    assert breaker.allow()
+    breaker.record_failure("captcha")
+    assert breaker.state == "open" and not breaker.allow()
+
+    breaker.cooldown_s = 0
+    assert breaker.state == "half-open" and breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_host_rate_limiter_spaces_loads_per_host_across_threads():
+    limiter = HostRateLimiter(min_interval_s=0.1)
+    waits = []
+    threads = [threading.Thread(target=lambda: waits.append(limiter.wait("https://www.edf.fr/page")))
+               for _ in range(3)]
+    started = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert time.monotonic() - started >= 0.2   # 3 chargements sur le même hôte : 0, 0.1, 0.2 s
+    assert max(waits) == pytest.approx(0.2, abs=0.05)
+    assert limiter.wait("https://www.safran-group.com/") == 0   # Autre hôte : pas d'attente
+
+
+def _page(url="https://fr.linkedin.com/jobs/search?keywords=data", title="", **found):
+    """Page factice : page.evaluate renvoie directement le résultat de la sonde."""
+    return SimpleNamespace(url=url, evaluate=lambda js, selectors: {"title": title, "found": found})
+
+
+def test_detect_page_state_from_response_and_url():
+    challenge = SimpleNamespace(status=403, headers={"CF-Mitigated": "challenge"})
+    assert detect_page_state(_page(), challenge) is PageState.CAPTCHA
+    assert detect_page_state(_page(), SimpleNamespace(status=999, headers={})) is PageState.WAF
+    assert detect_page_state(_page("https://www.linkedin.com/authwall?trk=x")) is PageState.AUTHWALL
+
+
+def test_detect_page_state_from_title_and_markers():
+    assert detect_page_state(_page(title="Just a moment...")) is PageState.CAPTCHA
+    assert detect_page_state(_page(title="Access Denied")) is PageState.WAF
+    assert detect_page_state(_page(consent=True)) is PageState.CONSENT
+    assert not PageState.CONSENT.blocking
+    # Une page d'offres normale avec un bouton "S'identifier" n'est pas un authwall
+    ok = _page(title="Offres d'emploi Data - France | LinkedIn")
+    assert detect_page_state(ok, SimpleNamespace(status=200, headers={})) is PageState.OK
@@ -0,0 +1,87 @@
+import datetime
+
+from fastapi.testclient import TestClient
+from backend.database import SessionLocal
+from backend import workflow
+from backend.models import JobOffer, JobOfferArchive
+from backend.persistence import bulk_upsert_offers
+from backend.retention import RetentionConfig, archive_expired, count_expired
+
+NOW = datetime.datetime(2026, 3, 1)
+
+
+def seed(db, prefix="o"):
+    old = NOW - datetime.timedelta(days=45)
+    db.add_all([
+        JobOffer(title="Récente", url=f"https://x.com/{prefix}1", last_seen_at=NOW),
+        JobOffer(title="Ancienne", url=f"https://x.com/{prefix}2", last_seen_at=old),
+        JobOffer(title="Ancienne suivie", url=f"https://x.com/{prefix}3", last_seen_at=old, status="APPLIED"),
+        JobOffer(title="Refusée", url=f"https://x.com/{prefix}4", last_seen_at=NOW, status="REJECTED"),
+        JobOffer(title="Sans last_seen", url=f"https://x.com/{prefix}5", last_seen_at=None, created_at=old),
+    ])
+    db.commit()
+    # Lignes antérieures à la colonne last_seen_at
+    db.query(JobOffer).filter(JobOffer.title == "Sans last_seen").update({"last_seen_at": None})
+    db.commit()
+
+
+def test_archive_moves_expired_offers_in_chunks(memory_sessions, memory_db):
+    Session, db = memory_sessions, memory_db
+    seed(db)
+
+    config = RetentionConfig(max_age_days=30, chunk_size=2, pause_s=0)
+    assert count_expired(db, config, NOW) == 3
+    assert archive_expired(Session, config, now=NOW) == 3
+
+    assert {o.title for o in db.query(JobOffer)} == {"Récente", "Ancienne suivie"}
+    archived = db.query(JobOfferArchive).all()
+    assert {o.title for o in archived} == {"Ancienne", "Refusée", "Sans last_seen"}
+    assert all(o.archived_at == NOW for o in archived)
+
+    # Une offre réapparue puis ré-expirée remplace son ancienne version archivée
+    db.add(JobOffer(title="Ancienne v2", url="https://x.com/o2", last_seen_at=NOW - datetime.timedelta(days=40)))
+    db.commit()
+    assert archive_expired(Session, config, now=NOW) == 1
+    assert db.query(JobOfferArchive).filter(JobOfferArchive.url == "https://x.com/o2").one().title == "Ancienne v2"
+
+
+def test_rescraped_archived_offers_keep_their_status(memory_sessions, memory_db, make_offer):
+    db = memory_db
+    offers = [make_offer(f"https://edf.fr/archive/{i}", titre=f"Archive {i}") for i in range(3)]
+    bulk_upsert_offers(db, offers, "data")
+    db.commit()
+    rejected, expired, kept = [o.id for o in db.query(JobOffer).order_by(JobOffer.id)]
+    workflow.transition(db, [rejected], workflow.REJECTED, now=NOW)
+    db.query(JobOffer).filter(JobOffer.id == expired).update({"last_seen_at": NOW - datetime.timedelta(days=45)})
+    db.commit()
+    assert archive_expired(memory_sessions, RetentionConfig(max_age_days=30, pause_s=0), now=NOW) == 2
+
+    result = bulk_upsert_offers(db, offers, "chimie")
+    db.commit()
+    assert (result.inserted, result.updated, result.restored, result.skipped) == (0, 2, 1, 1)
+    # Le rejet reste dans l'archive ; l'offre expirée revient avec son id et son statut
+    assert db.query(JobOfferArchive).one().status == "REJECTED"
+    hot = {o.id: o for o in db.query(JobOffer)}
+    assert sorted(hot) == [expired, kept]
+    assert (hot[expired].status, hot[expired].original_search) == ("NEW", "data | chimie")
+    assert hot[expired].duplicate_cluster_id == expired
+
+
+def test_api_includes_archive_on_demand():
+    from backend.main import app
+
+    db = SessionLocal()
+    try:
+        seed(db, prefix="api")
+        archive_expired(SessionLocal, RetentionConfig(max_age_days=30, pause_s=0), now=NOW)
+
+        client = TestClient(app)
+        hot = client.get("/api/jobs", params={"keyword": "Ancienne"}).json()
+        assert [o["title"] for o in hot] == ["Ancienne suivie"]
+        both = client.get("/api/jobs", params={"keyword": "Ancienne", "include_archived": True}).json()
+        assert [o["title"] for o in both] == ["Ancienne suivie", "Ancienne"]
+    finally:
+        db.query(JobOffer).delete()
+        db.query(JobOfferArchive).delete()
+        db.commit()
+        db.close()
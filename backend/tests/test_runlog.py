@@ -0,0 +1,55 @@
+import gzip
+
+from backend.runlog import RunLog, list_runs, log_files, read_offers, read_records
+from backend.scrapers.records import JobOffer
+
+
+def offer(i):
+    return JobOffer(f"Data {i}", "EDF", "Lyon", f"https://edf.fr/{i}", "CDI", "", "", "edf")
+
+
+def test_runs_append_as_gzip_members_and_stream_back(tmp_path):
+    log = RunLog(str(tmp_path))
+    with log.run("edf", ["data", "chimie"], pages=2) as run:
+        run.write("data", offer(1))
+        run.write("chimie", offer(2))
+    with log.run("safran", ["data"]) as run:
+        run.write("data", offer(3))
+
+    assert log_files(str(tmp_path)) == [str(tmp_path / "runs.jsonl.gz")]
+    with gzip.open(tmp_path / "runs.jsonl.gz", "rt", encoding="utf-8") as f:
+        assert [line.split('"type":"')[1].split('"')[0] for line in f] == ["run", "offer", "offer", "end", "run", "offer", "end"]
+
+    offers = list(read_offers(str(tmp_path), source="edf"))
+    assert [(o["keyword"], o["url"]) for o in offers] == [("data", "https://edf.fr/1"), ("chimie", "https://edf.fr/2")]
+    runs = list_runs(str(tmp_path))
+    assert [(r["source"], r["offers"], r["pages"] if "pages" in r else None) for r in runs] == [
+        ("edf", 2, 2), ("safran", 1, None)]
+
+
+def test_rotation_and_truncated_member(tmp_path):
+    log = RunLog(str(tmp_path), max_bytes=1)
+    with log.run("edf", ["data"]) as run:
+        run.write("data", offer(1))
+    with log.run("edf", ["data"]) as run:   # Le journal dépasse max_bytes : rotation
+        run.write("data", offer(2))
+    assert len(log_files(str(tmp_path))) == 2
+
+    # Lancement coupé net : membre gzip sans fin de flux en fin de journal
+    run = log.run("edf", ["data"])
+    run.write("data", offer(3))
+    run._stream.flush()
+    run._stream.fileobj.close()
+
+    interrupted = run.run_id
+
+    # Le lancement suivant repart d'un nouveau fichier (log.max_bytes remis haut)
+    log.max_bytes = 10 ** 9
+    with log.run("edf", ["data"]) as run:
+        run.write("data", offer(4))
+    assert len(log_files(str(tmp_path))) == 4
+
+    urls = [o["url"] for o in read_offers(str(tmp_path))]
+    assert urls == ["https://edf.fr/1", "https://edf.fr/2", "https://edf.fr/3", "https://edf.fr/4"]
+    assert [r["offers"] for r in list_runs(str(tmp_path))] == [1, 1, None, 1]
+    assert all(r["type"] != "end" for r in read_records(str(tmp_path), run_id=interrupted))
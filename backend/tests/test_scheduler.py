@@ -0,0 +1,38 @@
+import datetime
+
+from backend.models import ScrapeCache
+from backend.scheduler import RefreshScheduler, SchedulerConfig, in_window
+
+
+def test_in_window_wraps_midnight():
+    windows = [(22, 7)]
+    assert in_window(datetime.datetime(2026, 3, 1, 23), windows)
+    assert in_window(datetime.datetime(2026, 3, 1, 3), windows)
+    assert not in_window(datetime.datetime(2026, 3, 1, 12), windows)
+
+
+def test_run_once_prioritizes_and_respects_budget(memory_sessions):
+    Session = memory_sessions
+    now = datetime.datetime(2026, 3, 1, 23)
+
+    db = Session()
+    db.add_all([
+        ScrapeCache(keyword="data", source="all", offers_found=40, requests_count=5,
+                    last_scraped_at=now - datetime.timedelta(hours=30)),
+        ScrapeCache(keyword="chimie", source="all", offers_found=0, requests_count=0,
+                    last_scraped_at=now - datetime.timedelta(hours=30)),
+        ScrapeCache(keyword="frais", source="all", offers_found=10,
+                    last_scraped_at=now - datetime.timedelta(hours=1)),
+    ])
+    db.commit()
+    db.close()
+
+    calls = []
+    config = SchedulerConfig(max_pages=2, host_daily_budget=2)
+    scheduler = RefreshScheduler(config, session_factory=Session,
+                                 scrape=lambda db, kw, sources, max_pages: calls.append(kw))
+
+    # Budget : une seule passe de 2 pages par hôte aujourd'hui
+    assert scheduler.run_once(now=now) == ["data"]
+    assert calls == ["data"]
+    assert scheduler.run_once(now=datetime.datetime(2026, 3, 1, 12)) == []
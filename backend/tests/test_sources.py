@@ -0,0 +1,167 @@
+import asyncio
+import threading
+from importlib.metadata import EntryPoint
+from types import SimpleNamespace
+
+from backend import orchestrator, sources
+from backend.sources import SOURCES, LazyRunner, SourceSpec
+
+PLUGIN_SPEC = SourceSpec("welcome", "Welcome", "www.welcometothejungle.com", "tests.fake:Scraper")
+
+
+class FakeBoard:
+    calls = []
+
+    def scrape_many(self, keywords, max_pages=1, start_page=0):
+        FakeBoard.calls.append((list(keywords), max_pages, start_page))
+        return {kw: [] for kw in keywords}
+
+
+def test_job_boards_share_the_plugin_interface():
+    assert SOURCES["indeed"].target == "backend.scrapers.indeed:IndeedScraper"
+    assert SOURCES["linkedin"].target == "backend.scrapers.linkedin:LinkedInScraper"
+    for key in ("indeed", "linkedin", "edf"):
+        target = SOURCES[key].load()
+        assert isinstance(target, type) and callable(target.scrape_many)
+
+
+def test_lazy_runner_instantiates_class_targets(monkeypatch):
+    FakeBoard.calls = []
+    monkeypatch.setattr(sources, "_import_target", lambda target: FakeBoard)
+    runner = LazyRunner(SourceSpec("fake", "Fake", "", "x:FakeBoard"))
+    assert runner(["data"], 2, start_page=1) == {"data": []}
+    assert FakeBoard.calls == [(["data"], 2, 1)]
+
+
+def test_discover_sources_from_entry_points(monkeypatch):
+    eps = [
+        EntryPoint("welcome", "backend.tests.test_sources:PLUGIN_SPEC", sources.ENTRY_POINT_GROUP),
+        EntryPoint("board", "backend.tests.test_sources:FakeBoard", sources.ENTRY_POINT_GROUP),
+        EntryPoint("broken", "backend.tests.missing_module:Scraper", sources.ENTRY_POINT_GROUP),
+    ]
+    monkeypatch.setattr(sources, "entry_points", lambda group: [ep for ep in eps if ep.group == group])
+
+    found = sources.discover_sources()
+    assert found == [PLUGIN_SPEC, SourceSpec("board", "board", "", "backend.tests.test_sources:FakeBoard")]
+
+
+def test_lazy_registry_builds_once_on_first_access():
+    builds = []
+    registry = sources.LazyRegistry(lambda: builds.append(1) or {"a": 1, "b": 2})
+    assert not registry.built and builds == []
+    assert list(registry) == ["a", "b"] and registry["b"] == 2 and len(registry) == 2
+    assert registry.built and builds == [1]
+
+
+def test_batch_scrape_runs_sources_in_parallel(monkeypatch, memory_db, make_offer):
+    db = memory_db
+
+    # a et c ne franchissent la barrière qu'ensemble : si les sources tournaient
+    # l'une après l'autre, elle casserait et a finirait en erreur
+    overlap = threading.Barrier(2, timeout=5)
+
+    def runner(name, parallel=False, fail=False):
+        def run(queries, max_pages, start_page=0):
+            if parallel:
+                overlap.wait()
+            if fail:
+                raise RuntimeError("bloqué")
+            return {q: [make_offer(f"https://{name}.fr/{q}", entreprise=name, source=name)] for q in queries}
+        return run
+
+    monkeypatch.setattr(orchestrator, "SOURCE_RUNNERS", {
+        "a": ("A", runner("a", parallel=True)),
+        "b": ("B", runner("b")),
+        "c": ("C", runner("c", parallel=True, fail=True)),
+    })
+
+    runs = []
+    total, _, summary = orchestrator.run_batch_scrape(db, ["data"], max_workers=3, runs=runs)
+
+    assert total == 2
+    assert summary == ["A: 1", "B: 1", "C: erreur"]   # Ordre des sources conservé
+    assert [(r.key, r.offers, r.inserted, r.error) for r in runs] == [
+        ("a", 1, 1, ""), ("b", 1, 1, ""), ("c", 0, 0, "bloqué")]
+
+
+class StreamingRunner:
+    """Runner en flux : deux offres, puis une erreur en cours de lot."""
+
+    def __init__(self, fail_after=None):
+        self.fail_after = fail_after
+
+    def __call__(self, queries, max_pages, start_page=0):
+        raise AssertionError("le flux doit passer par iter()")
+
+    def iter(self, queries, max_pages, start_page=0):
+        for i, q in enumerate(queries):
+            if i == self.fail_after:
+                raise RuntimeError("page bloquée")
+            yield q, SimpleNamespace(titre="Data", entreprise="EDF", lieu="Lyon", url=f"https://edf.fr/s/{q}",
+                                     contrat="CDI", date_publication="", source="edf-recrute")
+
+
+def test_batch_scrape_streams_and_keeps_offers_before_a_failure(monkeypatch, memory_db):
+    db = memory_db
+    monkeypatch.setattr(orchestrator, "SOURCE_RUNNERS", {
+        "ok": ("OK", StreamingRunner()),
+        "ko": ("KO", StreamingRunner(fail_after=1)),
+    })
+
+    runs = []
+    total, by_keyword, summary = orchestrator.run_batch_scrape(db, ["data", "chimie"], runs=runs)
+
+    assert total == 2 and by_keyword == {"data": 1, "chimie": 1}
+    assert summary == ["OK: 2", "KO: erreur"]
+    assert [(r.offers, r.error) for r in runs] == [(2, ""), (1, "page bloquée")]
+
+
+def test_offer_deduper_streams_page_by_page():
+    from backend.scrapers.core import OfferDeduper
+
+    a, b = SimpleNamespace(url="https://edf.fr/1?utm_source=x"), SimpleNamespace(url="https://edf.fr/2")
+    dedupe = OfferDeduper()
+    assert list(dedupe.new([a, b])) == [a, b]
+    assert list(dedupe.new([SimpleNamespace(url="https://edf.fr/1")])) == []
+
+
+def test_lazy_runner_iter_falls_back_to_batch_results(monkeypatch):
+    monkeypatch.setattr(sources, "_import_target",
+                        lambda target: lambda queries, max_pages, start_page=0: {q: [q.upper()] for q in queries})
+    runner = LazyRunner(SourceSpec("fake", "Fake", "", "x:run"))
+    assert list(runner.iter(["a", "b"], 1)) == [("a", "A"), ("b", "B")]
+
+
+def test_aiter_in_thread_streams_and_closes_early():
+    from backend.scrapers.streaming import aiter_in_thread
+
+    closed = threading.Event()
+
+    def pages():
+        try:
+            for i in range(1000):
+                yield i
+        finally:
+            closed.set()
+
+    def failing():
+        yield 1
+        raise RuntimeError("timeout")
+
+    async def consume():
+        got = []
+        async for item in aiter_in_thread(pages, maxsize=4):
+            got.append(item)
+            if len(got) == 3:
+                break
+        errors = []
+        try:
+            async for item in aiter_in_thread(failing):
+                errors.append(item)
+        except RuntimeError as e:
+            errors.append(str(e))
+        return got, errors
+
+    got, errors = asyncio.run(consume())
+    assert got == [0, 1, 2] and closed.wait(1)
+    assert errors == [1, "timeout"]
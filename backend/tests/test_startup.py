@@ -0,0 +1,55 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from backend import orchestrator
+from backend.sources import SOURCES, LazyRunner
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import de backend.main + premier GET /api/jobs dans un process neuf (mesuré ≈ 0,8 s)
+COLD_START_BUDGET_S = 3.0
+
+PROBE = """
+import json, os, sys, time
+start = time.perf_counter()
+import backend.main
+imported = time.perf_counter() - start
+tables_after_import = os.path.exists(os.environ["DB_PATH"])
+
+from fastapi.testclient import TestClient
+with TestClient(backend.main.app) as client:
+    status = client.get("/api/jobs").status_code
+print(json.dumps({
+    "import_s": imported,
+    "total_s": time.perf_counter() - start,
+    "db_created_at_import": tables_after_import,
+    "status": status,
+    "loaded": [m for m in ("playwright", "playwright.sync_api", "backend.scrapers.core") if m in sys.modules],
+    "registry_built": sys.modules["backend.sources"].SOURCES.built,
+}))
+"""
+
+
+def test_read_only_api_cold_start_skips_scrapers():
+    db_path = os.path.join(tempfile.mkdtemp(prefix="job_hunter_cold_"), "cold.db")
+    env = {**os.environ, "JOB_HUNTER_DB_URL": f"sqlite:///{db_path}", "DB_PATH": db_path}
+    out = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    report = json.loads(out.strip().splitlines()[-1])
+
+    assert report["loaded"] == []
+    assert report["registry_built"] is False   # Entry points parcourus au premier accès seulement
+    assert report["db_created_at_import"] is False   # Le schéma est appliqué au démarrage, pas à l'import
+    assert report["status"] == 200
+    assert report["total_s"] < COLD_START_BUDGET_S
+
+
+def test_source_runners_resolve_lazily():
+    assert list(orchestrator.SOURCE_RUNNERS) == ["edf", "totalenergies", "safran", "airbus", "indeed", "linkedin"]
+    assert orchestrator.SOURCE_HOSTS["airbus"] == "ag.wd3.myworkdayjobs.com"
+    label, runner = orchestrator.SOURCE_RUNNERS["safran"]
+    assert label == "Safran" and isinstance(runner, LazyRunner)
+    assert SOURCES["safran"].target == "backend.scrapers.core:SafranScraper"
@@ -0,0 +1,80 @@
+import datetime
+
+from backend import task_queue
+from backend.models import ScrapeCache, ScrapeTask
+
+
+def test_enqueue_is_idempotent_and_claim_is_exclusive(memory_db):
+    db = memory_db
+    assert task_queue.enqueue(db, "data", ["edf", "indeed"], max_pages=2) == 4
+    assert task_queue.enqueue(db, "data", ["edf", "indeed"], max_pages=2) == 0
+
+    first = task_queue.claim(db, "w1")
+    second = task_queue.claim(db, "w2")
+    assert first.id != second.id
+    assert first.lease_owner == "w1" and first.attempts == 1
+    assert not task_queue.heartbeat(db, first.id, "w2")
+    assert task_queue.complete(db, first.id, "w1", offers_found=3)
+    assert task_queue.queue_stats(db) == {"DONE": 1, "LEASED": 1, "PENDING": 2}
+
+
+def test_failures_retry_then_dead_letter(memory_db):
+    db = memory_db
+    task_queue.enqueue(db, "data", ["edf"], max_pages=1, max_attempts=2)
+
+    task = task_queue.claim(db, "w1")
+    assert task_queue.fail(db, task, "w1", "Timeout") == "PENDING"
+    # Le retry est différé par le backoff
+    assert task_queue.claim(db, "w1") is None
+
+    db.query(ScrapeTask).update({"available_at": datetime.datetime.utcnow()})
+    db.commit()
+    task = task_queue.claim(db, "w1")
+    assert task.attempts == 2
+    assert task_queue.fail(db, task, "w1", "Timeout") == "DEAD"
+    assert task_queue.retry_dead(db) == 1
+
+
+def test_expired_lease_is_reclaimed(memory_db):
+    db = memory_db
+    task_queue.enqueue(db, "data", ["edf"], max_pages=1)
+    task = task_queue.claim(db, "w1", lease_s=-1)
+    reclaimed = task_queue.claim(db, "w2")
+    assert reclaimed.id == task.id and reclaimed.lease_owner == "w2"
+
+
+def test_worker_caches_the_keyword_total_once_every_page_is_done(memory_sessions, make_offer):
+    from backend.worker import Worker
+
+    def runner(queries, max_pages, start_page=0):
+        return {q: [make_offer(f"https://edf.fr/{start_page}/{i}") for i in range(start_page + 2)] for q in queries}
+
+    db = memory_sessions()
+    task_queue.enqueue(db, "data", ["edf"], max_pages=2)
+    worker = Worker("w1", session_factory=memory_sessions, runners={"edf": ("EDF", runner)})
+
+    assert worker.process_one()
+    assert db.query(ScrapeCache).count() == 0   # La page 2 est encore en file
+    assert worker.process_one()
+    cache = db.query(ScrapeCache).one()
+    assert (cache.keyword, cache.source, cache.offers_found) == ("data", "edf", 2 + 3)
+    assert task_queue.finished_round(db, "data", "edf", since=cache.last_scraped_at) is None
+
+
+def test_worker_does_not_complete_a_task_it_no_longer_holds(memory_sessions, make_offer):
+    from backend.worker import Worker
+
+    db = memory_sessions()
+    task_queue.enqueue(db, "data", ["edf"], max_pages=1)
+
+    def runner(queries, max_pages, start_page=0):
+        # Bail repris par un autre worker pendant le scraping
+        db.query(ScrapeTask).update({"lease_owner": "w2"})
+        db.commit()
+        return {q: [make_offer("https://edf.fr/1")] for q in queries}
+
+    assert Worker("w1", session_factory=memory_sessions, runners={"edf": ("EDF", runner)}).process_one()
+    task = db.query(ScrapeTask).one()
+    db.refresh(task)
+    assert (task.status, task.lease_owner) == ("LEASED", "w2")
+    assert db.query(ScrapeCache).count() == 0
@@ -0,0 +1,23 @@
+from backend.scrapers.urls import canonical_url, url_hash
+
+
+def test_canonical_url_rules_per_source():
+    assert canonical_url("https://fr.indeed.com/rc/clk?jk=abc123&from=vj&xkcb=SoD") == \
+        "https://fr.indeed.com/viewjob?jk=abc123"
+    assert canonical_url("https://fr.indeed.com/pagead/clk?mo=r&ad=TOK&xkcb=S&camk=C&p=10&vjs=3") == \
+        "https://fr.indeed.com/pagead/clk?ad=TOK&mo=r"
+    assert canonical_url("https://ag.wd3.myworkdayjobs.com/fr-FR/Airbus/job/Toulouse/Data_JR1?q=data") == \
+        "https://ag.wd3.myworkdayjobs.com/fr-FR/Airbus/job/Toulouse/Data_JR1"
+    assert canonical_url("https://jobs.totalenergies.com/fr_FR/careers/JobDetail/Buyer/77108?source=x") == \
+        "https://jobs.totalenergies.com/fr_FR/careers/JobDetail/Buyer/77108"
+    assert canonical_url("https://fr.linkedin.com/jobs/view/data-engineer-at-acme-4377815849?trk=x") == \
+        "https://www.linkedin.com/jobs/view/4377815849"
+    assert canonical_url("HTTPS://WWW.Safran-Group.com/fr/offres/a/?utm_source=x&id=2#top") == \
+        "https://www.safran-group.com/fr/offres/a?id=2"
+
+
+def test_url_hash_is_signed_64_bit_and_stable():
+    h = url_hash("https://fr.indeed.com/viewjob?jk=abc123")
+    assert h == url_hash("https://fr.indeed.com/rc/clk?jk=abc123&tk=1")
+    assert -2 ** 63 <= h < 2 ** 63
+    assert h != url_hash("https://fr.indeed.com/viewjob?jk=abc124")
@@ -0,0 +1,98 @@
+import datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from backend import workflow
+from backend.database import SessionLocal
+from backend.models import JobOffer, OfferStatusHistory
+from backend.persistence import bulk_upsert_offers
+from backend.retention import RetentionConfig, archive_chunk
+
+NOW = datetime.datetime(2026, 3, 1)
+
+
+def test_bulk_transition_checks_source_status_and_logs_history(memory_db):
+    db = memory_db
+    db.add_all([JobOffer(title=f"O{i}", url=f"https://x.com/{i}") for i in range(4)])
+    db.commit()
+    ids = [o.id for o in db.query(JobOffer).order_by(JobOffer.id)]
+
+    assert workflow.transition(db, ids[:3], workflow.SELECTED, now=NOW) == ids[:3]
+    # NEW → PREPARED n'est pas permis : seules les offres SELECTED avancent
+    assert workflow.transition(db, ids, workflow.PREPARED, now=NOW) == ids[:3]
+    assert workflow.transition(db, ids + [9999], workflow.REJECTED, now=NOW) == ids
+
+    entries = workflow.history(db, ids[0])
+    assert [(e.from_status, e.to_status) for e in entries] == [
+        ("NEW", "SELECTED"), ("SELECTED", "PREPARED"), ("PREPARED", "REJECTED"),
+    ]
+    assert db.query(OfferStatusHistory).count() == 3 * 3 + 1
+
+
+def test_archived_offer_ids_are_never_reused(memory_db, make_offer):
+    db = memory_db
+    bulk_upsert_offers(db, [make_offer("https://edf.fr/kanban/1")], "data")
+    db.commit()
+    rejected = db.query(JobOffer).one().id
+    workflow.transition(db, [rejected], workflow.REJECTED, now=NOW)
+    assert archive_chunk(db, RetentionConfig(), NOW) == 1
+
+    bulk_upsert_offers(db, [make_offer("https://edf.fr/kanban/2")], "data")
+    db.commit()
+    fresh = db.query(JobOffer).one().id
+    assert fresh > rejected
+    assert workflow.history(db, fresh) == []
+    assert [e.to_status for e in workflow.history(db, rejected)] == ["REJECTED"]
+
+
+def test_board_pages_columns_by_status_index(memory_db):
+    db = memory_db
+    db.add_all([JobOffer(title=f"O{i}", url=f"https://x.com/{i}",
+                         status="APPLIED" if i % 2 else "NEW") for i in range(7)])
+    db.commit()
+
+    columns = workflow.board(db, limit=2)
+    assert {s: c["count"] for s, c in columns.items()} == {
+        "NEW": 4, "SELECTED": 0, "PREPARED": 0, "APPLIED": 3, "REJECTED": 0, "CLOSED": 0,
+    }
+    first = columns["NEW"]["offers"]
+    assert [o.title for o in first] == ["O6", "O4"]
+    rest = workflow.column_page(db, "NEW", limit=2, before_id=columns["NEW"]["next_before_id"])
+    assert [o.title for o in rest] == ["O2", "O0"]
+
+    plan = " ".join(str(row) for row in db.execute(text(
+        "EXPLAIN QUERY PLAN SELECT id FROM job_offers WHERE status = 'NEW' AND id < 5 ORDER BY id DESC"
+    )))
+    assert "ix_job_offers_status_id" in plan
+
+
+def test_api_status_endpoints():
+    from backend.main import app
+
+    db = SessionLocal()
+    try:
+        db.add_all([JobOffer(title=f"Kanban {i}", url=f"https://x.com/kanban/{i}") for i in range(3)])
+        db.commit()
+        ids = [o.id for o in db.query(JobOffer).filter(JobOffer.title.like("Kanban%")).order_by(JobOffer.id)]
+        client = TestClient(app)
+
+        moved = client.post("/api/offers/status", json={"ids": ids[:2], "status": "selected"}).json()
+        assert moved == {"status": "success", "moved": ids[:2], "skipped": []}
+        skipped = client.post("/api/offers/status", json={"ids": ids, "status": "PREPARED"}).json()
+        assert skipped["skipped"] == ids[2:]
+        assert client.post("/api/offers/status", json={"ids": ids, "status": "HIRED"}).json()["status"] == "error"
+
+        board = client.get("/api/board", params={"limit": 1}).json()
+        assert board["PREPARED"]["count"] == 2
+        assert [o["id"] for o in board["PREPARED"]["offers"]] == [ids[1]]
+        page = client.get("/api/board/prepared", params={"before_id": board["PREPARED"]["next_before_id"]}).json()
+        assert [o["id"] for o in page["offers"]] == [ids[0]]
+
+        history = client.get(f"/api/offers/{ids[0]}/history").json()
+        assert [h["to_status"] for h in history] == ["SELECTED", "PREPARED"]
+    finally:
+        db.query(OfferStatusHistory).delete()
+        db.query(JobOffer).delete()
+        db.commit()
+        db.close()
@@ -0,0 +1,184 @@
+"""
+👷 Job Hunter OS — Worker de scraping
+=====================================
+Consomme la file durable (backend/task_queue.py) indépendamment du serveur
+API. Lancer autant de workers que voulu, sur cette machine ou sur d'autres
+partageant le fichier SQLite : chacun prend des tâches (keyword, source, page)
+sous bail et le prolonge par heartbeat pendant le scraping.
+
+Le profil SQLite par défaut (WAL) ne vaut que pour des processus sur l'hôte
+de la base. Avec des workers sur d'autres machines (fichier sur NFS/SMB), tous
+les processus, API comprise, doivent tourner avec JOB_HUNTER_SQLITE_PROFILE=shared.
+
+Usage:
+    python -m backend.worker                          # boucle continue
+    python -m backend.worker --sources edf,safran     # limiter aux sources données
+    python -m backend.worker --enqueue "data" --pages 2
+    python -m backend.worker --stats
+    python -m backend.worker --retry-dead
+"""
+
+import argparse
+import os
+import socket
+import threading
+import time
+
+from sqlalchemy import select
+
+from backend.database import SessionLocal, init_db
+from backend.models import ScrapeCache
+from backend.orchestrator import SOURCE_RUNNERS, update_cache
+from backend.persistence import bulk_upsert_offers
+from backend import task_queue
+
+
+class _Heartbeat:
+    """Prolonge le bail d'une tâche dans un thread pendant qu'elle s'exécute."""
+
+    def __init__(self, task_id: int, worker_id: str, lease_s: float, session_factory):
+        self.task_id = task_id
+        self.worker_id = worker_id
+        self.lease_s = lease_s
+        self.session_factory = session_factory
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        db = self.session_factory()
+        try:
+            while not self._stop.wait(self.lease_s / 3):
+                if not task_queue.heartbeat(db, self.task_id, self.worker_id, self.lease_s):
+                    self.lost = True
+                    return
+        finally:
+            db.close()
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+class Worker:
+    """Boucle claim → scrape → persist → complete/fail."""
+
+    def __init__(self, worker_id: str | None = None, sources: list[str] | None = None,
+                 lease_s: float = task_queue.LEASE_SECONDS, poll_s: float = 5,
+                 session_factory=SessionLocal, runners=SOURCE_RUNNERS):
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.sources = sources
+        self.lease_s = lease_s
+        self.poll_s = poll_s
+        self.session_factory = session_factory
+        self.runners = runners
+
+    def run_task(self, db, task) -> int:
+        """Scrape la page de la tâche et persiste les offres. Retourne le nombre de nouvelles."""
+        label, runner = self.runners[task.source]
+        print(f"\n👷 [{self.worker_id}] {label} — '{task.keyword}' page {task.page + 1} "
+              f"(tentative {task.attempts}/{task.max_attempts})")
+        results = runner([task.keyword], 1, start_page=task.page)[task.keyword]
+        count = bulk_upsert_offers(db, results, task.keyword).inserted
+        db.commit()
+        return count
+
+    def update_cache(self, db, task):
+        """
+        Met à jour le cache (keyword, source) quand sa dernière page est
+        terminée, avec le total de toutes ses pages (et non celui de la
+        dernière). Un autre worker qui termine une page en même temps trouve
+        le même total, ou rien de neuf depuis cette mise à jour.
+        """
+        previous = db.scalar(select(ScrapeCache.last_scraped_at).where(
+            ScrapeCache.keyword == task.keyword.lower(), ScrapeCache.source == task.source))
+        finished = task_queue.finished_round(db, task.keyword, task.source, since=previous)
+        if finished:
+            total, scraped_at = finished
+            update_cache(db, task.keyword, task.source, total, scraped_at)
+            db.commit()
+
+    def process_one(self) -> bool:
+        """Traite une tâche. Retourne False si la file est vide."""
+        db = self.session_factory()
+        try:
+            task = task_queue.claim(db, self.worker_id, self.sources, self.lease_s)
+            if task is None:
+                return False
+            try:
+                with _Heartbeat(task.id, self.worker_id, self.lease_s, self.session_factory) as hb:
+                    count = self.run_task(db, task)
+            except Exception as e:
+                db.rollback()
+                status = task_queue.fail(db, task, self.worker_id, f"{type(e).__name__}: {e}")
+                print(f"  ❌ Tâche {task.id} en échec ({e}) → {status}")
+                return True
+
+            if hb.lost or not task_queue.complete(db, task.id, self.worker_id, count):
+                # Les offres sont enregistrées, mais la tâche appartient désormais à un autre worker
+                print(f"  ⚠️  Bail perdu pour la tâche {task.id} (reprise par un autre worker) : "
+                      f"{count} nouvelles offres enregistrées, tâche non terminée ici")
+                return True
+            print(f"  ✅ Tâche {task.id} terminée : {count} nouvelles offres")
+            self.update_cache(db, task)
+            return True
+        finally:
+            db.close()
+
+    def run(self, max_tasks: int | None = None, once: bool = False):
+        """Traite les tâches jusqu'à épuisement (once) ou indéfiniment."""
+        done = 0
+        while max_tasks is None or done < max_tasks:
+            if self.process_one():
+                done += 1
+                continue
+            if once:
+                break
+            time.sleep(self.poll_s)
+        return done
+
+
+# ─── Point d'entrée ──────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="👷 Worker de scraping Job Hunter OS")
+    parser.add_argument("--sources", default="",
+                        help=f"Sources traitées, séparées par des virgules ({', '.join(SOURCE_RUNNERS)})")
+    parser.add_argument("--once", action="store_true", help="Vider la file puis sortir")
+    parser.add_argument("--max-tasks", type=int, default=None, help="Nombre maximal de tâches")
+    parser.add_argument("--enqueue", metavar="KEYWORD", help="Ajouter les tâches d'un mot-clé")
+    parser.add_argument("--pages", type=int, default=2, help="Pages par source pour --enqueue")
+    parser.add_argument("--stats", action="store_true", help="Afficher l'état de la file")
+    parser.add_argument("--retry-dead", action="store_true", help="Remettre les dead-letters en file")
+    args = parser.parse_args()
+
+    init_db()
+    sources = [s.strip() for s in args.sources.split(",") if s.strip()] or None
+
+    if args.enqueue or args.stats or args.retry_dead:
+        db = SessionLocal()
+        try:
+            if args.enqueue:
+                created = task_queue.enqueue(db, args.enqueue, sources or list(SOURCE_RUNNERS), args.pages)
+                print(f"📥 {created} tâches ajoutées pour '{args.enqueue}'")
+            if args.retry_dead:
+                print(f"♻️  {task_queue.retry_dead(db)} tâches remises en file")
+            if args.stats:
+                for status, count in sorted(task_queue.queue_stats(db).items()):
+                    print(f"  {status:8s} {count}")
+        finally:
+            db.close()
+        return
+
+    worker = Worker(sources=sources)
+    print(f"👷 Worker {worker.worker_id} démarré (sources : {', '.join(sources or SOURCE_RUNNERS)})")
+    done = worker.run(max_tasks=args.max_tasks, once=args.once)
+    print(f"\n✅ {done} tâche(s) traitée(s)")
+
+
+if __name__ == "__main__":
+    main()
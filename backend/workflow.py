@@ -0,0 +1,149 @@
+"""
+🗂️ Job Hunter OS — Cycle de vie des candidatures (Kanban)
+=========================================================
+Chaque offre avance dans les colonnes du Kanban :
+
+    NEW ──▶ SELECTED ──▶ PREPARED ──▶ APPLIED ──▶ CLOSED
+     ▲         │            │            │
+     └─────────┴────────────┴────────────┴──▶ REJECTED
+
+SELECTED : cochée à l'étape de sourcing ; PREPARED : "Candidature préparée"
+(documents générés et téléchargés) ; un retour en arrière d'une colonne est
+permis. REJECTED et CLOSED sont terminaux pour la rétention (backend/retention.py),
+SELECTED, PREPARED et APPLIED ne sont jamais archivées pour simple ancienneté.
+
+Une transition porte sur une liste d'offres et tient en deux requêtes,
+quelle que soit la taille de la liste : un INSERT … SELECT dans le journal
+offer_status_history (ajout seul) puis un seul UPDATE … RETURNING. Les offres
+dont le statut courant n'autorise pas la transition sont ignorées.
+
+Le tableau lit chaque colonne par l'index composite (status, id) :
+count par statut et pages "WHERE status = ? AND id < ? ORDER BY id DESC".
+"""
+
+import datetime
+
+from sqlalchemy import func, insert, literal, select, update
+from sqlalchemy.orm import Session
+
+from backend.models import JobOffer, OfferStatusHistory
+
+NEW, SELECTED, PREPARED, APPLIED = "NEW", "SELECTED", "PREPARED", "APPLIED"
+REJECTED, CLOSED = "REJECTED", "CLOSED"
+
+STATUSES = (NEW, SELECTED, PREPARED, APPLIED, REJECTED, CLOSED)   # Ordre des colonnes
+TERMINAL_STATUSES = (REJECTED, CLOSED)
+TRACKED_STATUSES = (SELECTED, PREPARED, APPLIED)
+
+# Statuts de départ autorisés pour chaque statut d'arrivée
+ALLOWED_FROM = {
+    NEW: (SELECTED, REJECTED),
+    SELECTED: (NEW, PREPARED),
+    PREPARED: (SELECTED, APPLIED),
+    APPLIED: (PREPARED,),
+    REJECTED: (NEW, SELECTED, PREPARED, APPLIED),
+    CLOSED: (APPLIED, REJECTED),
+}
+
+BOARD_PAGE_SIZE = 50
+CHUNK = 500   # Taille des IN (...) (limite de paramètres SQLite)
+
+
+class InvalidStatus(ValueError):
+    pass
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.utcnow()
+
+
+# ─── Transitions ──────────────────────────────────────────────────────────────
+
+def transition(db: Session, offer_ids: list[int], to_status: str, now: datetime.datetime | None = None) -> list[int]:
+    """
+    Passe les offres `offer_ids` au statut `to_status` et journalise chaque
+    changement. Commit.
+
+    Returns:
+        Les id effectivement déplacés (les autres n'existent pas, sont déjà
+        dans ce statut ou n'y mènent pas)
+    """
+    if to_status not in ALLOWED_FROM:
+        raise InvalidStatus(f"Statut inconnu : {to_status}")
+    now = now or _now()
+    ids = sorted(set(offer_ids))
+    moved = []
+    try:
+        for i in range(0, len(ids), CHUNK):
+            movable = (
+                JobOffer.id.in_(ids[i:i + CHUNK]),
+                func.coalesce(JobOffer.status, NEW).in_(ALLOWED_FROM[to_status]),
+            )
+            db.execute(
+                insert(OfferStatusHistory).from_select(
+                    ["offer_id", "from_status", "to_status", "changed_at"],
+                    select(JobOffer.id, JobOffer.status, literal(to_status), literal(now)).where(*movable),
+                )
+            )
+            moved += db.scalars(
+                update(JobOffer).where(*movable).values(status=to_status)
+                .returning(JobOffer.id)
+                .execution_options(synchronize_session=False)
+            ).all()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return sorted(moved)
+
+
+def history(db: Session, offer_id: int) -> list[OfferStatusHistory]:
+    return db.scalars(
+        select(OfferStatusHistory).where(OfferStatusHistory.offer_id == offer_id)
+        .order_by(OfferStatusHistory.changed_at, OfferStatusHistory.id)
+    ).all()
+
+
+# ─── Tableau ──────────────────────────────────────────────────────────────────
+
+def status_counts(db: Session) -> dict[str, int]:
+    """Nombre d'offres par statut (parcours de l'index (status, id) seul)."""
+    counts = dict.fromkeys(STATUSES, 0)
+    for status, count in db.execute(select(JobOffer.status, func.count()).group_by(JobOffer.status)):
+        counts[status or NEW] = counts.get(status or NEW, 0) + count
+    return counts
+
+
+def column_page(db: Session, status: str, limit: int = BOARD_PAGE_SIZE,
+                before_id: int | None = None) -> list[JobOffer]:
+    """Une page d'une colonne, des plus récentes aux plus anciennes (pagination par id)."""
+    if status not in ALLOWED_FROM:
+        raise InvalidStatus(f"Statut inconnu : {status}")
+    query = select(JobOffer).where(JobOffer.status == status)
+    if before_id is not None:
+        query = query.where(JobOffer.id < before_id)
+    return db.scalars(query.order_by(JobOffer.id.desc()).limit(limit)).all()
+
+
+def board(db: Session, limit: int = BOARD_PAGE_SIZE, statuses: tuple[str, ...] = STATUSES) -> dict:
+    """Première page de chaque colonne, avec le total et le curseur de la page suivante."""
+    counts = status_counts(db)
+    columns = {}
+    for status in statuses:
+        offers = column_page(db, status, limit)
+        columns[status] = {
+            "count": counts.get(status, 0),
+            "offers": offers,
+            "next_before_id": offers[-1].id if len(offers) == limit else None,
+        }
+    return columns
+
+
+def backfill_statuses(db: Session) -> int:
+    """Migration : les lignes sans statut passent à NEW (elles apparaissent dans le Kanban)."""
+    result = db.execute(
+        update(JobOffer).where(JobOffer.status.is_(None)).values(status=NEW)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
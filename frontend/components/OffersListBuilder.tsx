@@ -204,6 +204,8 @@ export function OffersListBuilder({ onGenerate }: { onGenerate?: (offers: any[])
                                     <option value="CDD">CDD</option>
                                     <option value="Alternance">Alternance</option>
                                     <option value="Stage">Stage</option>
+                                    <option value="VIE">VIE</option>
+                                    <option value="Intérim">Intérim</option>
                                     <option value="Freelance">Freelance</option>
                                 </select>
                             </div>